@@ -0,0 +1,125 @@
+import os
+import sys
+import argparse
+import tempfile
+
+# Les mesures n'ouvrent jamais de vraie fenêtre
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+DEFAULT_OUTPUT = os.path.join("output", "benchmarks", "latest.json")
+DEFAULT_STRESS_OUTPUT = os.path.join("output", "benchmarks", "stress.json")
+
+
+def run_benchmarks(args) -> dict:
+    from benchmarks.suite import run_suite
+
+    with tempfile.TemporaryDirectory(prefix="nostradaballs-bench-") as directory:
+        return run_suite(directory, only=args.only, scale=args.scale, verbose=args.verbose)
+
+
+def run(args):
+    from benchmarks.baseline import save_report
+
+    report = run_benchmarks(args)
+    save_report(report, args.output)
+    print(f"Résultats écrits dans {args.output}")
+    return 0
+
+
+def compare(args):
+    from benchmarks.baseline import (
+        STATUS_REGRESSION, compare_reports, environment_differences, format_comparison, load_report, save_report
+    )
+
+    baseline = load_report(args.baseline)
+    if args.current:
+        current = load_report(args.current)
+    else:
+        current = run_benchmarks(args)
+        save_report(current, args.output)
+
+    differences = environment_differences(baseline, current)
+    if differences:
+        print("Attention, environnements différents :")
+        for line in differences:
+            print(f"  {line}")
+
+    comparisons = compare_reports(baseline, current, args.threshold)
+    if args.only:
+        comparisons = [c for c in comparisons if any(c.name.startswith(prefix) for prefix in args.only)]
+    for line in format_comparison(comparisons):
+        print(line)
+
+    regressions = [c.name for c in comparisons if c.status == STATUS_REGRESSION]
+    if regressions:
+        print(f"{len(regressions)} régression(s) au-delà de {args.threshold:.0%} : {', '.join(regressions)}")
+        return 1
+    print(f"Aucune régression au-delà de {args.threshold:.0%}")
+    return 0
+
+
+def stress(args):
+    import io
+    import contextlib
+    from benchmarks.baseline import save_report
+    from benchmarks.suite import BenchmarkContext
+    from benchmarks.stress import run_stress, format_stress
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="nostradaballs-stress-") as directory:
+        context = BenchmarkContext(directory)
+        for factor in args.factor or [10, 100]:
+            obstacle_factor = args.obstacle_factor if args.obstacle_factor is not None else factor
+            quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+            with quiet:
+                result = run_stress(context, factor, obstacle_factor, args.seconds, args.max_particles, args.bucket)
+            for line in format_stress(result):
+                print(line)
+            results.append(result)
+
+    save_report({'results': results}, args.output)
+    print(f"Mesures par frame écrites dans {args.output}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mesures de performance reproductibles (sans fenêtre, thème factice)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_suite_arguments(subparser):
+        subparser.add_argument('--only', action='append', metavar='PRÉFIXE',
+                               help="Cas à exécuter (ex: physics.step, audio.mix/200), répétable")
+        subparser.add_argument('--scale', type=float, default=1.0,
+                               help="Facteur sur le nombre d'échantillons (ex: 0.25 pour un essai rapide)")
+        subparser.add_argument('--output', default=DEFAULT_OUTPUT, help="Fichier JSON des résultats")
+        subparser.add_argument('--verbose', action='store_true', help="Afficher les messages de la simulation")
+
+    run_parser = subparsers.add_parser('run', help="Exécute la suite et écrit les résultats")
+    add_suite_arguments(run_parser)
+
+    compare_parser = subparsers.add_parser('compare', help="Compare des résultats à une référence")
+    compare_parser.add_argument('baseline', help="Résultats de référence")
+    compare_parser.add_argument('current', nargs='?', help="Résultats à comparer (défaut : exécute la suite)")
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="Ralentissement toléré avant de signaler une régression (défaut : 0.10)")
+    add_suite_arguments(compare_parser)
+
+    stress_parser = subparsers.add_parser('stress', help="Partie chargée : coût par frame selon le nombre de billes")
+    stress_parser.add_argument('--factor', type=float, action='append',
+                               help="Multiplicateur du débit d'émission, répétable (défaut : 10 et 100)")
+    stress_parser.add_argument('--obstacle-factor', type=float,
+                               help="Multiplicateur du nombre d'obstacles (défaut : le même que --factor)")
+    stress_parser.add_argument('--seconds', type=float, default=60, help="Durée de partie simulée au maximum")
+    stress_parser.add_argument('--max-particles', type=int, default=3000, help="Nombre de billes auquel s'arrêter")
+    stress_parser.add_argument('--bucket', type=int, default=100, help="Largeur des tranches des courbes (en billes)")
+    stress_parser.add_argument('--output', default=DEFAULT_STRESS_OUTPUT, help="Fichier JSON des mesures")
+    stress_parser.add_argument('--verbose', action='store_true', help="Afficher les messages de la simulation")
+
+    args = parser.parse_args()
+    commands = {'run': run, 'compare': compare, 'stress': stress}
+    sys.exit(commands[args.command](args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+import os
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Statuts d'un cas dans une comparaison
+STATUS_REGRESSION = 'régression'
+STATUS_IMPROVEMENT = 'amélioration'
+STATUS_STABLE = 'stable'
+STATUS_NEW = 'nouveau'
+STATUS_MISSING = 'absent'
+
+
+@dataclass
+class Comparison:
+    """Écart d'un cas entre la référence et la mesure actuelle"""
+    name: str
+    baseline_ms: Optional[float]
+    current_ms: Optional[float]
+    status: str
+
+    @property
+    def ratio(self) -> Optional[float]:
+        if not self.baseline_ms or self.current_ms is None:
+            return None
+        return self.current_ms / self.baseline_ms
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    """
+    Écrit un rapport de mesures en JSON.
+
+    Args:
+        report (Dict[str, Any]): Rapport retourné par `run_suite`
+        path (str): Fichier de sortie
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    """
+    Lit un rapport de mesures.
+
+    Args:
+        path (str): Fichier JSON du rapport
+
+    Returns:
+        Dict[str, Any]: Le rapport
+
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+    """
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.10) -> List[Comparison]:
+    """
+    Compare les médianes de deux rapports.
+
+    Args:
+        baseline (Dict[str, Any]): Rapport de référence
+        current (Dict[str, Any]): Rapport à évaluer
+        threshold (float): Écart relatif toléré (0.10 : ±10%)
+
+    Returns:
+        List[Comparison]: Un élément par cas présent dans l'un des rapports
+    """
+    comparisons = []
+    baseline_results = baseline['results']
+    current_results = current['results']
+    for name in list(baseline_results) + [name for name in current_results if name not in baseline_results]:
+        baseline_ms = baseline_results[name]['median_ms'] if name in baseline_results else None
+        current_ms = current_results[name]['median_ms'] if name in current_results else None
+        if baseline_ms is None:
+            status = STATUS_NEW
+        elif current_ms is None:
+            status = STATUS_MISSING
+        elif current_ms > baseline_ms * (1 + threshold):
+            status = STATUS_REGRESSION
+        elif current_ms < baseline_ms * (1 - threshold):
+            status = STATUS_IMPROVEMENT
+        else:
+            status = STATUS_STABLE
+        comparisons.append(Comparison(name, baseline_ms, current_ms, status))
+    return comparisons
+
+
+def environment_differences(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """
+    Liste les différences d'environnement qui rendent une comparaison douteuse.
+
+    Args:
+        baseline (Dict[str, Any]): Rapport de référence
+        current (Dict[str, Any]): Rapport à évaluer
+
+    Returns:
+        List[str]: Une ligne lisible par différence
+    """
+    differences = []
+    for key, value in baseline.get('environment', {}).items():
+        other = current.get('environment', {}).get(key)
+        if other != value:
+            differences.append(f"{key} : {value} -> {other}")
+    if baseline.get('scale') != current.get('scale'):
+        differences.append(f"scale : {baseline.get('scale')} -> {current.get('scale')}")
+    return differences
+
+
+def format_comparison(comparisons: List[Comparison]) -> List[str]:
+    """Retourne une ligne lisible par cas."""
+    lines = []
+    for comparison in comparisons:
+        baseline = f"{comparison.baseline_ms:9.2f}" if comparison.baseline_ms is not None else f"{'-':>9}"
+        current = f"{comparison.current_ms:9.2f}" if comparison.current_ms is not None else f"{'-':>9}"
+        ratio = f"{(comparison.ratio - 1) * 100:+6.1f}%" if comparison.ratio is not None else f"{'':>7}"
+        lines.append(f"{comparison.name:<24} {baseline} ms -> {current} ms {ratio}  {comparison.status}")
+    return lines
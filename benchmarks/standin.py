@@ -0,0 +1,85 @@
+import os
+import pygame
+import numpy as np
+import soundfile as sf
+from typing import Any, Dict
+from core.config import SimulationConfig
+
+SAMPLE_RATE = 44100
+THEME = "benchmark"
+
+
+def _write_tone(path: str, frequencies, duration: float, volume: float = 0.3) -> None:
+    """
+    Écrit un accord de sinusoïdes avec une enveloppe douce (mono, 44,1 kHz).
+
+    Args:
+        path (str): Fichier WAV à écrire
+        frequencies: Fréquences de l'accord en Hz
+        duration (float): Durée en secondes
+        volume (float): Amplitude crête
+    """
+    t = np.arange(int(duration * SAMPLE_RATE)) / SAMPLE_RATE
+    data = sum(np.sin(2 * np.pi * frequency * t) for frequency in frequencies) / len(frequencies)
+    envelope = np.minimum(1.0, np.minimum(t, duration - t) * 20)
+    sf.write(path, (data * envelope * volume).astype(np.float32), SAMPLE_RATE)
+
+
+def _write_image(path: str, width: int, height: int, seed: int) -> None:
+    """
+    Écrit une image PNG de dégradé bruité, reproductible.
+
+    Args:
+        path (str): Fichier PNG à écrire
+        width (int): Largeur de l'image
+        height (int): Hauteur de l'image
+        seed (int): Graine du bruit
+    """
+    random_state = np.random.RandomState(seed)
+    x = np.linspace(0, 1, width)[:, None]
+    y = np.linspace(0, 1, height)[None, :]
+    pixels = np.empty((width, height, 3), dtype=np.float64)
+    pixels[..., 0] = 255 * x
+    pixels[..., 1] = 255 * y
+    pixels[..., 2] = 255 * (1 - x * y)
+    pixels += random_state.uniform(-20, 20, pixels.shape)
+    surface = pygame.Surface((width, height))
+    pygame.surfarray.blit_array(surface, np.clip(pixels, 0, 255).astype(np.uint8))
+    pygame.image.save(surface, path)
+
+
+def create_standin_theme(directory: str, config: SimulationConfig) -> Dict[str, Any]:
+    """
+    Génère un thème factice (fond, images et voix des réponses, question,
+    musique) pour mesurer les performances sans dépendre des vrais thèmes.
+
+    Les fichiers sont déterministes : deux exécutions produisent les mêmes
+    octets, donc les mêmes coûts de décodage et de mixage.
+
+    Args:
+        directory (str): Dossier où écrire les fichiers
+        config (SimulationConfig): Configuration dont on reprend les dimensions
+
+    Returns:
+        Dict[str, Any]: Valeurs de configuration pointant vers les fichiers générés
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = {
+        'background_image_path': os.path.join(directory, 'bg.png'),
+        'reponse_a_image_path': os.path.join(directory, 'a.png'),
+        'reponse_b_image_path': os.path.join(directory, 'b.png'),
+        'background_music_path': os.path.join(directory, 'music.wav'),
+        'question_sound_path': os.path.join(directory, 'question.wav'),
+        'reponse_a_voice_path': os.path.join(directory, 'a.wav'),
+        'reponse_b_voice_path': os.path.join(directory, 'b.wav'),
+    }
+
+    _write_image(paths['background_image_path'], config.width, config.height, seed=1)
+    _write_image(paths['reponse_a_image_path'], 512, 512, seed=2)
+    _write_image(paths['reponse_b_image_path'], 512, 512, seed=3)
+    _write_tone(paths['background_music_path'], (220.0, 277.2, 329.6), duration=20.0, volume=0.2)
+    _write_tone(paths['question_sound_path'], (440.0,), duration=2.5)
+    _write_tone(paths['reponse_a_voice_path'], (523.3, 659.3), duration=2.0)
+    _write_tone(paths['reponse_b_voice_path'], (392.0, 493.9), duration=2.0)
+
+    return {'theme': THEME, **paths}
@@ -0,0 +1,212 @@
+import os
+import time
+from typing import Any, Dict, List, Optional
+from core.simulator import Simulator
+from benchmarks.suite import BenchmarkContext
+
+# Phases suivies par frame (les couches de dessin "draw.*" sont additionnées dans "draw")
+PHASES = ('physics', 'cuves', 'draw', 'capture', 'encode', 'frame')
+WINDOW = 30  # Frames de la médiane glissante utilisée pour détecter la perte du temps réel
+
+
+def stress_overrides(context: BenchmarkContext, factor: float, obstacle_factor: float) -> Dict[str, Any]:
+    """
+    Valeurs de configuration d'une partie chargée : émission `factor` fois
+    plus rapide, `obstacle_factor` fois plus d'obstacles de chaque type.
+
+    Args:
+        context (BenchmarkContext): Environnement des mesures
+        factor (float): Multiplicateur du débit d'émission
+        obstacle_factor (float): Multiplicateur du nombre d'obstacles
+
+    Returns:
+        Dict[str, Any]: Valeurs à remplacer dans la configuration
+    """
+    config = context.config
+    return {
+        'emit_interval': config.emit_interval / factor,
+        'num_obstacles': int(config.num_obstacles * obstacle_factor),
+        'num_circles': int(config.num_circles * obstacle_factor),
+        'num_rotating': int(config.num_rotating * obstacle_factor),
+        'num_pivot': int(config.num_pivot * obstacle_factor),
+    }
+
+
+def _median(values: List[float]) -> float:
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def realtime_limits(frames: List[Dict[str, float]], budget_ms: float) -> Dict[str, Optional[int]]:
+    """
+    Nombre de billes à partir duquel chaque phase dépasse seule le budget
+    d'une frame (médiane glissante sur `WINDOW` frames, le nombre retenu est
+    celui du début de la première fenêtre en dépassement).
+
+    Args:
+        frames (List[Dict[str, float]]): Mesures par frame (ms) avec le nombre de billes
+        budget_ms (float): Durée d'une frame en temps réel
+
+    Returns:
+        Dict[str, Optional[int]]: Par phase, le nombre de billes (None si jamais dépassé)
+    """
+    limits = {}
+    for phase in PHASES:
+        limits[phase] = None
+        for end in range(WINDOW, len(frames) + 1):
+            window = frames[end - WINDOW:end]
+            if _median([frame[phase] for frame in window]) > budget_ms:
+                limits[phase] = window[0]['particles']
+                break
+    return limits
+
+
+def cost_curves(frames: List[Dict[str, float]], bucket: int) -> List[Dict[str, float]]:
+    """
+    Médiane de chaque phase par tranche de nombre de billes.
+
+    Args:
+        frames (List[Dict[str, float]]): Mesures par frame (ms) avec le nombre de billes
+        bucket (int): Largeur d'une tranche (en billes)
+
+    Returns:
+        List[Dict[str, float]]: Une ligne par tranche, triées par nombre de billes
+    """
+    buckets: Dict[int, List[Dict[str, float]]] = {}
+    for frame in frames:
+        buckets.setdefault(int(frame['particles']) // bucket * bucket, []).append(frame)
+    return [
+        {'particles': start, 'frames': len(rows), **{phase: _median([row[phase] for row in rows]) for phase in PHASES}}
+        for start, rows in sorted(buckets.items())
+    ]
+
+
+def physics_cost_per_particle(frames: List[Dict[str, float]]) -> float:
+    """
+    Coût médian de la physique par bille et par frame.
+
+    Args:
+        frames (List[Dict[str, float]]): Mesures par frame (ms) avec le nombre de billes
+
+    Returns:
+        float: Millisecondes de physique par bille et par frame (0 sans bille)
+    """
+    costs = [frame['physics'] / frame['particles'] for frame in frames if frame['particles']]
+    return _median(costs) if costs else 0.0
+
+
+def run_stress(
+    context: BenchmarkContext,
+    factor: float,
+    obstacle_factor: float,
+    seconds: float = 60,
+    max_particles: int = 3000,
+    bucket: int = 100
+) -> Dict[str, Any]:
+    """
+    Joue une partie chargée sans fenêtre, enregistrement compris, et mesure
+    chaque frame jusqu'à la fin de la physique ou `max_particles` billes.
+
+    Args:
+        context (BenchmarkContext): Environnement des mesures
+        factor (float): Multiplicateur du débit d'émission
+        obstacle_factor (float): Multiplicateur du nombre d'obstacles
+        seconds (float): Durée de partie simulée au maximum
+        max_particles (int): Nombre de billes auquel la mesure s'arrête
+        bucket (int): Largeur des tranches des courbes de coût
+
+    Returns:
+        Dict[str, Any]: Paramètres, nombre d'obstacles, limites de temps réel,
+            courbes de coût et mesures de chaque frame
+    """
+    overrides = stress_overrides(context, factor, obstacle_factor)
+    config = context.config.replace(
+        temps_limite=seconds,
+        profile=True,
+        output_dir=os.path.join(context.directory, 'output', f'stress-{factor:g}x{obstacle_factor:g}'),
+        **overrides
+    )
+
+    start = time.perf_counter()
+    simulator = Simulator(config, context.assets)
+    setup_seconds = time.perf_counter() - start
+    particles = simulator.particle_manager.particles
+    profiler = simulator.profiler
+    dt = 1 / config.fps
+
+    frames = []
+    simulator.start()
+    try:
+        running = True
+        while running and simulator.physics_active and len(particles) < max_particles:
+            running = simulator.update(dt)
+            running = simulator.draw(context.screen) and running
+            phases = profiler.current
+            frame = {'particles': len(particles)}
+            for phase in PHASES:
+                if phase == 'draw':
+                    total = sum(duration for name, duration in phases.items() if name.startswith('draw.'))
+                else:
+                    total = phases.get(phase, 0)
+                frame[phase] = total / 1e6
+            frames.append(frame)
+    finally:
+        simulator.finish_recording()
+
+    budget_ms = 1000 / config.fps
+    simulated_seconds = len(frames) * dt
+    return {
+        'factor': factor,
+        'obstacle_factor': obstacle_factor,
+        'emit_interval': config.emit_interval,
+        'emission_rate': simulator.particle_manager.particle_count / simulated_seconds if frames else 0.0,
+        'requested_obstacles': sum(overrides[name] for name in ('num_obstacles', 'num_circles', 'num_rotating', 'num_pivot')),
+        'obstacles': len(simulator.obstacle_manager.shapes),
+        'setup_seconds': setup_seconds,
+        'budget_ms': budget_ms,
+        'max_particles': len(particles),
+        'allocations': simulator.particle_manager.pool_allocations,
+        'pool_hit_rate': simulator.particle_manager.pool_hit_rate,
+        'stuck_nudged': simulator.particle_manager.stuck_nudged,
+        'stuck_retired': simulator.particle_manager.stuck_retired,
+        'solver_ms_saved': simulator.particle_manager.stuck_seconds_saved * config.fps * physics_cost_per_particle(frames),
+        'realtime_limit': realtime_limits(frames, budget_ms),
+        'curves': cost_curves(frames, bucket),
+        'frames': frames,
+    }
+
+
+def format_stress(result: Dict[str, Any]) -> List[str]:
+    """Retourne le résumé lisible d'une partie chargée."""
+    first = result['frames'][0]['particles'] if result['frames'] else 0
+
+    def describe(limit: Optional[int]) -> str:
+        if limit is None:
+            return "jamais"
+        if limit <= first:
+            return f"dès le départ ({limit} billes)"
+        return f"à partir de {limit} billes"
+
+    lines = [
+        f"Émission x{result['factor']:g} ({result['emission_rate']:.1f} billes/s), "
+        f"obstacles x{result['obstacle_factor']:g} ({result['requested_obstacles']} demandés, "
+        f"{result['obstacles']} formes placées en {result['setup_seconds']:.2f}s) : "
+        f"{len(result['frames'])} frames, jusqu'à {result['max_particles']} billes",
+        f"  Temps réel ({1000 / result['budget_ms']:.0f} fps) perdu {describe(result['realtime_limit']['frame'])}",
+    ]
+    if result['pool_hit_rate'] is not None:
+        lines.append(
+            f"  Billes réutilisées : {result['pool_hit_rate']:.0%} des émissions ({result['allocations']} créées)"
+        )
+    if result['stuck_nudged']:
+        lines.append(
+            f"  Billes coincées : {result['stuck_nudged']} relancées, {result['stuck_retired']} retirées "
+            f"(environ {result['solver_ms_saved']:.0f} ms de physique évitées)"
+        )
+    for phase in PHASES:
+        if phase != 'frame' and result['realtime_limit'][phase] is not None:
+            lines.append(f"  {phase} seul dépasse le budget {describe(result['realtime_limit'][phase])}")
+    lines.append("  billes  " + "".join(f"{phase:>10}" for phase in PHASES) + "  (ms, médiane)")
+    for row in result['curves']:
+        lines.append(f"  {row['particles']:>6}  " + "".join(f"{row[phase]:10.2f}" for phase in PHASES))
+    return lines
@@ -0,0 +1,397 @@
+import io
+import os
+import gc
+import time
+import random
+import platform
+import contextlib
+import pygame
+import pymunk
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from config import create_config
+from core.assets import AssetCache
+from core.animation import BounceEffect
+from core.audio import SoundEvent
+from core.cache import code_version
+from core.jobs import RenderJob, render_job, get_screen
+from core.record import RecordManager
+from core.simulator import Simulator
+from benchmarks.standin import create_standin_theme
+
+SEED = 1234
+WARMUP_FRAMES = 30  # Frames simulées avant les mesures, pour que les billes soient en mouvement
+RENDER_SECONDS = 10  # Durée de la vidéo du rendu complet
+
+PHYSICS_COUNTS = (100, 250, 500, 1000, 2000)
+DRAW_COUNTS = (100, 500, 1000, 2000)
+AUDIO_EVENT_COUNTS = (200, 2000)
+SNAPSHOT_COUNTS = (100, 500, 2000)
+PIVOT_BARS = 60  # Barres pivotantes demandées pour le cas des barres
+PIVOT_PARTICLES = 500
+PIVOT_SPIN = 5.0  # Vitesse angulaire (rad/s) au-delà de laquelle une barre est comptée comme emballée
+
+
+@dataclass
+class BenchmarkResult:
+    """Durées mesurées pour un cas"""
+    name: str
+    samples: List[float]  # Durées en secondes
+    params: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Retourne la médiane, le 95e centile et le minimum en millisecondes."""
+        values = sorted(self.samples)
+        count = len(values)
+        return {
+            'median_ms': values[count // 2] * 1000,
+            'p95_ms': values[min(count - 1, int(count * 0.95))] * 1000,
+            'min_ms': values[0] * 1000,
+            'samples': count,
+            'params': self.params,
+        }
+
+
+def measure(function: Callable[[], Any], samples: int, setup: Optional[Callable[[], Any]] = None) -> List[float]:
+    """
+    Chronomètre plusieurs appels d'une fonction.
+
+    Le ramasse-miettes est désactivé pendant les mesures pour qu'une
+    collecte ne tombe pas au hasard dans un échantillon.
+
+    Args:
+        function (Callable[[], Any]): Fonction mesurée
+        samples (int): Nombre d'appels
+        setup (Optional[Callable[[], Any]]): Appelée avant chaque appel, hors mesure
+
+    Returns:
+        List[float]: Durée de chaque appel en secondes
+    """
+    durations = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(samples):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            function()
+            durations.append(time.perf_counter() - start)
+    finally:
+        gc.enable()
+    return durations
+
+
+class BenchmarkContext:
+    """
+    Environnement commun aux cas : configuration figée (graine, thème
+    factice, sortie dans un dossier temporaire), cache de ressources et
+    surface de rendu.
+    """
+
+    def __init__(self, directory: str, scale: float = 1.0):
+        """
+        Args:
+            directory (str): Dossier de travail (thème factice, vidéos)
+            scale (float): Facteur appliqué au nombre d'échantillons de chaque cas
+        """
+        self.directory = directory
+        self.scale = scale
+        pygame.init()
+
+        self.overrides = {
+            'debug': False,
+            'visual': False,
+            'profile': False,
+            'profile_path': None,
+            'winner': None,
+            'seed': SEED,
+            'output_dir': os.path.join(directory, 'output'),
+        }
+        self.overrides.update(create_standin_theme(os.path.join(directory, 'theme'), create_config()))
+        self.config = create_config(**self.overrides)
+        # Jamais de bundle : les ressources factices sont décodées comme un thème non préparé
+        self.assets = AssetCache(bundle_dir=None)
+        self.screen = get_screen(self.config.width, self.config.height)
+
+    def samples(self, default: int) -> int:
+        """Nombre d'échantillons d'un cas, après application du facteur."""
+        return max(1, round(default * self.scale))
+
+    def simulator(self, particles: int = 0, **overrides) -> Simulator:
+        """
+        Construit un simulateur avec la scène de la graine fixe et des billes
+        déjà en mouvement.
+
+        Les billes sont posées en grille dans le haut de l'écran puis la
+        physique tourne `WARMUP_FRAMES` frames : la scène est identique d'une
+        exécution à l'autre.
+
+        Args:
+            particles (int): Nombre de billes
+            **overrides: Valeurs de configuration à remplacer (ex: num_pivot=60)
+
+        Returns:
+            Simulator: Le simulateur prêt à être mesuré
+        """
+        simulator = Simulator(self.config.replace(**overrides), self.assets)
+        manager = simulator.particle_manager
+        spacing = self.config.particle_radius * 2 + 2
+        per_row = (self.config.width - 2 * spacing) // spacing
+        for i in range(particles):
+            manager.emit_particle()
+            row, column = divmod(i, per_row)
+            manager.particles[-1].body.position = (spacing + column * spacing, spacing + row * spacing)
+
+        for _ in range(WARMUP_FRAMES):
+            step_frame(simulator)
+        return simulator
+
+
+def step_frame(simulator: Simulator) -> None:
+    """Avance la physique d'une frame, avec les mêmes sous-pas que `Simulator.update`,
+    puis relit l'état des billes dessinées."""
+    dt = 1 / simulator.config.fps
+    for _ in range(20):
+        simulator.physics_space.step(dt / 20)
+    simulator.obstacle_manager.limit_pivot_speed()
+    simulator.particle_manager.refresh_state()
+
+
+def bench_physics_step(context: BenchmarkContext) -> List[BenchmarkResult]:
+    """Une frame de physique (20 appels à `PhysicsSpace.step`) selon le nombre de billes."""
+    results = []
+    for count in PHYSICS_COUNTS:
+        simulator = context.simulator(count)
+        samples = measure(lambda: step_frame(simulator), context.samples(60))
+        results.append(BenchmarkResult(f"physics.step/{count}", samples, {'particles': count}))
+    return results
+
+
+def bench_particles_draw(context: BenchmarkContext) -> List[BenchmarkResult]:
+    """`ParticleManager.draw` selon le nombre de billes (positions figées)."""
+    results = []
+    for count in DRAW_COUNTS:
+        simulator = context.simulator(count)
+        samples = measure(lambda: simulator.particle_manager.draw(context.screen), context.samples(30))
+        results.append(BenchmarkResult(f"particles.draw/{count}", samples, {'particles': count}))
+    return results
+
+
+def bench_obstacles_draw(context: BenchmarkContext) -> List[BenchmarkResult]:
+    """`ObstacleManager.draw` sur la scène par défaut, au repos puis avec
+    tous les obstacles circulaires en plein rebond."""
+    simulator = context.simulator()
+    obstacles = simulator.obstacle_manager
+    params = {'shapes': len(obstacles.shapes)}
+    samples = measure(lambda: obstacles.draw(context.screen), context.samples(120))
+    results = [BenchmarkResult("obstacles.draw", samples, params)]
+
+    circles = [shape for shape in obstacles.shapes if isinstance(shape, pymunk.Circle)]
+    for shape in circles:
+        obstacles.animations.start(shape, BounceEffect())
+    samples = measure(lambda: obstacles.draw(context.screen), context.samples(120))
+    results.append(BenchmarkResult("obstacles.draw/bounce", samples, dict(params, animated=len(circles))))
+    return results
+
+
+def bench_pivots(context: BenchmarkContext) -> List[BenchmarkResult]:
+    """
+    Une frame (obstacles puis physique) d'une scène chargée en barres
+    pivotantes. Les paramètres décrivent la tenue des barres pendant les
+    mesures : part des frames où une barre dépasse `PIVOT_SPIN`, vitesse
+    angulaire maximale et écart maximal du centre d'une barre à son pivot.
+    """
+    simulator = context.simulator(PIVOT_PARTICLES, num_pivot=PIVOT_BARS)
+    obstacles = simulator.obstacle_manager
+    dt = 1 / simulator.config.fps
+    spins, drifts = [], []
+
+    def frame():
+        obstacles.update(dt)
+        step_frame(simulator)
+
+    def observe():
+        for body, (position, _, _) in zip(obstacles.pivot_bars, obstacles.pivot_specs):
+            spins.append(abs(body.angular_velocity))
+            drifts.append((body.position - pymunk.Vec2d(*position)).length)
+
+    samples = measure(frame, context.samples(300), setup=observe)
+    params = {
+        'pivots': len(obstacles.pivot_bars),
+        'particles': PIVOT_PARTICLES,
+        'spinning_pct': round(100 * sum(spin > PIVOT_SPIN for spin in spins) / max(1, len(spins)), 2),
+        'max_angular_velocity': round(max(spins, default=0.0), 2),
+        'max_drift': round(max(drifts, default=0.0), 3),
+    }
+    return [BenchmarkResult("pivots.frame", samples, params)]
+
+
+def bench_snapshot(context: BenchmarkContext) -> List[BenchmarkResult]:
+    """`Simulator.snapshot` et `Simulator.restore` selon le nombre de billes, avec la taille d'un instantané."""
+    results = []
+    for count in SNAPSHOT_COUNTS:
+        simulator = context.simulator(count)
+        snapshot = simulator.snapshot()
+        params = {'particles': count, 'size_kib': round(snapshot.size / 1024, 1)}
+        samples = measure(simulator.snapshot, context.samples(20))
+        results.append(BenchmarkResult(f"snapshot.capture/{count}", samples, params))
+        samples = measure(lambda: simulator.restore(snapshot), context.samples(20))
+        results.append(BenchmarkResult(f"snapshot.restore/{count}", samples, params))
+    return results
+
+
+def bench_record_frame(context: BenchmarkContext) -> List[BenchmarkResult]:
+    """
+    `RecordManager.record_frame` (capture et encodage) sur des frames qui
+    changent : la simulation avance entre deux mesures, hors chronométrage.
+    """
+    simulator = context.simulator(200)
+    record_manager = RecordManager(context.config)
+    record_manager.start_recording('benchmark.mp4')
+    dt = 1 / context.config.fps
+
+    def next_frame():
+        simulator.update(dt)
+        simulator.draw(context.screen)
+
+    try:
+        samples = measure(lambda: record_manager.record_frame(context.screen), context.samples(120), setup=next_frame)
+    finally:
+        record_manager.stop_recording()
+    params = {'width': context.config.width, 'height': context.config.height}
+    return [BenchmarkResult("record.record_frame", samples, params)]
+
+
+def synthetic_events(count: int, duration: float, fps: int) -> List[SoundEvent]:
+    """
+    Journal d'événements sonores reproductible : musique et question au
+    départ, `count` collisions réparties sur la partie, réponse à la fin.
+
+    Args:
+        count (int): Nombre de collisions
+        duration (float): Durée de la partie en secondes
+        fps (int): Images par seconde (pour les numéros de frame)
+
+    Returns:
+        List[SoundEvent]: Les événements triés par date
+    """
+    rng = random.Random(SEED)
+    times = sorted(rng.uniform(0.5, duration) for _ in range(count))
+    events = [SoundEvent('background', 0, 0.0), SoundEvent('question', 0, 0.0)]
+    events.extend(SoundEvent(rng.choice(('default', 'A', 'B')), int(t * fps), t) for t in times)
+    events.append(SoundEvent('reponse_a', int(duration * fps), duration))
+    return events
+
+
+def bench_audio_mix(context: BenchmarkContext) -> List[BenchmarkResult]:
+    """`VideoProcessor.generate_audio_from_events` sur des journaux synthétiques."""
+    simulator = Simulator(context.config, context.assets)
+    audio_manager = simulator.audio_manager
+    output_path = os.path.join(context.directory, 'benchmark.wav')
+    results = []
+    for count in AUDIO_EVENT_COUNTS:
+        events_path = os.path.join(context.directory, f'events-{count}.csv')
+        audio_manager.sound_events = synthetic_events(count, context.config.temps_limite, context.config.fps)
+        audio_manager.export_sound_events(events_path)
+
+        def mix():
+            if not simulator.video_processor.generate_audio_from_events(events_path, output_path):
+                raise RuntimeError("Échec du mixage audio")
+
+        # Premier mixage hors mesure : les sons sont alors décodés et en cache, comme dans un worker
+        mix()
+        samples = measure(mix, context.samples(10), setup=lambda: audio_manager.rng.seed(SEED))
+        results.append(BenchmarkResult(f"audio.mix/{count}", samples, {'events': count}))
+    return results
+
+
+def bench_render(context: BenchmarkContext) -> List[BenchmarkResult]:
+    """Rendu complet d'une vidéo de `RENDER_SECONDS` secondes, étape par étape."""
+    overrides = {**context.overrides, 'temps_limite': RENDER_SECONDS - context.config.delai_arret}
+    stages: Dict[str, List[float]] = {'total': [], 'simulation': [], 'audio': [], 'mux': []}
+    frames = 0
+    for _ in range(context.samples(1)):
+        gc.collect()
+        start = time.perf_counter()
+        result = render_job(RenderJob('benchmark', overrides), context.assets)
+        stages['total'].append(time.perf_counter() - start)
+        stages['simulation'].append(result.simulation_seconds)
+        stages['audio'].append(result.encode_seconds)
+        stages['mux'].append(result.mux_seconds)
+        frames = result.frames
+    return [
+        BenchmarkResult(f"render.{stage}", samples, {'frames': frames, 'seconds': RENDER_SECONDS})
+        for stage, samples in stages.items()
+    ]
+
+
+# Cas de la suite, dans l'ordre d'exécution
+BENCHMARKS: List[Tuple[str, Callable[[BenchmarkContext], List[BenchmarkResult]]]] = [
+    ('physics.step', bench_physics_step),
+    ('particles.draw', bench_particles_draw),
+    ('obstacles.draw', bench_obstacles_draw),
+    ('pivots.frame', bench_pivots),
+    ('snapshot', bench_snapshot),
+    ('record.record_frame', bench_record_frame),
+    ('audio.mix', bench_audio_mix),
+    ('render', bench_render),
+]
+
+
+def environment() -> Dict[str, Any]:
+    """Machine et versions des bibliothèques : deux rapports ne se comparent qu'à environnement égal."""
+    return {
+        'machine': platform.machine(),
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'python': platform.python_version(),
+        'pygame': pygame.version.ver,
+        'pymunk': pymunk.version,
+        'numpy': np.__version__,
+    }
+
+
+def run_suite(
+    directory: str,
+    only: Optional[List[str]] = None,
+    scale: float = 1.0,
+    verbose: bool = False
+) -> Dict[str, Any]:
+    """
+    Exécute les cas de la suite.
+
+    Args:
+        directory (str): Dossier de travail
+        only (Optional[List[str]]): Préfixes des cas à exécuter (défaut : tous)
+        scale (float): Facteur appliqué au nombre d'échantillons
+        verbose (bool): Laisser passer les messages de la simulation
+
+    Returns:
+        Dict[str, Any]: Rapport (environnement, version du code, résultats par cas)
+    """
+    context = BenchmarkContext(directory, scale)
+    report = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'code_version': code_version(),
+        'environment': environment(),
+        'seed': SEED,
+        'scale': scale,
+        'results': {},
+    }
+    for name, benchmark in BENCHMARKS:
+        if only and not any(name.startswith(prefix) or prefix.startswith(name) for prefix in only):
+            continue
+        start = time.perf_counter()
+        quiet = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(io.StringIO())
+        with quiet:
+            results = benchmark(context)
+        for result in results:
+            if only and not any(result.name.startswith(prefix) for prefix in only):
+                continue
+            report['results'][result.name] = result.to_dict()
+            print(f"{result.name:<24} médiane {report['results'][result.name]['median_ms']:9.2f} ms")
+        print(f"  ({name} en {time.perf_counter() - start:.1f}s)")
+    return report
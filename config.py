@@ -6,6 +6,8 @@ WIDTH = int(1080 * RATIO)
 HEIGHT = int(1920 * RATIO)
 FPS = 60
 VISUAL = DEBUG
+PROFILE = DEBUG  # Mesure la durée de chaque phase des frames (affichée en mode DEBUG)
+PROFILE_PATH = None  # Fichier JSON lines des mesures par frame (ex: "output/profile.jsonl")
 
 THEME = "trompe"
 
@@ -25,6 +27,7 @@ CUVE_B_COLOR_END   = (180, 0, 60)     # rouge magenta sombre
 BACKGROUND_IMAGE_PATH = f"assets/themes/{THEME}/bg.png"  # Chemin vers l'image de fond
 BACKGROUND_FULL_SCREEN = True
 BACKGROUND_OPACITY = 0.5  # Opacité de l'image de fond (0.0 à 1.0)
+BACKGROUND_PREBAKE_FADE = False  # Pré-calculer chaque étape du fondu de victoire (plus rapide, ~8 Mo par étape)
 
 # Configuration des particules
 PARTICLE_RADIUS = int(6 * RATIO)
@@ -75,6 +78,7 @@ REPONSE_B_COLOR = VERT
 # Configuration de la réponse
 REPONSE_FONT_SIZE = int(80 * RATIO)  # Taille de police plus grande pour la réponse
 REPONSE_POSITION = (WIDTH // 2, HEIGHT // 2)  # Position exactement au centre de l'écran
+REPONSE_ZOOM = False  # Effet de zoom pulsé sur la réponse
 REPONSE_ZOOM_MIN = 1.0  # Échelle minimale du zoom
 REPONSE_ZOOM_MAX = 1.6  # Échelle maximale du zoom
 REPONSE_ZOOM_SPEED = 0.5  # Vitesse du zoom
@@ -86,6 +90,8 @@ NUM_OBSTACLES = int(20 * RATIO) # Nombre total d'obstacles
 NUM_CIRCLES = int(25 * RATIO)     # Nombre de cercles
 NUM_ROTATING = int(0 * RATIO)       # Nombre d'obstacles rotatifs
 NUM_PIVOT = int(25 * RATIO)        # Nombre de barres pivotantes
+SCENE = None  # Scène de la bibliothèque à utiliser (identifiant), None = placement aléatoire
+SCENE_DIR = "assets/scenes"  # Bibliothèque des scènes enregistrées (voir scene_library.py)
 
 # Configuration des cuves
 CUVE_FRICTION = 0.5
@@ -95,12 +101,34 @@ CUVE_FONT_SIZE = int(60 * RATIO)
 
 # Configuration du jeu
 SEUIL_VICTOIRE = 1  # Seuil à atteindre pour gagner (multiple de 100)
-DELAI_DISPARITION = 25  # Délai en secondes avant la disparition des billes dans les cuves
+DELAI_DISPARITION = 25  # Délai en secondes (de simulation) avant la disparition des billes dans les cuves
 DELAI_ARRET = 3  # Délai en secondes avant l'arrêt complet du jeu après l'arrêt de la physique
+STUCK_DELAY = 5  # Secondes d'immobilité hors des cuves avant de relancer une bille coincée, puis de la retirer (None = jamais)
+STUCK_SPEED = 5  # Célérité (pixels/s) en dessous de laquelle une bille est considérée immobile
+STUCK_NUDGE = 250  # Vitesse (pixels/s) donnée à une bille coincée pour la relancer
 WINNER = None  # Le gagnant attendu ("A" ou "B")
+SEED = None  # Graine du hasard (None = placement et sons différents à chaque partie)
+SNAPSHOT_INTERVAL = None  # Secondes de physique entre deux instantanés en mémoire (None = aucun)
+SNAPSHOT_KEEP = 6  # Nombre d'instantanés gardés (les plus récents)
 
 # Couleurs pour les cuves (fin de partie)
 GRIS_CUVE = (100, 100, 100)
 BLEU_GAGNANT = (0, 100, 255)
 GRIS_TEXTE = (180, 180, 180)
 OR = (255, 215, 0)
+
+
+def create_config(**overrides):
+    """
+    Crée la configuration d'une exécution à partir des valeurs de ce fichier.
+
+    Args:
+        **overrides: Valeurs à remplacer, par nom de champ en minuscules
+            (ex: theme="chien_chat", question="...", temps_limite=30)
+
+    Returns:
+        SimulationConfig: La configuration de la simulation
+    """
+    import sys
+    from core.config import SimulationConfig
+    return SimulationConfig.from_module(sys.modules[__name__], **overrides)
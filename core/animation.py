@@ -0,0 +1,71 @@
+from typing import Any, Dict, Hashable, Optional
+
+
+class BounceEffect:
+    """
+    Rebond d'un obstacle touché : agrandi d'un coup, il revient en douceur à
+    sa taille (une fraction `speed` de l'écart à chaque frame).
+    """
+
+    def __init__(self, scale: float = 1.3, target_scale: float = 1.0, speed: float = 0.2):
+        """
+        Args:
+            scale (float): Échelle de départ
+            target_scale (float): Échelle au repos
+            speed (float): Fraction de l'écart rattrapée à chaque frame
+        """
+        self.scale = scale
+        self.target_scale = target_scale
+        self.speed = speed
+
+    def advance(self) -> bool:
+        """Avance d'une frame ; retourne False une fois l'obstacle revenu au repos."""
+        self.scale += (self.target_scale - self.scale) * self.speed
+        if abs(self.scale - self.target_scale) < 0.01:
+            self.scale = self.target_scale
+            return False
+        return True
+
+
+class AnimationScheduler:
+    """
+    Effets visuels en cours (rebonds, et plus tard éclats de barres,
+    pulsations de cuves...), au plus un par cible.
+
+    Seuls les effets actifs sont gardés : un effet revenu au repos est retiré
+    à la frame où il se termine. Le coût d'une frame ne dépend donc que du
+    nombre d'effets en cours, et les cibles au repos peuvent être dessinées
+    depuis une image fixe.
+
+    Un effet est un objet dont `advance()` avance d'une frame et retourne
+    False une fois terminé.
+    """
+
+    def __init__(self):
+        self.active: Dict[Hashable, Any] = {}
+
+    def start(self, target: Hashable, effect: Any) -> None:
+        """Lance un effet sur une cible (remplace celui en cours)."""
+        self.active[target] = effect
+
+    def get(self, target: Hashable) -> Optional[Any]:
+        """Effet en cours sur une cible, ou None si elle est au repos."""
+        return self.active.get(target)
+
+    def update(self) -> None:
+        """Avance d'une frame chaque effet actif et retire ceux qui sont terminés."""
+        settled = [target for target, effect in self.active.items() if not effect.advance()]
+        for target in settled:
+            del self.active[target]
+
+    @property
+    def dirty(self):
+        """Cibles à redessiner à cette frame (celles dont un effet est en cours)."""
+        return self.active.keys()
+
+    def clear(self) -> None:
+        """Arrête tous les effets : chaque cible revient au repos."""
+        self.active.clear()
+
+    def __len__(self) -> int:
+        return len(self.active)
@@ -0,0 +1,188 @@
+import os
+import pygame
+import numpy as np
+import soundfile as sf
+from scipy import signal
+from typing import Dict, Optional, Tuple
+from utils.color import create_gradient_surface
+from utils.image import create_cover_image, create_squared_image
+
+# Dossier des thèmes prétraités (voir prepare_theme.py)
+BUNDLE_DIR = os.path.join("output", "bundles")
+
+class AssetCache:
+    """
+    Cache des ressources chargées par les simulations.
+
+    Un simulateur isolé en crée un pour lui seul ; un worker de rendu en
+    partage un entre tous ses jobs, ce qui évite de redécoder les images et
+    les sons d'un thème à chaque vidéo. Quand un thème a été prétraité, ses
+    images et ses sons sont lus directement depuis le bundle.
+
+    Une ressource est oubliée dès que son fichier change (date de
+    modification ou taille) : un worker qui tourne longtemps ne réutilise
+    jamais une image ou un son remplacé entre deux jobs.
+    """
+
+    SAMPLE_RATE = 44100
+
+    def __init__(self, bundle_dir: Optional[str] = BUNDLE_DIR):
+        """
+        Args:
+            bundle_dir (Optional[str]): Dossier des thèmes prétraités (None : toujours décoder)
+        """
+        self.bundle_dir = bundle_dir
+        self.gradients: Dict[tuple, pygame.Surface] = {}
+        self.images: Dict[tuple, Optional[pygame.Surface]] = {}
+        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.audio: Dict[str, np.ndarray] = {}
+        # (date de modification, taille) des fichiers au moment de leur chargement
+        self.stamps: Dict[str, Optional[Tuple[int, int]]] = {}
+        self.pitch_variations_ready = False
+
+    def refresh(self, path: Optional[str]) -> None:
+        """
+        Oublie les ressources tirées d'un fichier modifié depuis leur chargement.
+
+        Args:
+            path (Optional[str]): Chemin du fichier
+        """
+        if not path:
+            return
+        try:
+            stat = os.stat(path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        if self.stamps.get(path, stamp) != stamp:
+            for key in [key for key in self.images if key[1] == path]:
+                del self.images[key]
+            self.sounds.pop(path, None)
+            self.audio.pop(path, None)
+        self.stamps[path] = stamp
+
+    def gradient(
+        self,
+        width: int,
+        height: int,
+        start_color: Tuple[int, int, int],
+        end_color: Tuple[int, int, int],
+        direction: str = "diagonal"
+    ) -> pygame.Surface:
+        """
+        Retourne une surface de dégradé, créée au premier appel.
+
+        Args:
+            width (int): Largeur de la surface
+            height (int): Hauteur de la surface
+            start_color (Tuple[int, int, int]): Couleur de départ (R, G, B)
+            end_color (Tuple[int, int, int]): Couleur de fin (R, G, B)
+            direction (str): Direction du dégradé
+
+        Returns:
+            pygame.Surface: Surface avec le dégradé (à ne pas modifier)
+        """
+        key = (int(width), int(height), tuple(start_color), tuple(end_color), direction)
+        if key not in self.gradients:
+            self.gradients[key] = create_gradient_surface(width, height, start_color, end_color, direction)
+        return self.gradients[key]
+
+    def cover_image(
+        self,
+        image_path: str,
+        target_width: int,
+        target_height: int,
+        opacity: float = 1.0,
+        is_circular: bool = False
+    ) -> Optional[pygame.Surface]:
+        """Version mise en cache de `utils.image.create_cover_image`."""
+        self.refresh(image_path)
+        key = ('cover', image_path, target_width, target_height, opacity, is_circular)
+        if key not in self.images:
+            self.images[key] = create_cover_image(image_path, target_width, target_height, opacity, is_circular)
+        return self.images[key]
+
+    def squared_image(self, image_path: str, size: int, is_circular: bool = False) -> Optional[pygame.Surface]:
+        """Version mise en cache de `utils.image.create_squared_image`."""
+        self.refresh(image_path)
+        key = ('squared', image_path, size, is_circular)
+        if key not in self.images:
+            self.images[key] = create_squared_image(image_path, size, is_circular)
+        return self.images[key]
+
+    def sound(self, path: str) -> pygame.mixer.Sound:
+        """
+        Retourne le son pygame du fichier, chargé au premier appel.
+
+        Args:
+            path (str): Chemin du fichier audio
+
+        Returns:
+            pygame.mixer.Sound: Le son chargé
+
+        Raises:
+            Exception: Si le fichier ne peut pas être chargé
+        """
+        self.refresh(path)
+        if path not in self.sounds:
+            self.sounds[path] = pygame.mixer.Sound(path)
+        return self.sounds[path]
+
+    def audio_data(self, path: str) -> np.ndarray:
+        """
+        Retourne les échantillons mono à 44,1 kHz d'un fichier audio.
+
+        Args:
+            path (str): Chemin du fichier audio
+
+        Returns:
+            np.ndarray: Échantillons float32 décodés (à ne pas modifier)
+        """
+        self.refresh(path)
+        if path not in self.audio:
+            data, sample_rate = sf.read(path, dtype='float32')
+
+            # Convertir en mono si stéréo
+            if len(data.shape) > 1:
+                data = data.mean(axis=1)
+
+            # Rééchantillonner si nécessaire
+            if sample_rate != self.SAMPLE_RATE:
+                number_of_samples = round(len(data) * self.SAMPLE_RATE / sample_rate)
+                data = signal.resample(data, number_of_samples).astype(np.float32)
+
+            data.setflags(write=False)
+            self.audio[path] = data
+        return self.audio[path]
+
+    def load_theme_bundle(self, theme: str) -> int:
+        """
+        Charge le bundle prétraité d'un thème, s'il existe.
+
+        Args:
+            theme (str): Nom du thème
+
+        Returns:
+            int: Nombre de ressources chargées depuis le bundle
+        """
+        if self.bundle_dir is None:
+            return 0
+        from core.bundle import load_bundle
+        return load_bundle(self, os.path.join(self.bundle_dir, theme))
+
+    def preload_audio(self, paths) -> None:
+        """Décode à l'avance les fichiers audio existants de la liste."""
+        for path in paths:
+            if path and os.path.exists(path):
+                try:
+                    self.audio_data(path)
+                except Exception as e:
+                    print(f"Erreur lors du décodage de {path}: {e}")
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        self.gradients.clear()
+        self.images.clear()
+        self.sounds.clear()
+        self.audio.clear()
+        self.stamps.clear()
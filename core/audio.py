@@ -5,7 +5,8 @@ import random
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 from core.time import TimeManager
-from config import VISUAL, REPONSE_A_VOICE_PATH, REPONSE_B_VOICE_PATH, QUESTION_SOUND_PATH, BACKGROUND_MUSIC_PATH, BACKGROUND_MUSIC_VOLUME
+from core.assets import AssetCache
+from core.config import SimulationConfig
 
 @dataclass
 class SoundEvent:
@@ -15,16 +16,6 @@ class SoundEvent:
     time_seconds: float
 
 class AudioManager:
-    _instance = None
-    
-    # Sons sans variation de pitch
-    SOUND_PATHS = {
-        'reponse_a': REPONSE_A_VOICE_PATH,
-        'reponse_b': REPONSE_B_VOICE_PATH,
-        'question': QUESTION_SOUND_PATH,
-        'background': BACKGROUND_MUSIC_PATH
-    }
-    
     # Sons avec variation de pitch
     SOUND_VARIATION_PATHS = {
         'default': "assets/sounds/default_collision.wav",
@@ -39,26 +30,43 @@ class AudioManager:
         'B': 0.08,
         'reponse_a': 1,
         'reponse_b': 1,
-        'question': 1,
-        'background': BACKGROUND_MUSIC_VOLUME
+        'question': 1
     }
     
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(AudioManager, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
-    
-    def __init__(self):
-        if self._initialized:
-            return
-            
-        self._initialized = True
-        self.sounds: Dict[str, pygame.mixer.Sound] = {}
+    def __init__(
+        self,
+        config: SimulationConfig,
+        time_manager: TimeManager,
+        assets: AssetCache,
+        rng: Optional[random.Random] = None
+    ):
+        """
+        Initialise le gestionnaire audio d'une simulation.
+        
+        Args:
+            config (SimulationConfig): Configuration de la simulation
+            time_manager (TimeManager): Horloge de la simulation, utilisée pour dater les événements
+            assets (AssetCache): Cache des sons déjà chargés
+            rng (Optional[random.Random]): Source de hasard pour le choix des variations
+        """
+        self.config = config
+        self.time_manager = time_manager
+        self.assets = assets
+        self.rng = rng or random.Random()
+        # Sons disponibles ; None quand ils ne sont pas joués (rendu sans fenêtre)
+        self.sounds: Dict[str, Optional[pygame.mixer.Sound]] = {}
         self.sound_events: List[SoundEvent] = []
         self.current_frame = 0
         self.is_recording = False
-        self.time_manager = TimeManager()
+        
+        # Sons sans variation de pitch
+        self.sound_paths = {
+            'reponse_a': config.reponse_a_voice_path,
+            'reponse_b': config.reponse_b_voice_path,
+            'question': config.question_sound_path,
+            'background': config.background_music_path
+        }
+        self.sound_volumes = {**self.SOUND_VOLUMES, 'background': config.background_music_volume}
         
         # Initialisation du mixer pygame
         pygame.mixer.init()
@@ -67,24 +75,33 @@ class AudioManager:
         # Chargement automatique des sons
         self.load_all_sounds()
         
-        # Génération des variations de pitch
-        self.generate_pitch_variations()
+        # Génération des variations de pitch (une seule fois par cache)
+        if not self.assets.pitch_variations_ready:
+            self.generate_pitch_variations()
+            self.assets.pitch_variations_ready = True
     
     def load_all_sounds(self) -> None:
-        """Charge tous les sons définis dans SOUND_PATHS et SOUND_VARIATION_PATHS"""
+        """Charge tous les sons du thème et ceux définis dans SOUND_VARIATION_PATHS"""
         # Chargement des sons sans variation
-        for name, path in self.SOUND_PATHS.items():
-            self.load_sound(name, path, self.SOUND_VOLUMES.get(name, 1.0))
+        for name, path in self.sound_paths.items():
+            self.load_sound(name, path, self.sound_volumes.get(name, 1.0))
             
         # Chargement des sons avec variation
         for name, path in self.SOUND_VARIATION_PATHS.items():
-            self.load_sound(name, path, self.SOUND_VOLUMES.get(name, 1.0))
+            self.load_sound(name, path, self.sound_volumes.get(name, 1.0))
     
     def load_sound(self, name: str, path: str, volume: float = 1.0) -> None:
         """Charge un son et le stocke dans le dictionnaire"""
         if name not in self.sounds:
+            if not self.config.visual:
+                # Rien n'est joué : inutile de décoder le son, il suffit qu'il existe pour le mixage
+                if path and os.path.isfile(path):
+                    self.sounds[name] = None
+                else:
+                    print(f"Erreur lors du chargement du son {name}: fichier introuvable ({path})")
+                return
             try:
-                sound = pygame.mixer.Sound(path)
+                sound = self.assets.sound(path)
                 sound.set_volume(volume)
                 self.sounds[name] = sound
             except Exception as e:
@@ -92,16 +109,16 @@ class AudioManager:
     
     def get_sound_path(self, name: str) -> Optional[str]:
         """Retourne le chemin du son demandé"""
-        return self.SOUND_PATHS.get(name)
+        return self.sound_paths.get(name)
     
     def get_sound_volume(self, name: str) -> float:
         """Retourne le volume du son demandé"""
-        return self.SOUND_VOLUMES.get(name, 1.0)
+        return self.sound_volumes.get(name, 1.0)
     
     def play_sound(self, name: str) -> None:
         """Joue un son et enregistre l'événement si l'enregistrement est actif"""
         if name in self.sounds:
-            if VISUAL:
+            if self.config.visual:
                 self.sounds[name].play()
             
             if self.is_recording:
@@ -146,6 +163,20 @@ class AudioManager:
         self.current_frame = 0
         self.is_recording = False
     
+    def snapshot_state(self) -> dict:
+        """Retourne le journal des événements sonores et l'état de l'enregistrement pour un instantané"""
+        return {
+            'sound_events': self.sound_events,
+            'current_frame': self.current_frame,
+            'is_recording': self.is_recording,
+        }
+    
+    def restore_state(self, state: dict) -> None:
+        """Reprend le journal et l'état de l'enregistrement d'un instantané"""
+        self.sound_events = state['sound_events']
+        self.current_frame = state['current_frame']
+        self.is_recording = state['is_recording']
+    
     def generate_pitch_variations(self) -> None:
         """Génère les variations de pitch pour tous les sons définis dans SOUND_VARIATION_PATHS"""
         pitch_variations = {
@@ -185,12 +216,8 @@ class AudioManager:
                     except Exception as e:
                         print(f"Erreur inattendue pour {sound_name}: {e}")
     
-    def get_random_sound_variation(self, sound_name: str) -> str:
-        """Retourne un chemin de son aléatoire parmi les variations disponibles"""
-        # Vérifier si le son est dans les sons avec variation
-        if sound_name not in self.SOUND_VARIATION_PATHS:
-            return self.SOUND_PATHS.get(sound_name)
-            
+    def get_sound_variations(self, sound_name: str) -> List[str]:
+        """Retourne les chemins de la version originale et des variations existantes d'un son"""
         base_path = self.SOUND_VARIATION_PATHS[sound_name]
         base_name = os.path.splitext(base_path)[0]
         variations = [base_path]  # Version originale
@@ -201,4 +228,19 @@ class AudioManager:
             if os.path.exists(variation_path):
                 variations.append(variation_path)
                 
-        return random.choice(variations) 
\ No newline at end of file
+        return variations
+    
+    def get_all_sound_paths(self) -> List[str]:
+        """Retourne tous les fichiers audio pouvant apparaître dans le mixage"""
+        paths = [path for path in self.sound_paths.values() if path]
+        for sound_name in self.SOUND_VARIATION_PATHS:
+            paths.extend(self.get_sound_variations(sound_name))
+        return paths
+    
+    def get_random_sound_variation(self, sound_name: str) -> str:
+        """Retourne un chemin de son aléatoire parmi les variations disponibles"""
+        # Vérifier si le son est dans les sons avec variation
+        if sound_name not in self.SOUND_VARIATION_PATHS:
+            return self.sound_paths.get(sound_name)
+            
+        return self.rng.choice(self.get_sound_variations(sound_name))
\ No newline at end of file
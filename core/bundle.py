@@ -0,0 +1,168 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import pygame
+import numpy as np
+from typing import Any, Dict, List
+from core.assets import AssetCache, BUNDLE_DIR
+from core.cache import file_digest
+from core.config import SimulationConfig
+
+MANIFEST_FILE = 'manifest.json'
+
+# Code qui produit les données d'un bundle : s'il change, les bundles sont ignorés
+GENERATOR_SOURCES = ('core/assets.py', 'core/bundle.py', 'utils/image.py')
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def generator_version() -> str:
+    """Empreinte du code qui décode et redimensionne les ressources."""
+    digest = hashlib.sha256()
+    for source in GENERATOR_SOURCES:
+        digest.update(file_digest(os.path.join(PROJECT_ROOT, source)).encode())
+    return digest.hexdigest()
+
+
+def write_bundle(assets: AssetCache, directory: str, theme: str) -> Dict[str, Any]:
+    """
+    Écrit les images et les sons décodés d'un cache dans un bundle.
+
+    Les images sont stockées en RGBA et les sons en mono float32 à 44,1 kHz,
+    dans des fichiers .npy lisibles par projection mémoire.
+
+    Args:
+        assets (AssetCache): Cache contenant les ressources du thème
+        directory (str): Dossier du bundle (remplacé s'il existe)
+        theme (str): Nom du thème
+
+    Returns:
+        Dict[str, Any]: Le manifeste écrit
+    """
+    temporary = f"{directory}.{os.getpid()}.tmp"
+    shutil.rmtree(temporary, ignore_errors=True)
+    os.makedirs(temporary)
+
+    images: List[Dict[str, Any]] = []
+    for key, surface in assets.images.items():
+        if surface is None:
+            continue
+        file = f"image-{len(images)}.npy"
+        width, height = surface.get_size()
+        pixels = np.frombuffer(pygame.image.tostring(surface, 'RGBA'), dtype=np.uint8)
+        np.save(os.path.join(temporary, file), pixels.reshape(height, width, 4))
+        images.append({
+            'key': list(key),
+            'file': file,
+            'width': width,
+            'height': height,
+            'alpha': surface.get_alpha(),
+            'digest': file_digest(key[1]),
+        })
+
+    audio: List[Dict[str, Any]] = []
+    for path, samples in assets.audio.items():
+        file = f"audio-{len(audio)}.npy"
+        np.save(os.path.join(temporary, file), np.asarray(samples, dtype=np.float32))
+        audio.append({
+            'path': path,
+            'file': file,
+            'sample_rate': assets.SAMPLE_RATE,
+            'digest': file_digest(path),
+        })
+
+    manifest = {
+        'theme': theme,
+        'generator': generator_version(),
+        'created_at': time.time(),
+        'images': images,
+        'audio': audio,
+    }
+    with open(os.path.join(temporary, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, indent=2)
+
+    shutil.rmtree(directory, ignore_errors=True)
+    os.rename(temporary, directory)
+    return manifest
+
+
+def load_bundle(assets: AssetCache, directory: str) -> int:
+    """
+    Charge dans un cache les ressources d'un bundle encore à jour.
+
+    Une ressource dont le fichier source a changé depuis la préparation est
+    ignorée : elle sera décodée normalement.
+
+    Args:
+        assets (AssetCache): Cache à remplir
+        directory (str): Dossier du bundle
+
+    Returns:
+        int: Nombre de ressources chargées
+    """
+    try:
+        with open(os.path.join(directory, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return 0
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"Bundle illisible {directory}: {e}")
+        return 0
+
+    if manifest.get('generator') != generator_version():
+        print(f"Bundle {directory} obsolète, relancez prepare_theme.py")
+        return 0
+
+    # Sans fenêtre, impossible de convertir au format de l'écran
+    has_display = pygame.display.get_surface() is not None
+    loaded = 0
+
+    for entry in manifest['images']:
+        key = tuple(entry['key'])
+        assets.refresh(key[1])
+        if key in assets.images or file_digest(key[1]) != entry['digest']:
+            continue
+        pixels = np.load(os.path.join(directory, entry['file']), mmap_mode='r')
+        surface = pygame.image.frombuffer(pixels, (entry['width'], entry['height']), 'RGBA')
+        surface = surface.convert_alpha() if has_display else surface.copy()
+        if entry['alpha'] is not None:
+            surface.set_alpha(entry['alpha'])
+        assets.images[key] = surface
+        loaded += 1
+
+    for entry in manifest['audio']:
+        path = entry['path']
+        assets.refresh(path)
+        if path in assets.audio or entry['sample_rate'] != assets.SAMPLE_RATE or file_digest(path) != entry['digest']:
+            continue
+        assets.audio[path] = np.load(os.path.join(directory, entry['file']), mmap_mode='r')
+        loaded += 1
+
+    return loaded
+
+
+def prepare_theme(config: SimulationConfig, bundle_dir: str = BUNDLE_DIR) -> Dict[str, Any]:
+    """
+    Décode et redimensionne toutes les ressources d'un thème, aux tailles
+    utilisées par le rendu pour cette configuration, puis écrit le bundle.
+
+    Args:
+        config (SimulationConfig): Configuration du rendu (thème, résolution, ...)
+        bundle_dir (str): Dossier des bundles
+
+    Returns:
+        Dict[str, Any]: Le manifeste écrit
+    """
+    from core.simulator import Simulator
+
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+    # Construire un simulateur charge exactement les images dont le rendu a besoin
+    assets = AssetCache(bundle_dir=None)
+    simulator = Simulator(config, assets)
+    assets.preload_audio(simulator.audio_manager.get_all_sound_paths())
+
+    os.makedirs(bundle_dir, exist_ok=True)
+    return write_bundle(assets, os.path.join(bundle_dir, config.theme), config.theme)
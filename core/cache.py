@@ -0,0 +1,247 @@
+import os
+import json
+import glob
+import shutil
+import hashlib
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from core.audio import AudioManager
+from core.config import SimulationConfig
+from scenes.layout import scene_path
+from utils.fonts import font_path
+
+CACHE_DIR = os.path.join("output", "cache")
+
+# Issue d'un job vis-à-vis du cache
+CACHE_MISS = 'miss'    # Tout a été rendu
+CACHE_AUDIO = 'audio'  # Vidéo réutilisée, audio régénéré puis fusionné
+CACHE_HIT = 'hit'      # Vidéo finale réutilisée telle quelle
+
+# Champs sans effet sur le résultat (le dossier des scènes compte via le contenu de la scène,
+# les infos de debug ne sont dessinées qu'après la capture de la frame)
+IGNORED_FIELDS = (
+    'output_dir', 'visual', 'scene_dir', 'snapshot_interval', 'snapshot_keep',
+    'debug', 'profile', 'profile_path',
+)
+
+# Champs qui n'influencent que la piste audio
+AUDIO_FIELDS = (
+    'background_music_path',
+    'background_music_volume',
+    'question_sound_path',
+    'reponse_a_voice_path',
+    'reponse_b_voice_path',
+)
+
+# Champs désignant un fichier : on hache son contenu plutôt que son chemin
+FILE_FIELDS = (
+    'background_image_path',
+    'particle_texture_path',
+    'reponse_a_image_path',
+    'reponse_b_image_path',
+    'background_music_path',
+    'question_sound_path',
+    'reponse_a_voice_path',
+    'reponse_b_voice_path',
+)
+
+# Code dont dépend le rendu, relatif à la racine du projet
+SOURCE_PATTERNS = ('*.py', 'core/*.py', 'physics/*.py', 'scenes/*.py', 'ui/*.py', 'utils/*.py')
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_file_digests: Dict[Tuple[str, int, int], str] = {}
+
+
+def file_digest(path: Optional[str]) -> Optional[str]:
+    """
+    Empreinte SHA-256 du contenu d'un fichier, recalculée seulement s'il a changé.
+
+    Args:
+        path (Optional[str]): Chemin du fichier
+
+    Returns:
+        Optional[str]: L'empreinte, ou None si le fichier n'existe pas
+    """
+    if not path or not os.path.isfile(path):
+        return None
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_digests:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        _file_digests[key] = digest.hexdigest()
+    return _file_digests[key]
+
+
+@lru_cache(maxsize=1)
+def code_version() -> str:
+    """Empreinte du code source de la simulation, calculée une fois par processus."""
+    digest = hashlib.sha256()
+    for pattern in SOURCE_PATTERNS:
+        for path in sorted(glob.glob(os.path.join(PROJECT_ROOT, pattern))):
+            digest.update(os.path.relpath(path, PROJECT_ROOT).encode())
+            digest.update(file_digest(path).encode())
+    return digest.hexdigest()
+
+
+def _hash(values: Dict[str, Any]) -> str:
+    return hashlib.sha256(json.dumps(values, sort_keys=True, default=str).encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class RenderKeys:
+    """Clés de cache d'un rendu"""
+    video: str  # Vidéo muette et événements sonores
+    audio: str  # Vidéo finale (vidéo + piste audio)
+
+    @classmethod
+    def from_config(cls, config: SimulationConfig) -> "RenderKeys":
+        """
+        Calcule les clés d'un rendu à partir de sa configuration (graine
+        comprise), de la version du code et du contenu des fichiers du thème,
+        des polices et de la scène de la bibliothèque.
+
+        La clé vidéo ignore tout ce qui ne sert qu'au mixage : changer
+        `music.wav` ou une voix ne fait que régénérer l'audio.
+
+        Args:
+            config (SimulationConfig): Configuration du rendu
+
+        Returns:
+            RenderKeys: Les clés
+        """
+        values = {}
+        for f in fields(config):
+            if f.name in IGNORED_FIELDS:
+                continue
+            value = getattr(config, f.name)
+            values[f.name] = file_digest(value) if f.name in FILE_FIELDS else value
+        if config.scene:
+            # Une scène de la bibliothèque compte par son contenu, comme les fichiers du thème
+            values['scene'] = file_digest(scene_path(config.scene_dir, config.scene))
+        # Les textes de la vidéo sont dessinés avec les polices du projet
+        values['fonts'] = [file_digest(font_path(bold=bold)) for bold in (False, True)]
+
+        video_values = {name: value for name, value in values.items() if name not in AUDIO_FIELDS}
+        video = _hash({'code': code_version(), 'config': video_values})
+
+        audio_values = {name: values[name] for name in AUDIO_FIELDS}
+        # Les variations de pitch sont dérivées de ces sons de base
+        audio_values['variations'] = {
+            name: file_digest(path) for name, path in AudioManager.SOUND_VARIATION_PATHS.items()
+        }
+        audio_values['volumes'] = AudioManager.SOUND_VOLUMES
+        audio = _hash({'video': video, 'audio': audio_values})
+        return cls(video=video, audio=audio)
+
+
+class RenderCache:
+    """
+    Cache des rendus, adressé par contenu.
+
+    `video/<clé>/` conserve la vidéo muette et les événements sonores d'une
+    simulation, `final/<clé>/` la vidéo finale. Les entrées sont écrites dans
+    un dossier temporaire puis renommées : un processus ne voit jamais une
+    entrée incomplète.
+    """
+
+    VIDEO_FILE = 'simulation.mp4'
+    EVENTS_FILE = 'sound_events.csv'
+    META_FILE = 'meta.json'
+
+    def __init__(self, cache_dir: str = CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _entry_dir(self, kind: str, key: str) -> str:
+        return os.path.join(self.cache_dir, kind, key)
+
+    def _read_meta(self, directory: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(directory, self.META_FILE)) as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def _store(self, kind: str, key: str, files: Dict[str, str], meta: Dict[str, Any]) -> None:
+        """Copie des fichiers dans une nouvelle entrée du cache."""
+        target = self._entry_dir(kind, key)
+        if os.path.isdir(target):
+            return
+        temporary = f"{target}.{os.getpid()}.tmp"
+        os.makedirs(temporary, exist_ok=True)
+        try:
+            for name, source in files.items():
+                shutil.copyfile(source, os.path.join(temporary, name))
+            with open(os.path.join(temporary, self.META_FILE), 'w') as f:
+                json.dump(meta, f, indent=2)
+            os.rename(temporary, target)
+        except OSError as e:
+            # Entrée déjà écrite par un autre processus, ou disque plein : le rendu reste valide
+            print(f"Impossible d'écrire l'entrée {kind}/{key} du cache : {e}")
+            shutil.rmtree(temporary, ignore_errors=True)
+
+    def get_final(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retourne la description de la vidéo finale en cache, ou None."""
+        return self._read_meta(self._entry_dir('final', key))
+
+    def get_video(self, key: str) -> Optional[Dict[str, Any]]:
+        """Retourne la description de la vidéo muette en cache, ou None."""
+        return self._read_meta(self._entry_dir('video', key))
+
+    def store_final(self, key: str, output_path: str, frames: int) -> None:
+        name = os.path.basename(output_path)
+        self._store('final', key, {name: output_path}, {'file': name, 'frames': frames})
+
+    def store_video(self, key: str, video_path: str, events_path: str, frames: int, rng_state: Tuple) -> None:
+        """
+        Conserve la vidéo muette et les événements sonores d'une simulation.
+
+        `rng_state` est l'état du hasard du simulateur à la fin de la partie :
+        le mixage le reprend pour tirer les mêmes variations de sons qu'un
+        rendu complet.
+        """
+        self._store(
+            'video', key,
+            {self.VIDEO_FILE: video_path, self.EVENTS_FILE: events_path},
+            {'frames': frames, 'rng': rng_state}
+        )
+
+    @staticmethod
+    def video_rng_state(meta: Dict[str, Any]) -> Optional[Tuple]:
+        """Retourne l'état du hasard d'une vidéo en cache (None si absent), au format de `random.setstate`."""
+        state: Optional[List] = meta.get('rng')
+        if state is None:
+            return None
+        # Le JSON a transformé les tuples en listes
+        version, internal, gauss_next = state
+        return version, tuple(internal), gauss_next
+
+    def restore_final(self, key: str, meta: Dict[str, Any], output_dir: str) -> str:
+        """
+        Copie la vidéo finale en cache dans le dossier de sortie.
+
+        Returns:
+            str: Chemin de la vidéo copiée
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        output_path = os.path.join(output_dir, meta['file'])
+        shutil.copyfile(os.path.join(self._entry_dir('final', key), meta['file']), output_path)
+        return output_path
+
+    def restore_video(self, key: str, output_dir: str) -> Tuple[str, str]:
+        """
+        Copie la vidéo muette et les événements sonores en cache dans le dossier de sortie.
+
+        Returns:
+            Tuple[str, str]: Chemins de la vidéo et du fichier d'événements copiés
+        """
+        os.makedirs(output_dir, exist_ok=True)
+        paths = []
+        for name in (self.VIDEO_FILE, self.EVENTS_FILE):
+            path = os.path.join(output_dir, name)
+            shutil.copyfile(os.path.join(self._entry_dir('video', key), name), path)
+            paths.append(path)
+        return paths[0], paths[1]
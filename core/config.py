@@ -0,0 +1,165 @@
+import dataclasses
+from dataclasses import dataclass, fields
+from types import ModuleType
+from typing import Optional, Tuple
+
+Color = Tuple[int, ...]
+
+# Fichiers d'un thème, relatifs à assets/themes/{theme}/
+THEME_FILES = {
+    'background_image_path': 'bg.png',
+    'background_music_path': 'music.wav',
+    'question_sound_path': 'question.wav',
+    'reponse_a_image_path': 'a.png',
+    'reponse_a_voice_path': 'a.wav',
+    'reponse_b_image_path': 'b.png',
+    'reponse_b_voice_path': 'b.wav',
+}
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    """
+    Configuration d'une exécution de la simulation.
+
+    Chaque champ correspond à la constante du même nom (en majuscules) de
+    `config.py`, qui reste la source des valeurs par défaut. Plusieurs
+    simulations configurées différemment peuvent ainsi cohabiter dans un même
+    processus.
+    """
+    # Fenêtre
+    debug: bool
+    temps_limite: float
+    ratio: float
+    width: int
+    height: int
+    fps: int
+    visual: bool
+    profile: bool
+    profile_path: Optional[str]
+
+    # Thème
+    theme: str
+    output_dir: str
+    question: str
+    reponse_a: str
+    reponse_b: str
+    cuve_a_color_start: Color
+    cuve_a_color_end: Color
+    cuve_b_color_start: Color
+    cuve_b_color_end: Color
+
+    # Image de fond
+    background_image_path: Optional[str]
+    background_full_screen: bool
+    background_opacity: float
+    background_prebake_fade: bool
+
+    # Particules
+    particle_radius: int
+    emit_interval: float
+    golden_particle_frequency: int
+    particle_texture_path: Optional[str]
+
+    # Physique
+    gravity: Tuple[float, float]
+    particle_friction: float
+    particle_elasticity: float
+
+    # Musique de fond
+    background_music_path: Optional[str]
+    background_music_volume: float
+
+    # Question
+    question_sound_path: Optional[str]
+    question_font_size: int
+    question_color: Color
+    question_position: Tuple[int, int]
+    question_bg_color: Color
+
+    # Réponses
+    reponse_circle: bool
+    reponse_a_image_path: Optional[str]
+    reponse_a_voice_path: Optional[str]
+    reponse_a_color: Color
+    reponse_b_image_path: Optional[str]
+    reponse_b_voice_path: Optional[str]
+    reponse_b_color: Color
+    reponse_font_size: int
+    reponse_position: Tuple[int, int]
+    reponse_zoom: bool
+    reponse_zoom_min: float
+    reponse_zoom_max: float
+    reponse_zoom_speed: float
+
+    # Obstacles
+    obstacle_friction: float
+    obstacle_elasticity: float
+    num_obstacles: int
+    num_circles: int
+    num_rotating: int
+    num_pivot: int
+    scene: Optional[str]
+    scene_dir: str
+
+    # Cuves
+    cuve_friction: float
+    cuve_hauteur: int
+    cuve_largeur: int
+    cuve_font_size: int
+
+    # Jeu
+    seuil_victoire: int
+    delai_disparition: float
+    delai_arret: float
+    stuck_delay: Optional[float]
+    stuck_speed: float
+    stuck_nudge: float
+    winner: Optional[str]
+    seed: Optional[int]
+    snapshot_interval: Optional[float]
+    snapshot_keep: int
+
+    @classmethod
+    def from_module(cls, module: ModuleType, **overrides) -> "SimulationConfig":
+        """
+        Construit une configuration à partir des constantes d'un module.
+
+        Args:
+            module (ModuleType): Module de configuration (généralement `config`)
+            **overrides: Valeurs à remplacer, par nom de champ
+
+        Returns:
+            SimulationConfig: La configuration construite
+        """
+        values = {f.name: getattr(module, f.name.upper()) for f in fields(cls)}
+        theme = overrides.get('theme')
+        if theme is not None and theme != values['theme']:
+            values.update(cls._theme_values(theme))
+        values.update(overrides)
+        return cls(**values)
+
+    @staticmethod
+    def _theme_values(theme: str) -> dict:
+        """Recalcule les chemins qui dépendent du thème."""
+        values = {'theme': theme, 'output_dir': f"output/{theme}"}
+        for name, filename in THEME_FILES.items():
+            values[name] = f"assets/themes/{theme}/{filename}"
+        return values
+
+    def with_theme(self, theme: str, **overrides) -> "SimulationConfig":
+        """
+        Retourne une copie de la configuration pour un autre thème.
+
+        Args:
+            theme (str): Nom du dossier du thème dans assets/themes
+            **overrides: Autres valeurs à remplacer (question, réponses, ...)
+
+        Returns:
+            SimulationConfig: La nouvelle configuration
+        """
+        return self.replace(**{**self._theme_values(theme), **overrides})
+
+    def replace(self, **changes) -> "SimulationConfig":
+        """Retourne une copie de la configuration avec les champs modifiés."""
+        return dataclasses.replace(self, **changes)
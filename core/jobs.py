@@ -0,0 +1,255 @@
+import json
+import time
+import random
+import pygame
+from dataclasses import dataclass, field, fields, asdict
+from typing import Any, Callable, Dict, List, Optional
+from config import create_config
+from core.assets import AssetCache
+from core.audio import AudioManager
+from core.cache import RenderCache, RenderKeys, CACHE_MISS, CACHE_AUDIO, CACHE_HIT
+from core.config import SimulationConfig
+from core.simulator import Simulator
+from core.time import TimeManager
+from core.video_processor import VideoProcessor
+
+# Étapes d'un rendu, dans l'ordre
+STAGE_SIMULATING = 'simulating'
+STAGE_ENCODING = 'encoding'
+STAGE_MUXING = 'muxing'
+
+CONFIG_FIELDS = {f.name for f in fields(SimulationConfig)}
+
+
+def parse_overrides(assignments: List[str]) -> Dict[str, Any]:
+    """
+    Interprète des valeurs de configuration passées en ligne de commande.
+
+    Args:
+        assignments (List[str]): Liste de "champ=valeur" (valeur en JSON si possible)
+
+    Returns:
+        Dict[str, Any]: Valeurs par nom de champ
+    """
+    overrides = {}
+    for assignment in assignments:
+        name, _, value = assignment.partition('=')
+        try:
+            overrides[name] = json.loads(value)
+        except json.JSONDecodeError:
+            overrides[name] = value
+    return overrides
+
+
+@dataclass
+class RenderJob:
+    """Demande de rendu d'une vidéo"""
+    job_id: str
+    overrides: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RenderJob":
+        """
+        Construit un job à partir de sa description JSON.
+
+        Args:
+            data (Dict[str, Any]): {"id": ..., "config": {champ: valeur, ...}}
+
+        Returns:
+            RenderJob: Le job
+
+        Raises:
+            ValueError: Si un champ de configuration est inconnu
+        """
+        overrides = dict(data.get('config', {}))
+        unknown = set(overrides) - CONFIG_FIELDS
+        if unknown:
+            raise ValueError(f"Champs de configuration inconnus : {', '.join(sorted(unknown))}")
+        job_id = str(data.get('id') or overrides.get('theme') or 'job')
+        return cls(job_id=job_id, overrides=overrides)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Retourne la description JSON du job."""
+        return {'id': self.job_id, 'config': self.overrides}
+
+    def build_config(self, base: Optional[SimulationConfig] = None) -> SimulationConfig:
+        """
+        Construit la configuration du job.
+
+        Args:
+            base (Optional[SimulationConfig]): Configuration de départ (défaut : config.py)
+
+        Returns:
+            SimulationConfig: La configuration avec les valeurs du job
+        """
+        config = base or create_config()
+        # Le JSON ne connaît pas les tuples (couleurs, positions, gravité)
+        overrides = {
+            name: tuple(value) if isinstance(value, list) else value
+            for name, value in self.overrides.items()
+        }
+        theme = overrides.pop('theme', None)
+        if theme is not None:
+            config = config.with_theme(theme)
+        return config.replace(**overrides)
+
+
+@dataclass
+class RenderResult:
+    """Résultat et durées d'un rendu"""
+    job_id: str
+    output_path: Optional[str] = None
+    frames: int = 0
+    overhead_seconds: float = 0.0
+    simulation_seconds: float = 0.0
+    encode_seconds: float = 0.0
+    mux_seconds: float = 0.0
+    cache: str = CACHE_MISS
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    def summary(self) -> str:
+        """Retourne un résumé lisible des durées."""
+        if self.error:
+            return f"Job {self.job_id} en échec : {self.error}"
+        if self.cache == CACHE_HIT:
+            return f"Job {self.job_id} : vidéo inchangée, reprise du cache en {self.overhead_seconds:.2f}s"
+        if self.cache == CACHE_AUDIO:
+            return (
+                f"Job {self.job_id} : vidéo reprise du cache | "
+                f"audio {self.encode_seconds:.2f}s | fusion {self.mux_seconds:.2f}s"
+            )
+        return (
+            f"Job {self.job_id} : préparation {self.overhead_seconds:.2f}s | "
+            f"simulation {self.simulation_seconds:.2f}s ({self.frames} frames) | "
+            f"audio {self.encode_seconds:.2f}s | fusion {self.mux_seconds:.2f}s"
+        )
+
+
+def get_screen(width: int, height: int) -> pygame.Surface:
+    """
+    Retourne la surface d'affichage, (re)créée seulement si la taille change.
+
+    Args:
+        width (int): Largeur de l'écran
+        height (int): Hauteur de l'écran
+
+    Returns:
+        pygame.Surface: Surface d'affichage cachée
+    """
+    screen = pygame.display.get_surface()
+    if screen is None or screen.get_size() != (width, height):
+        screen = pygame.display.set_mode((width, height), pygame.HIDDEN)
+    return screen
+
+
+def render_job(
+    job: RenderJob,
+    assets: AssetCache,
+    on_stage: Optional[Callable[[str], None]] = None,
+    cache: Optional[RenderCache] = None
+) -> RenderResult:
+    """
+    Exécute un rendu complet : simulation, génération de l'audio et fusion.
+
+    Avec un cache, les étapes dont les entrées n'ont pas changé sont
+    sautées : vidéo finale copiée telle quelle, ou vidéo muette reprise et
+    seul l'audio régénéré (par exemple quand seul `music.wav` a changé),
+    sans construire de simulateur. Le mixage reprend alors l'état du hasard
+    conservé avec la vidéo : mêmes variations de sons qu'un rendu complet.
+
+    Args:
+        job (RenderJob): Le job à exécuter
+        assets (AssetCache): Cache des ressources partagé entre les jobs
+        on_stage (Optional[Callable[[str], None]]): Appelé au début de chaque étape
+        cache (Optional[RenderCache]): Cache des rendus précédents
+
+    Returns:
+        RenderResult: Chemin de la vidéo finale et durées de chaque étape
+
+    Raises:
+        Exception: Toute erreur d'une étape est propagée à l'appelant
+    """
+    def stage(name: str):
+        if on_stage:
+            on_stage(name)
+
+    result = RenderResult(job_id=job.job_id)
+
+    # Préparation : configuration, scène, ressources
+    start = time.perf_counter()
+    config = job.build_config()
+    if config.seed is None:
+        # Sans graine, chaque rendu est une partie différente : rien à reprendre du cache
+        cache = None
+    keys = RenderKeys.from_config(config) if cache else None
+
+    if cache:
+        final = cache.get_final(keys.audio)
+        if final is not None:
+            result.output_path = cache.restore_final(keys.audio, final, config.output_dir)
+            result.frames = final['frames']
+            result.cache = CACHE_HIT
+            result.overhead_seconds = time.perf_counter() - start
+            return result
+
+    video = cache.get_video(keys.video) if cache else None
+    rng_state = RenderCache.video_rng_state(video) if video is not None else None
+    simulator = None
+    try:
+        if rng_state is not None:
+            video_path, sound_events_path = cache.restore_video(keys.video, config.output_dir)
+            # Mixage seul : les sons du thème et le hasard de la fin de la partie suffisent
+            assets.load_theme_bundle(config.theme)
+            rng = random.Random()
+            rng.setstate(rng_state)
+            audio_manager = AudioManager(config, TimeManager(fps=config.fps), assets, rng)
+            processor = VideoProcessor(audio_manager, config, assets)
+            result.frames = video['frames']
+            result.cache = CACHE_AUDIO
+            result.overhead_seconds = time.perf_counter() - start
+        else:
+            # L'écran d'abord : les images du thème sont converties à son format
+            screen = get_screen(config.width, config.height)
+            simulator = Simulator(config, assets)
+            processor = simulator.video_processor
+            simulator.start()
+            result.overhead_seconds = time.perf_counter() - start
+
+            # Simulation et enregistrement des frames
+            stage(STAGE_SIMULATING)
+            start = time.perf_counter()
+            simulator.render(screen)
+            sound_events_path = simulator.finish_recording()
+            if simulator.record_manager.error is not None:
+                raise RuntimeError(f"Enregistrement vidéo incomplet : {simulator.record_manager.error}")
+            video_path = simulator.record_manager.get_video_path()
+            result.frames = simulator.record_manager.get_frame_count()
+            result.simulation_seconds = time.perf_counter() - start
+            if cache:
+                cache.store_video(keys.video, video_path, sound_events_path, result.frames, simulator.rng.getstate())
+
+        # Génération de la piste audio
+        stage(STAGE_ENCODING)
+        start = time.perf_counter()
+        audio_path = processor.encode_audio(sound_events_path)
+        result.encode_seconds = time.perf_counter() - start
+
+        # Fusion vidéo/audio
+        stage(STAGE_MUXING)
+        start = time.perf_counter()
+        result.output_path = processor.mux(audio_path, video_path)
+        result.mux_seconds = time.perf_counter() - start
+        if cache:
+            cache.store_final(keys.audio, result.output_path, result.frames)
+    finally:
+        # Même en cas d'erreur : ne pas laisser de processus ffmpeg ni de fichier ouverts
+        # (un worker persistant enchaîne les jobs et les nouvelles tentatives)
+        if simulator is not None:
+            if simulator.record_manager.is_recording():
+                simulator.record_manager.stop_recording()
+            simulator.profiler.close()
+
+    return result
@@ -0,0 +1,157 @@
+import os
+import json
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+class FrameProfiler:
+    """
+    Mesure la durée de chaque phase d'une frame (émission, physique, dessin
+    de chaque couche, capture, encodage...).
+
+    Usage :
+        start = profiler.start()
+        ...
+        profiler.stop('physics', start)
+
+    Des compteurs (`count`) s'ajoutent aux durées pour les événements à
+    dénombrer (allocations, réutilisations...).
+
+    Désactivé, `start` et `stop` reviennent immédiatement : le coût se limite
+    à deux appels de méthode par phase.
+    """
+
+    def __init__(self, enabled: bool = False, window: int = 300, export_path: Optional[str] = None):
+        """
+        Args:
+            enabled (bool): Active les mesures
+            window (int): Nombre de frames prises en compte dans les statistiques glissantes
+            export_path (Optional[str]): Fichier JSON lines où écrire les mesures de chaque frame
+        """
+        self.enabled = enabled
+        self.window = window
+        self.export_path = export_path
+        self.frame_number = 0
+        self.frame_start = 0
+        self.current: Dict[str, int] = {}
+        self.history: Dict[str, Deque[int]] = {}
+        self.current_counts: Dict[str, int] = {}
+        self.counters: Dict[str, int] = {}  # Totaux depuis le début de la mesure
+        self.export_file = None
+
+        if enabled and export_path:
+            directory = os.path.dirname(export_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.export_file = open(export_path, 'w')
+
+    def start(self) -> int:
+        """Retourne l'instant de début d'une phase (0 si désactivé)."""
+        if not self.enabled:
+            return 0
+        return time.perf_counter_ns()
+
+    def stop(self, name: str, start: int) -> None:
+        """
+        Ajoute la durée écoulée depuis `start` à la phase `name` de la frame courante.
+
+        Args:
+            name (str): Nom de la phase
+            start (int): Valeur retournée par `start()`
+        """
+        if not self.enabled:
+            return
+        elapsed = time.perf_counter_ns() - start
+        self.current[name] = self.current.get(name, 0) + elapsed
+
+    def lap(self, name: str, start: int) -> int:
+        """
+        Termine la phase `name` et retourne le début de la suivante.
+
+        Args:
+            name (str): Nom de la phase terminée
+            start (int): Début de la phase terminée
+
+        Returns:
+            int: Début de la phase suivante (0 si désactivé)
+        """
+        if not self.enabled:
+            return 0
+        now = time.perf_counter_ns()
+        self.current[name] = self.current.get(name, 0) + now - start
+        return now
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Ajoute `amount` au compteur `name` (frame courante et total).
+
+        Args:
+            name (str): Nom du compteur
+            amount (int): Nombre d'événements
+        """
+        if not self.enabled:
+            return
+        self.current_counts[name] = self.current_counts.get(name, 0) + amount
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def begin_frame(self) -> None:
+        """Démarre la mesure d'une nouvelle frame."""
+        if not self.enabled:
+            return
+        self.current = {}
+        self.current_counts = {}
+        self.frame_start = time.perf_counter_ns()
+
+    def end_frame(self) -> None:
+        """Termine la frame courante : met à jour les statistiques et l'export."""
+        if not self.enabled:
+            return
+        self.current['frame'] = time.perf_counter_ns() - self.frame_start
+        for name, duration in self.current.items():
+            if name not in self.history:
+                self.history[name] = deque(maxlen=self.window)
+            self.history[name].append(duration)
+
+        if self.export_file is not None:
+            record = {'frame': self.frame_number, 'ns': self.current}
+            if self.current_counts:
+                record['counts'] = self.current_counts
+            self.export_file.write(json.dumps(record) + '\n')
+        self.frame_number += 1
+
+    def stats(self) -> Dict[str, Tuple[float, float, float]]:
+        """
+        Statistiques glissantes de chaque phase.
+
+        Returns:
+            Dict[str, Tuple[float, float, float]]: Par phase, (p50, p95, max) en millisecondes
+        """
+        stats = {}
+        for name, durations in self.history.items():
+            values = sorted(durations)
+            count = len(values)
+            stats[name] = (
+                values[count // 2] / 1e6,
+                values[min(count - 1, int(count * 0.95))] / 1e6,
+                values[-1] / 1e6,
+            )
+        return stats
+
+    def format_stats(self) -> List[str]:
+        """Retourne une ligne lisible par phase, la frame complète en premier,
+        puis une ligne par compteur."""
+        stats = self.stats()
+        lines = []
+        for name in sorted(stats, key=lambda name: (name != 'frame', name)):
+            p50, p95, peak = stats[name]
+            lines.append(f"{name:<16} p50 {p50:6.2f} | p95 {p95:6.2f} | max {peak:6.2f} ms")
+        for name in sorted(self.counters):
+            lines.append(f"{name:<16} {self.counters[name]}")
+        return lines
+
+    def close(self) -> None:
+        """Ferme le fichier d'export."""
+        if self.export_file is not None:
+            self.export_file.close()
+            self.export_file = None
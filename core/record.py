@@ -9,30 +9,32 @@ import subprocess
 from typing import Optional, Tuple
 from core.audio import AudioManager
 from core.time import TimeManager
+from core.config import SimulationConfig
+from core.profiler import FrameProfiler
 import time
-from config import VISUAL, FPS, TEMPS_LIMITE, DELAI_ARRET, OUTPUT_DIR
 from scipy import signal  # Ajout de l'import pour le rééchantillonnage
 
 class RecordManager:
-    def __init__(self, width: int, height: int, fps: int = FPS):
+    def __init__(self, config: SimulationConfig, profiler: Optional[FrameProfiler] = None):
         """
         Initialise le gestionnaire d'enregistrement.
         
         Args:
-            width (int): Largeur de la vidéo
-            height (int): Hauteur de la vidéo
-            fps (int): Images par seconde
+            config (SimulationConfig): Configuration de la simulation (dimensions, FPS, durée, dossier de sortie)
+            profiler (Optional[FrameProfiler]): Mesure la capture et l'encodage de chaque frame
         """
-        self.width = width
-        self.height = height
-        self.fps = fps
-        self.max_frames = FPS * TEMPS_LIMITE + FPS * DELAI_ARRET
+        self.profiler = profiler or FrameProfiler()
+        self.width = config.width
+        self.height = config.height
+        self.fps = config.fps
+        self.max_frames = config.fps * config.temps_limite + config.fps * config.delai_arret
         self.writer = None
         self.recording = False
         self.frame_count = 0
         self.recording_started = False
-        self.output_dir = OUTPUT_DIR
+        self.output_dir = config.output_dir
         self.video_path = None
+        self.error: Optional[Exception] = None  # Première erreur d'écriture rencontrée
         
         # Créer le dossier de sortie s'il n'existe pas
         if not os.path.exists(self.output_dir):
@@ -68,6 +70,7 @@ class RecordManager:
             self.recording = True
             self.frame_count = 0
             self.recording_started = False
+            self.error = None
     
     def record_frame(self, screen: pygame.Surface) -> bool:
         """
@@ -90,8 +93,10 @@ class RecordManager:
                 print(f"FPS: {self.fps}")
             
             # Convertir la surface en tableau numpy
+            start = self.profiler.start()
             frame = pygame.surfarray.array3d(screen)
             frame = frame.transpose([1, 0, 2])
+            self.profiler.stop('capture', start)
             
             # Vérifier que la frame n'est pas vide
             if frame.size == 0:
@@ -105,7 +110,10 @@ class RecordManager:
             
             # Enregistrer la frame
             try:
+                # Bloque tant que l'encodeur n'a pas accepté la frame
+                start = self.profiler.start()
                 self.writer.append_data(frame)
+                self.profiler.stop('encode', start)
                 self.frame_count += 1
                 
                 # Mettre à jour le temps de la simulation en fonction du nombre de frames
@@ -114,6 +122,7 @@ class RecordManager:
                     print(f"Frame {self.frame_count} enregistrée (temps: {simulation_time:.2f}s)")
             except Exception as e:
                 print(f"Erreur lors de l'enregistrement de la frame {self.frame_count}: {e}")
+                self.error = self.error or e
                 import gc
                 gc.collect()
                 return True
@@ -126,6 +135,7 @@ class RecordManager:
             
         except Exception as e:
             print(f"Erreur lors de l'enregistrement de la frame : {e}")
+            self.error = self.error or e
             import traceback
             traceback.print_exc()
             return False
@@ -0,0 +1,411 @@
+import os
+import json
+import time
+import socket
+import sqlite3
+import traceback
+import multiprocessing
+from typing import Any, Dict, List, Optional
+from core.cache import RenderCache, CACHE_DIR
+from core.jobs import RenderJob, render_job, STAGE_SIMULATING, STAGE_ENCODING, STAGE_MUXING
+
+# États d'un job
+STATE_QUEUED = 'queued'
+STATE_SIMULATING = STAGE_SIMULATING
+STATE_ENCODING = STAGE_ENCODING
+STATE_MUXING = STAGE_MUXING
+STATE_DONE = 'done'
+STATE_FAILED = 'failed'
+ACTIVE_STATES = (STATE_SIMULATING, STATE_ENCODING, STATE_MUXING)
+STATES = (STATE_QUEUED,) + ACTIVE_STATES + (STATE_DONE, STATE_FAILED)
+
+# Pseudo-étape mesurée entre la réservation d'un job et le début de la simulation
+STAGE_SETUP = 'setup'
+
+# Erreurs qui ne disparaîtront pas en réessayant (configuration invalide, ...)
+PERMANENT_ERRORS = (ValueError, TypeError, KeyError)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    spec TEXT NOT NULL,
+    state TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL DEFAULT 3,
+    worker TEXT,
+    output_path TEXT,
+    cache TEXT,
+    error TEXT,
+    available_at REAL NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, available_at, id);
+CREATE TABLE IF NOT EXISTS stage_stats (
+    job_id INTEGER NOT NULL REFERENCES jobs (id),
+    attempt INTEGER NOT NULL,
+    stage TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    ok INTEGER NOT NULL,
+    finished_at REAL NOT NULL
+);
+"""
+
+
+def worker_id() -> str:
+    """Identifiant du processus courant, sous la forme hôte:pid."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def is_worker_alive(worker: Optional[str]) -> bool:
+    """Indique si le processus identifié par `worker` tourne encore sur cette machine."""
+    if not worker:
+        return False
+    host, _, pid = worker.rpartition(':')
+    if host != socket.gethostname():
+        return True  # Impossible à vérifier depuis cette machine
+    try:
+        os.kill(int(pid), 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, ValueError):
+        return True
+    return True
+
+
+class RenderQueue:
+    """
+    File de rendus stockée dans un fichier SQLite local.
+
+    Les jobs passent par les états queued → simulating → encoding → muxing
+    → done, ou failed une fois leurs tentatives épuisées. Plusieurs processus
+    peuvent partager la même file : la réservation d'un job est atomique.
+    """
+
+    def __init__(self, path: str, retry_delay: float = 30.0):
+        """
+        Ouvre (et crée si besoin) la file.
+
+        Args:
+            path (str): Chemin du fichier SQLite
+            retry_delay (float): Attente avant de réessayer un job, multipliée par le nombre de tentatives
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.retry_delay = retry_delay
+        self.connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def add(self, job: RenderJob, max_attempts: int = 3) -> int:
+        """
+        Ajoute un job à la file.
+
+        Args:
+            job (RenderJob): Le job à rendre
+            max_attempts (int): Nombre maximal de tentatives
+
+        Returns:
+            int: Identifiant du job dans la file
+        """
+        now = time.time()
+        cursor = self.connection.execute(
+            "INSERT INTO jobs (name, spec, max_attempts, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            (job.job_id, json.dumps(job.to_dict()), max_attempts, now, now)
+        )
+        return cursor.lastrowid
+
+    def claim(self, worker: Optional[str] = None) -> Optional[sqlite3.Row]:
+        """
+        Réserve le plus ancien job disponible.
+
+        Args:
+            worker (Optional[str]): Identifiant du processus qui réserve (défaut : courant)
+
+        Returns:
+            Optional[sqlite3.Row]: Le job réservé, ou None si la file est vide
+        """
+        worker = worker or worker_id()
+        now = time.time()
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = self.connection.execute(
+                "SELECT id FROM jobs WHERE state = ? AND available_at <= ? ORDER BY id LIMIT 1",
+                (STATE_QUEUED, now)
+            ).fetchone()
+            if row is None:
+                self.connection.execute("COMMIT")
+                return None
+            self.connection.execute(
+                "UPDATE jobs SET state = ?, attempts = attempts + 1, worker = ?, error = NULL, updated_at = ? "
+                "WHERE id = ?",
+                (STATE_SIMULATING, worker, now, row['id'])
+            )
+            self.connection.execute("COMMIT")
+        except Exception:
+            self.connection.execute("ROLLBACK")
+            raise
+        return self.get(row['id'])
+
+    def get(self, job_id: int) -> Optional[sqlite3.Row]:
+        return self.connection.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+
+    def set_state(self, job_id: int, state: str) -> None:
+        """Passe un job réservé à l'étape suivante."""
+        self.connection.execute(
+            "UPDATE jobs SET state = ?, updated_at = ? WHERE id = ?",
+            (state, time.time(), job_id)
+        )
+
+    def complete(self, job_id: int, output_path: str, cache: Optional[str] = None) -> None:
+        """Marque un job comme terminé, avec son issue vis-à-vis du cache des rendus."""
+        self.connection.execute(
+            "UPDATE jobs SET state = ?, output_path = ?, cache = ?, worker = NULL, updated_at = ? WHERE id = ?",
+            (STATE_DONE, output_path, cache, time.time(), job_id)
+        )
+
+    def fail(self, job_id: int, error: str, transient: bool = True) -> str:
+        """
+        Enregistre l'échec d'une tentative.
+
+        Un échec transitoire remet le job dans la file tant qu'il lui reste
+        des tentatives ; sinon le job passe à l'état failed.
+
+        Args:
+            job_id (int): Identifiant du job
+            error (str): Description de l'erreur
+            transient (bool): False si réessayer est inutile
+
+        Returns:
+            str: Nouvel état du job
+        """
+        job = self.get(job_id)
+        now = time.time()
+        if transient and job['attempts'] < job['max_attempts']:
+            state, available_at = STATE_QUEUED, now + self.retry_delay * job['attempts']
+        else:
+            state, available_at = STATE_FAILED, job['available_at']
+        self.connection.execute(
+            "UPDATE jobs SET state = ?, error = ?, worker = NULL, available_at = ?, updated_at = ? WHERE id = ?",
+            (state, error, available_at, now, job_id)
+        )
+        return state
+
+    def record_stage(self, job_id: int, attempt: int, stage: str, seconds: float, ok: bool) -> None:
+        """Enregistre la durée d'une étape d'un job."""
+        self.connection.execute(
+            "INSERT INTO stage_stats (job_id, attempt, stage, seconds, ok, finished_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (job_id, attempt, stage, seconds, int(ok), time.time())
+        )
+
+    def recover(self) -> List[int]:
+        """
+        Remet en file les jobs abandonnés par un processus qui n'existe plus
+        (plantage, machine redémarrée, ...).
+
+        Returns:
+            List[int]: Identifiants des jobs récupérés
+        """
+        placeholders = ', '.join('?' for _ in ACTIVE_STATES)
+        rows = self.connection.execute(
+            f"SELECT id, worker FROM jobs WHERE state IN ({placeholders})", ACTIVE_STATES
+        ).fetchall()
+        recovered = []
+        for row in rows:
+            if not is_worker_alive(row['worker']):
+                self.fail(row['id'], f"Worker {row['worker']} interrompu", transient=True)
+                recovered.append(row['id'])
+        return recovered
+
+    def retry_failed(self) -> int:
+        """Remet en file tous les jobs en échec, avec un nouveau quota de tentatives."""
+        cursor = self.connection.execute(
+            "UPDATE jobs SET state = ?, attempts = 0, available_at = 0, updated_at = ? WHERE state = ?",
+            (STATE_QUEUED, time.time(), STATE_FAILED)
+        )
+        return cursor.rowcount
+
+    def pending_count(self) -> int:
+        """Nombre de jobs pas encore terminés (en file ou en cours)."""
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM jobs WHERE state NOT IN (?, ?)", (STATE_DONE, STATE_FAILED)
+        ).fetchone()[0]
+
+    def counts(self) -> Dict[str, int]:
+        """Nombre de jobs par état."""
+        counts = {state: 0 for state in STATES}
+        for row in self.connection.execute("SELECT state, COUNT(*) AS n FROM jobs GROUP BY state"):
+            counts[row['state']] = row['n']
+        return counts
+
+    def cache_counts(self) -> Dict[str, int]:
+        """Nombre de jobs terminés par issue du cache (hit, audio, miss)."""
+        return {
+            row['cache']: row['n'] for row in self.connection.execute(
+                "SELECT cache, COUNT(*) AS n FROM jobs WHERE state = ? AND cache IS NOT NULL GROUP BY cache",
+                (STATE_DONE,)
+            )
+        }
+
+    def stage_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Débit de chaque étape.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Par étape : nombre d'exécutions, d'échecs,
+                durée totale et moyenne des exécutions réussies
+        """
+        stats = {}
+        for row in self.connection.execute(
+            "SELECT stage, COUNT(*) AS runs, SUM(1 - ok) AS failures, "
+            "SUM(CASE WHEN ok THEN seconds ELSE 0 END) AS total, "
+            "AVG(CASE WHEN ok THEN seconds END) AS mean "
+            "FROM stage_stats GROUP BY stage"
+        ):
+            stats[row['stage']] = {
+                'runs': row['runs'],
+                'failures': row['failures'],
+                'total_seconds': row['total'] or 0.0,
+                'mean_seconds': row['mean'],
+            }
+        return stats
+
+    def jobs(self, state: Optional[str] = None) -> List[sqlite3.Row]:
+        """Liste les jobs, éventuellement filtrés par état."""
+        if state is None:
+            return self.connection.execute("SELECT * FROM jobs ORDER BY id").fetchall()
+        return self.connection.execute("SELECT * FROM jobs WHERE state = ? ORDER BY id", (state,)).fetchall()
+
+
+class _StageTimer:
+    """Mesure la durée de chaque étape d'une tentative et la reporte dans la file."""
+
+    def __init__(self, queue: RenderQueue, job_id: int, attempt: int):
+        self.queue = queue
+        self.job_id = job_id
+        self.attempt = attempt
+        self.stage = STAGE_SETUP
+        self.start = time.perf_counter()
+
+    def next(self, stage: str) -> None:
+        self.close(ok=True)
+        self.queue.set_state(self.job_id, stage)
+        self.stage = stage
+        self.start = time.perf_counter()
+
+    def close(self, ok: bool) -> None:
+        self.queue.record_stage(self.job_id, self.attempt, self.stage, time.perf_counter() - self.start, ok)
+
+
+def process_job(queue: RenderQueue, row: sqlite3.Row, assets, cache: Optional[RenderCache] = None) -> str:
+    """
+    Exécute un job réservé et enregistre son issue dans la file.
+
+    Args:
+        queue (RenderQueue): La file
+        row (sqlite3.Row): Le job réservé
+        assets (AssetCache): Cache des ressources du processus
+        cache (Optional[RenderCache]): Cache des rendus précédents
+
+    Returns:
+        str: Nouvel état du job
+    """
+    timer = _StageTimer(queue, row['id'], row['attempts'])
+    try:
+        job = RenderJob.from_dict(json.loads(row['spec']))
+        # Un dossier par job : deux workers ne s'écrasent jamais leurs fichiers
+        if 'output_dir' not in job.overrides:
+            job.overrides['output_dir'] = os.path.join(job.build_config().output_dir, f"job-{row['id']}")
+        result = render_job(job, assets, on_stage=timer.next, cache=cache)
+    except Exception as e:
+        traceback.print_exc()
+        timer.close(ok=False)
+        error = f"{type(e).__name__}: {e}"
+        state = queue.fail(row['id'], error, transient=not isinstance(e, PERMANENT_ERRORS))
+        print(f"Job {row['id']} ({row['name']}) en échec, tentative {row['attempts']}/{row['max_attempts']} : {error}")
+        return state
+
+    timer.close(ok=True)
+    queue.complete(row['id'], result.output_path, result.cache)
+    print(result.summary())
+    return STATE_DONE
+
+
+def work(
+    queue_path: str,
+    watch: bool = False,
+    poll_interval: float = 5.0,
+    cache_dir: Optional[str] = CACHE_DIR
+) -> None:
+    """
+    Boucle d'un processus de rendu : réserve et exécute des jobs jusqu'à ce
+    que la file soit vide (ou indéfiniment avec `watch`).
+
+    Args:
+        queue_path (str): Chemin du fichier SQLite de la file
+        watch (bool): Continuer à attendre de nouveaux jobs quand la file est vide
+        poll_interval (float): Délai entre deux consultations de la file, en secondes
+        cache_dir (Optional[str]): Dossier du cache des rendus (None : toujours tout rendre)
+    """
+    from core.worker import RenderWorker
+
+    worker = RenderWorker(cache=RenderCache(cache_dir) if cache_dir else None)
+    worker.warm_up()
+    queue = RenderQueue(queue_path)
+    try:
+        while True:
+            row = queue.claim()
+            if row is not None:
+                process_job(queue, row, worker.assets, worker.cache)
+                continue
+            # Des jobs en attente de nouvelle tentative : patienter
+            if watch or queue.counts()[STATE_QUEUED] > 0:
+                time.sleep(poll_interval)
+                continue
+            break
+    finally:
+        queue.close()
+
+
+def run_pool(
+    queue_path: str,
+    workers: int = 1,
+    watch: bool = False,
+    cache_dir: Optional[str] = CACHE_DIR
+) -> None:
+    """
+    Reprend les jobs interrompus puis lance `workers` processus de rendu.
+
+    Args:
+        queue_path (str): Chemin du fichier SQLite de la file
+        workers (int): Nombre de processus de rendu
+        watch (bool): Continuer à attendre de nouveaux jobs quand la file est vide
+        cache_dir (Optional[str]): Dossier du cache des rendus (None : toujours tout rendre)
+    """
+    queue = RenderQueue(queue_path)
+    recovered = queue.recover()
+    if recovered:
+        print(f"Jobs interrompus remis en file : {recovered}")
+    queue.close()
+
+    if workers <= 1:
+        work(queue_path, watch, cache_dir=cache_dir)
+        return
+
+    # "spawn" : chaque processus initialise son propre pygame
+    context = multiprocessing.get_context('spawn')
+    processes = [
+        context.Process(target=work, args=(queue_path, watch), kwargs={'cache_dir': cache_dir})
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
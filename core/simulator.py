@@ -1,5 +1,7 @@
+import random
 import pygame
-from typing import Tuple, Optional
+from typing import List, Optional
+from .assets import AssetCache
 from .audio import AudioManager
 from .record import RecordManager
 from .video_processor import VideoProcessor
@@ -9,30 +11,65 @@ from particles import ParticleManager
 from ui.background import Background
 from ui.question import Question
 from ui.response import Response
-from scenes.main import setup_scene
-from config import *
+from scenes.main import generate_layout, build_scene
+from scenes.layout import SceneLayout, load_layout, scene_path
+from config import create_config, BLANC, ROUGE
+from utils.fonts import get_font
+from .config import SimulationConfig
+from .profiler import FrameProfiler
+from .snapshot import SimulationSnapshot
 import os
 
 class Simulator:
-    def __init__(self, width: int, height: int):
-        self.width = width
-        self.height = height
+    def __init__(
+        self,
+        config: Optional[SimulationConfig] = None,
+        assets: Optional[AssetCache] = None,
+        layout: Optional[SceneLayout] = None
+    ):
+        """
+        Args:
+            config (Optional[SimulationConfig]): Configuration (défaut : config.py)
+            assets (Optional[AssetCache]): Cache de ressources partagé
+            layout (Optional[SceneLayout]): Plan de scène imposé (défaut : la scène
+                `config.scene` de la bibliothèque, sinon un placement aléatoire)
+        """
+        self.config = config or create_config()
+        self.assets = assets or AssetCache()
+        self.assets.load_theme_bundle(self.config.theme)
+        self.width = self.config.width
+        self.height = self.config.height
+        # Source de hasard propre au simulateur : même graine, même vidéo
+        self.rng = random.Random(self.config.seed)
         
-        # Initialisation des gestionnaires
-        self.time_manager = TimeManager(fps=FPS, post_physics_duration=DELAI_ARRET)
-        self.record_manager = RecordManager(width, height, FPS)
-        self.audio_manager = AudioManager()
-        self.video_processor = VideoProcessor(self.audio_manager)
-        self.physics_space = PhysicsSpace(GRAVITY)
+        # Mesure des phases de chaque frame (toujours active en mode debug)
+        self.profiler = FrameProfiler(
+            enabled=self.config.profile or self.config.debug,
+            export_path=self.config.profile_path
+        )
+        self.clock = pygame.time.Clock()
+        
+        # Initialisation des gestionnaires (propres à chaque simulateur)
+        self.time_manager = TimeManager(fps=self.config.fps, post_physics_duration=self.config.delai_arret)
+        self.record_manager = RecordManager(self.config, self.profiler)
+        self.audio_manager = AudioManager(self.config, self.time_manager, self.assets, self.rng)
+        self.video_processor = VideoProcessor(self.audio_manager, self.config, self.assets)
+        self.physics_space = PhysicsSpace(self.config.gravity)
         
         # Initialisation des composants UI
-        self.background = Background(width, height)
-        self.question = Question(width, height)
-        self.response = Response(width, height)
+        self.background = Background(self.config, self.assets)
+        self.question = Question(self.config)
+        self.response = Response(self.config, self.assets)
         
+        # Scène fixe (imposée ou de la bibliothèque) ; None : tirée au hasard à chaque partie
+        if layout is None and self.config.scene:
+            layout = load_layout(scene_path(self.config.scene_dir, self.config.scene))
+        self.fixed_layout = layout
+        self.layout: Optional[SceneLayout] = None  # Plan de la scène en cours
+
         # Initialisation des gestionnaires de jeu
-        self.particle_manager = ParticleManager(self.physics_space.get_space())
-        self.obstacle_manager, self.cuve_manager = setup_scene(self.physics_space.get_space())
+        self.particle_manager = ParticleManager(self.physics_space.get_space(), self.config, self.profiler)
+        self.obstacle_manager, self.cuve_manager = self._setup_scene()
         
         # Variables de jeu
         self.running = True
@@ -43,6 +80,30 @@ class Simulator:
         self.gradient_alpha = 0
         self.recording_finished = False
 
+        # Instantanés périodiques (les plus récents), voir snapshot()
+        self.snapshots: List[SimulationSnapshot] = []
+        interval = self.config.snapshot_interval
+        self.snapshot_frames = max(1, round(interval * self.config.fps)) if interval else None
+
+    def _setup_scene(self):
+        """Crée les obstacles et les cuves reliés aux gestionnaires de ce simulateur.
+        Une scène fixe n'est construite qu'une fois : les parties suivantes
+        reprennent les mêmes objets, remis en place par PhysicsSpace.reset"""
+        space = self.physics_space.get_space()
+        if self.physics_space.template is not None:
+            self.obstacle_manager.reset(space)
+            self.cuve_manager.reset(space)
+            return self.obstacle_manager, self.cuve_manager
+
+        self.layout = self.fixed_layout or generate_layout(self.config, self.rng)
+        scene = build_scene(
+            space, self.config, self.layout,
+            self.time_manager, self.audio_manager, self.assets, self.rng
+        )
+        if self.fixed_layout is not None:
+            self.physics_space.save_template()
+        return scene
+
     def start(self):
         """Démarre la simulation et l'enregistrement"""
         self.record_manager.start_recording()
@@ -51,19 +112,118 @@ class Simulator:
         self.audio_manager.play_sound('question')
 
     def reset(self):
-        """Réinitialise la simulation"""
+        """Réinitialise l'état de la simulation (physique, scène, horloge,
+        interface). L'enregistrement en cours n'est pas touché : c'est à
+        l'appelant de le redémarrer s'il le souhaite (voir `restart`)"""
         self.physics_space.reset()
-        self.particle_manager = ParticleManager(self.physics_space.get_space())
-        self.obstacle_manager, self.cuve_manager = setup_scene(self.physics_space.get_space())
+        self.particle_manager = ParticleManager(self.physics_space.get_space(), self.config, self.profiler)
+        self.obstacle_manager, self.cuve_manager = self._setup_scene()
         self.response.set_response(None)
+        self.question.question_zoom_time = 0
+        self.response.zoom_time = 0
         self.time_manager.reset()
+        self.time_accum = 0
         self.physics_active = True
+        self.physics_stop_time = 0
         self.gradient_alpha = 0
         self.current_gradient = None
-        pygame.mixer.music.play(-1)
+        self.recording_finished = False
+        self.snapshots = []
+
+    def restart(self):
+        """Nouvelle partie enregistrée depuis zéro : réinitialise la simulation
+        puis redémarre l'enregistrement (vidéo et journal sonore)"""
+        if self.record_manager.is_recording():
+            self.record_manager.stop_recording()
+        self.reset()
+        self.audio_manager.reset()
+        self.start()
+
+    def snapshot(self) -> SimulationSnapshot:
+        """
+        Prend un instantané de tout l'état de la simulation.
+
+        À prendre entre deux frames : `restore` reprend alors la partie à la
+        frame suivante. L'instantané peut aussi être restauré dans un autre
+        simulateur de la même scène, par exemple pour rejouer la fin de partie
+        avec une autre configuration d'émission.
+
+        Returns:
+            SimulationSnapshot: L'instantané (état sérialisé, taille et coût de la prise)
+        """
+        state = {
+            'physics': self.physics_space.snapshot_state(),
+            'particles': self.particle_manager.snapshot_state(),
+            'obstacles': self.obstacle_manager.snapshot_state(),
+            'cuves': self.cuve_manager.snapshot_state(),
+            'time': self.time_manager.snapshot_state(),
+            'audio': self.audio_manager.snapshot_state(),
+            'rng': self.rng.getstate(),
+            'simulator': {
+                'layout': self.layout,
+                'time_accum': self.time_accum,
+                'physics_active': self.physics_active,
+                'physics_stop_time': self.physics_stop_time,
+                'gradient_index': (
+                    self.background.gradient_surfaces.index(self.current_gradient)
+                    if self.current_gradient is not None else None
+                ),
+                'gradient_alpha': self.gradient_alpha,
+                'recording_finished': self.recording_finished,
+                'question_zoom_time': self.question.question_zoom_time,
+                'reponse': self.response.reponse,
+                'reponse_zoom_time': self.response.zoom_time,
+            },
+        }
+        return SimulationSnapshot.capture(
+            state,
+            frame=self.time_manager.frame_count,
+            physics_seconds=self.time_manager.get_current_state().physics_seconds,
+            particles=len(self.particle_manager.particles)
+        )
+
+    def restore(self, snapshot: SimulationSnapshot):
+        """
+        Remet la simulation dans l'état d'un instantané.
+
+        Les objets physiques sont des copies neuves : l'instantané reste
+        utilisable et une même restauration donne toujours la même suite. Cette
+        suite n'est pas identique au bit près à celle de la partie d'origine
+        (pymunk ne permet pas de sauvegarder l'état interne du solveur des corps
+        et des joints). La vidéo en cours n'est pas rembobinée, les frames
+        suivantes s'y ajoutent ; les instantanés pris après celui-ci sont oubliés.
+
+        Args:
+            snapshot (SimulationSnapshot): Instantané pris par `snapshot`
+        """
+        state = snapshot.load()
+        self.physics_space.restore_state(state['physics'])
+        space = self.physics_space.get_space()
+        self.particle_manager.restore_state(state['particles'], space)
+        self.obstacle_manager.restore_state(state['obstacles'], space)
+        self.cuve_manager.restore_state(state['cuves'], space)
+        self.time_manager.restore_state(state['time'])
+        self.audio_manager.restore_state(state['audio'])
+        self.rng.setstate(state['rng'])
+
+        values = state['simulator']
+        self.layout = values['layout']
+        self.time_accum = values['time_accum']
+        self.physics_active = values['physics_active']
+        self.physics_stop_time = values['physics_stop_time']
+        gradient_index = values['gradient_index']
+        self.current_gradient = self.background.gradient_surfaces[gradient_index] if gradient_index is not None else None
+        self.gradient_alpha = values['gradient_alpha']
+        self.recording_finished = values['recording_finished']
+        self.question.question_zoom_time = values['question_zoom_time']
+        self.response.set_response(values['reponse'])
+        self.response.zoom_time = values['reponse_zoom_time']
+        self.snapshots = [taken for taken in self.snapshots if taken.frame <= snapshot.frame]
 
     def update(self, dt: float) -> bool:
         """Met à jour la simulation. Retourne False si la simulation doit s'arrêter"""
+        profiler = self.profiler
+        profiler.begin_frame()
         self.time_accum += dt
 
         # Mise à jour du TimeManager
@@ -76,25 +236,35 @@ class Simulator:
         # Mise à jour de l'AudioManager
         self.audio_manager.update_frame(self.time_manager.get_current_state().total_seconds)
 
-        # Émission de particules
-        if self.physics_active and self.time_accum >= EMIT_INTERVAL:
-            self.particle_manager.emit_particle()
-            self.time_accum = 0
+        # Émission de particules (plusieurs par frame si l'intervalle est plus court qu'une frame)
+        if self.physics_active and self.time_accum >= self.config.emit_interval:
+            start = profiler.start()
+            count = int(self.time_accum / self.config.emit_interval)
+            for _ in range(count):
+                self.particle_manager.emit_particle()
+            # Le reste de l'intervalle est conservé : le débit ne dépend pas de la durée des frames
+            self.time_accum -= count * self.config.emit_interval
+            profiler.stop('emission', start)
 
         # Mise à jour des obstacles
+        start = profiler.start()
         self.obstacle_manager.update(dt)
+        profiler.stop('obstacles', start)
 
         # Simulation physique
         if self.physics_active:
+            start = profiler.start()
             for _ in range(20):
                 self.physics_space.step(dt / 20)
+            self.obstacle_manager.limit_pivot_speed()
+            profiler.stop('physics', start)
 
         # Vérification de la fin de la simulation
         if self.physics_active:
             current_physics_time = self.time_manager.get_current_state().physics_seconds
-            if current_physics_time >= TEMPS_LIMITE:
-                print(f"Temps limite atteint: {current_physics_time:.1f}s / {TEMPS_LIMITE}s")
-                if any(count > 0 and count % SEUIL_VICTOIRE == 0 for count in self.cuve_manager.counts):
+            if current_physics_time >= self.config.temps_limite:
+                print(f"Temps limite atteint: {current_physics_time:.1f}s / {self.config.temps_limite}s")
+                if any(count > 0 and count % self.config.seuil_victoire == 0 for count in self.cuve_manager.counts):
                     print(f"Condition de victoire atteinte. Compteurs: {self.cuve_manager.counts}")
                     self.physics_active = False
                     self.physics_stop_time = self.time_manager.get_current_state().total_seconds
@@ -102,12 +272,12 @@ class Simulator:
                     # Détermination du gagnant
                     if self.cuve_manager.counts[0] > self.cuve_manager.counts[1]:
                         actual_winner = "A"
-                        self.response.set_response(REPONSE_B)
+                        self.response.set_response(self.config.reponse_b)
                         self.current_gradient = self.background.gradient_surfaces[0]
                         self.audio_manager.play_sound('reponse_b')
                     elif self.cuve_manager.counts[1] > self.cuve_manager.counts[0]:
                         actual_winner = "B"
-                        self.response.set_response(REPONSE_A)
+                        self.response.set_response(self.config.reponse_a)
                         self.current_gradient = self.background.gradient_surfaces[1]
                         self.audio_manager.play_sound('reponse_a')
                     else:
@@ -116,13 +286,27 @@ class Simulator:
                         self.current_gradient = None
 
                     # Vérification du gagnant attendu
-                    if WINNER == "B" and actual_winner == "A":
-                        print("Réinitialisation de la simulation - Mauvais gagnant")
-                        self.reset()
-                        return True
+                    if self.config.winner == "B" and actual_winner == "A":
+                        if self.fixed_layout is None:
+                            print("Réinitialisation de la simulation - Mauvais gagnant")
+                            self.restart()
+                            return True
+                        # Une scène fixe rejouée donnerait exactement la même partie
+                        print("Mauvais gagnant, mais la scène est fixe : résultat conservé")
 
                     print(f"Simulation arrêtée après {current_physics_time:.1f} secondes")
                     print(f"Nombre de billes dans les cuves: {self.cuve_manager.counts}")
+                    manager = self.particle_manager
+                    if manager.pool_hit_rate is not None:
+                        print(
+                            f"Billes réutilisées : {manager.pool_hit_rate:.0%} des émissions "
+                            f"({manager.pool_allocations} créées)"
+                        )
+                    if manager.stuck_nudged:
+                        print(
+                            f"Billes coincées : {manager.stuck_nudged} relancées, {manager.stuck_retired} retirées "
+                            f"({manager.stuck_seconds_saved:.0f} billes x secondes de physique évitées)"
+                        )
 
         # Mise à jour de l'alpha du dégradé
         if self.current_gradient and not self.physics_active:
@@ -131,11 +315,43 @@ class Simulator:
         # Mise à jour des composants
         self.question.update(dt)
         self.response.update(dt)
-        self.cuve_manager.update_counts(self.particle_manager.particles)
+        start = profiler.start()
+        self.particle_manager.refresh_state()
+        self.particle_manager.wrap_positions()
+        if self.physics_active:
+            state = self.particle_manager.state
+            self.particle_manager.handle_stuck_particles(
+                self.time_manager.get_current_state().physics_seconds,
+                self.cuve_manager.contains_points(state.x, state.y)
+            )
+        start = profiler.lap('particles', start)
+        expired = self.cuve_manager.update_counts(self.time_manager.get_current_state().total_seconds)
+        profiler.stop('cuves', start)
+
+        # Retraits de la frame (billes expirées ou trop rapides), en une fois
+        start = profiler.start()
+        for particle_id in expired:
+            self.particle_manager.remove(particle_id)
+        self.particle_manager.remove_fast_particles()
+        self.particle_manager.flush_removals()
+        profiler.stop('removals', start)
+
+        # Sons et animations des collisions de la frame (pas de physique et retraits)
+        start = profiler.start()
+        self.obstacle_manager.process_collisions()
+        profiler.stop('collisions', start)
+
+        # Instantané périodique, en fin de frame (temps de physique)
+        if (self.snapshot_frames and self.physics_active and
+                self.time_manager.physics_frame_count % self.snapshot_frames == 0):
+            start = profiler.start()
+            self.snapshots.append(self.snapshot())
+            del self.snapshots[:-self.config.snapshot_keep]
+            profiler.stop('snapshot', start)
 
         # Vérification de la fin du délai d'arrêt
         if not self.physics_active:
-            remaining_time = DELAI_ARRET - (self.time_manager.get_current_state().total_seconds - self.physics_stop_time)
+            remaining_time = self.config.delai_arret - (self.time_manager.get_current_state().total_seconds - self.physics_stop_time)
             if remaining_time <= 0 and not self.recording_finished:
                 print(f"Délai d'arrêt écoulé: {remaining_time:.1f}s")
                 self.recording_finished = True
@@ -145,91 +361,147 @@ class Simulator:
 
     def draw(self, screen: pygame.Surface) -> bool:
         """Dessine l'état actuel de la simulation"""
+        profiler = self.profiler
+        start = profiler.start()
         self.background.draw(screen, self.current_gradient, self.gradient_alpha)
+        start = profiler.lap('draw.background', start)
         self.obstacle_manager.draw(screen)
+        start = profiler.lap('draw.obstacles', start)
         self.cuve_manager.draw(screen)
+        start = profiler.lap('draw.cuves', start)
         self.particle_manager.draw(screen)
+        start = profiler.lap('draw.particles', start)
         self.question.draw(screen)
+        start = profiler.lap('draw.question', start)
         self.response.draw(screen)
+        profiler.stop('draw.response', start)
 
-        if DEBUG:
-            self._draw_debug_info(screen)
-
-        # Enregistrement après le dessin
+        # Enregistrement après le dessin (capture et encodage sont mesurés par le RecordManager)
+        running = True
         if self.record_manager.is_recording():
             if not self.record_manager.record_frame(screen):
                 print("Enregistrement terminé")
                 self.recording_finished = True
-                return False
+                running = False
 
-        return True
+        # Infos de debug après la capture : affichées à l'écran, jamais dans la vidéo
+        if self.config.debug:
+            start = profiler.start()
+            self._draw_debug_info(screen)
+            profiler.stop('draw.debug', start)
+
+        profiler.end_frame()
+        return running
 
     def _draw_debug_info(self, screen: pygame.Surface):
         """Dessine les informations de debug"""
-        font = pygame.font.SysFont("Poppins", 24)
+        font = get_font(24)
         times = self.time_manager.get_formatted_times()
-        time_text = font.render(f"Tot: {times['total']} | Phy: {times['physics']} | G: {times['game']} | FPS: {pygame.time.Clock().get_fps():.1f}", True, BLANC)
+        time_text = font.render(f"Tot: {times['total']} | Phy: {times['physics']} | G: {times['game']} | FPS: {self.clock.get_fps():.1f}", True, BLANC)
         screen.blit(time_text, (10, 10))
         
+        # Statistiques glissantes du profiler
+        y = 100
+        for line in self.profiler.format_stats():
+            screen.blit(font.render(line, True, BLANC), (10, y))
+            y += 30
+        
         if not self.physics_active:
             state_text = font.render("Physique arrêtée", True, ROUGE)
             screen.blit(state_text, (10, 40))
             
-            remaining_time = DELAI_ARRET - (self.time_manager.get_current_state().total_seconds - self.physics_stop_time)
+            remaining_time = self.config.delai_arret - (self.time_manager.get_current_state().total_seconds - self.physics_stop_time)
             if remaining_time > 0:
                 countdown_text = font.render(f"Arrêt dans {remaining_time:.1f}s", True, ROUGE)
                 screen.blit(countdown_text, (10, 70))
 
+    def finish_recording(self) -> str:
+        """
+        Arrête l'enregistrement vidéo et exporte les événements sonores.
+        
+        Returns:
+            str: Chemin du fichier CSV des événements sonores
+        """
+        self.record_manager.stop_recording()
+        self.profiler.close()
+        
+        sound_events_path = os.path.join(self.config.output_dir, 'sound_events.csv')
+        self.audio_manager.export_sound_events(sound_events_path)
+        print(f"Événements sonores exportés dans : {sound_events_path}")
+        return sound_events_path
+
+    def encode_audio(self, sound_events_path: str) -> str:
+        """
+        Génère la piste audio à partir des événements sonores.
+        
+        Args:
+            sound_events_path (str): Chemin du fichier CSV des événements sonores
+            
+        Returns:
+            str: Chemin du fichier audio généré
+            
+        Raises:
+            RuntimeError: Si la génération échoue
+        """
+        return self.video_processor.encode_audio(sound_events_path)
+
+    def mux(self, audio_path: str, video_path: Optional[str] = None) -> str:
+        """
+        Fusionne la vidéo enregistrée avec la piste audio.
+        
+        Args:
+            audio_path (str): Chemin du fichier audio
+            video_path (Optional[str]): Vidéo à utiliser (défaut : la vidéo enregistrée)
+            
+        Returns:
+            str: Chemin de la vidéo finale
+            
+        Raises:
+            RuntimeError: Si la vidéo est introuvable ou si la fusion échoue
+        """
+        return self.video_processor.mux(audio_path, video_path or self.record_manager.get_video_path())
+
     def stop(self):
         """Arrête proprement la simulation et l'enregistrement"""
-        # Arrêter l'enregistrement vidéo
-        self.record_manager.stop_recording()
+        # Arrêter l'enregistrement vidéo et exporter les événements sonores
+        sound_events_path = self.finish_recording()
         
         # Arrêter pygame immédiatement
         pygame.mixer.quit()
         pygame.quit()
         print("Application fermée proprement")
         
-        # Exporter les événements sonores
-        sound_events_path = os.path.join(OUTPUT_DIR, 'sound_events.csv')
-        self.audio_manager.export_sound_events(sound_events_path)
-        print(f"Événements sonores exportés dans : {sound_events_path}")
-        
         try:
-            # Générer l'audio
-            audio_path = self.video_processor.generate_audio_from_events(sound_events_path)
-            if not audio_path:
-                raise Exception("Échec de la génération de l'audio")
-            print(f"Audio généré avec succès : {audio_path}")
-            
-            # Vérifier que la vidéo existe
-            video_path = self.record_manager.get_video_path()
-            if not video_path or not os.path.exists(video_path):
-                raise Exception(f"Vidéo non trouvée : {video_path}")
-            print(f"Vidéo trouvée : {video_path}")
-            
-            # Fusionner la vidéo et l'audio
-            final_path = self.video_processor.merge_video_audio(
-                video_path=video_path,
-                audio_path=audio_path,
-                fps=FPS
-            )
-            if not final_path:
-                raise Exception("Échec de la fusion vidéo/audio")
-            print(f"Fusion terminée avec succès : {final_path}")
-            
+            audio_path = self.encode_audio(sound_events_path)
+            self.mux(audio_path)
         except Exception as e:
             print(f"Erreur lors de la génération/fusion audio : {e}")
             import traceback
             traceback.print_exc()
 
+    def render(self, screen: pygame.Surface):
+        """
+        Exécute la simulation hors ligne, sans fenêtre ni limite de cadence.
+        
+        Le pas de temps est fixe (1 / FPS) : une vidéo dure toujours le temps
+        simulé, quelle que soit la vitesse de la machine.
+        
+        Args:
+            screen (pygame.Surface): Surface de rendu
+        """
+        dt = 1 / self.config.fps
+        running = True
+        while running:
+            running = self.update(dt)
+            running = self.draw(screen) and running
+            self.clock.tick()
+
     def run(self, screen: pygame.Surface):
         """Exécute la boucle principale de la simulation"""
-        clock = pygame.time.Clock()
         running = True
 
         while running:
-            dt = clock.tick(FPS) / 1000
+            dt = self.clock.tick(self.config.fps) / 1000
 
             # Gestion des événements
             for event in pygame.event.get():
@@ -237,7 +509,7 @@ class Simulator:
                     running = False
                 elif event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_r:
-                        self.reset()
+                        self.restart()
                     elif event.key == pygame.K_ESCAPE:
                         running = False
 
@@ -249,7 +521,7 @@ class Simulator:
             if not self.draw(screen):
                 running = False
 
-            if VISUAL:
+            if self.config.visual:
                 pygame.display.flip()
 
         # Arrêt propre
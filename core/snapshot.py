@@ -0,0 +1,89 @@
+import os
+import time
+import pickle
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass
+class SimulationSnapshot:
+    """
+    Instantané de tout l'état d'une simulation à une frame donnée : espace
+    physique (contacts en cours compris), billes, cuves, horloges, événements
+    sonores et hasard.
+
+    L'état est gardé sérialisé : l'instantané ne partage aucun objet avec la
+    simulation, qui peut continuer puis y revenir autant de fois que voulu.
+    La vidéo déjà enregistrée n'en fait pas partie.
+    """
+    frame: int  # Frame (temps total) de la prise
+    physics_seconds: float  # Temps de physique de la prise
+    particles: int  # Nombre de billes dans l'espace
+    data: bytes  # État sérialisé
+    capture_seconds: float  # Durée de la prise
+
+    @classmethod
+    def capture(cls, state: Dict[str, Any], frame: int, physics_seconds: float, particles: int) -> "SimulationSnapshot":
+        """
+        Sérialise un état de simulation.
+
+        Args:
+            state (Dict[str, Any]): État de chaque composant (objets partagés compris)
+            frame (int): Frame de la prise
+            physics_seconds (float): Temps de physique de la prise
+            particles (int): Nombre de billes
+
+        Returns:
+            SimulationSnapshot: L'instantané
+        """
+        start = time.perf_counter()
+        data = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+        return cls(frame, physics_seconds, particles, data, time.perf_counter() - start)
+
+    @property
+    def size(self) -> int:
+        """Taille en mémoire de l'état sérialisé, en octets."""
+        return len(self.data)
+
+    def load(self) -> Dict[str, Any]:
+        """Retourne une copie neuve de l'état de chaque composant."""
+        return pickle.loads(self.data)
+
+    def describe(self) -> str:
+        """Résumé lisible : date, taille et coût de la prise."""
+        return (
+            f"frame {self.frame} ({self.physics_seconds:.1f}s de physique, {self.particles} billes) : "
+            f"{self.size / 1024:.0f} Kio, pris en {self.capture_seconds * 1000:.1f} ms"
+        )
+
+
+def save_snapshot(snapshot: SimulationSnapshot, path: str) -> None:
+    """
+    Écrit un instantané sur disque (pour reprendre une partie dans un autre processus).
+
+    Args:
+        snapshot (SimulationSnapshot): L'instantané
+        path (str): Fichier de sortie
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'wb') as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_snapshot(path: str) -> SimulationSnapshot:
+    """
+    Lit un instantané écrit par `save_snapshot`.
+
+    Args:
+        path (str): Fichier de l'instantané
+
+    Returns:
+        SimulationSnapshot: L'instantané
+
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+    """
+    with open(path, 'rb') as f:
+        return pickle.load(f)
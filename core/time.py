@@ -13,13 +13,13 @@ class TimeState:
     game_frames: int
 
 class TimeManager:
-    _instance = None
-    
-    def __new__(cls, *args, **kwargs):
-        if cls._instance is None:
-            cls._instance = super(TimeManager, cls).__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    # Compteurs repris par les instantanés (fps et durée post-physique viennent de la configuration)
+    STATE_FIELDS = (
+        'start_time', 'frame_count',
+        'physics_start_time', 'physics_frame_count', 'physics_active',
+        'game_start_time', 'game_frame_count', 'game_active',
+        'physics_end_time',
+    )
     
     def __init__(self, fps: int = 60, post_physics_duration: float = 3.0):
         """
@@ -29,10 +29,6 @@ class TimeManager:
             fps (int): Images par seconde
             post_physics_duration (float): Durée en secondes après l'arrêt de la physique
         """
-        if self._initialized:
-            return
-            
-        self._initialized = True
         self.fps = fps
         self.post_physics_duration = post_physics_duration
         
@@ -148,4 +144,24 @@ class TimeManager:
         self.game_start_time = None
         self.game_frame_count = 0
         self.game_active = False
-        self.physics_end_time = None 
\ No newline at end of file
+        self.physics_end_time = None 
+    
+    def snapshot_state(self) -> dict:
+        """
+        Retourne les compteurs pour un instantané.
+        
+        Returns:
+            dict: Valeur de chaque compteur
+        """
+        return {name: getattr(self, name) for name in self.STATE_FIELDS}
+    
+    def restore_state(self, state: dict) -> None:
+        """
+        Reprend les compteurs d'un instantané.
+        
+        Args:
+            state (dict): Compteurs produits par `snapshot_state`
+        """
+        for name in self.STATE_FIELDS:
+            setattr(self, name, state[name])
+
@@ -4,14 +4,16 @@ import subprocess
 import pandas as pd
 import numpy as np
 import soundfile as sf
-from scipy import signal
 from typing import Optional
-from config import TEMPS_LIMITE, DELAI_ARRET, OUTPUT_DIR, THEME
+from core.assets import AssetCache
+from core.config import SimulationConfig
 
 class VideoProcessor:
-    def __init__(self, audio_manager):
+    def __init__(self, audio_manager, config: SimulationConfig, assets: AssetCache):
         self.audio_manager = audio_manager
-        self.output_dir = OUTPUT_DIR
+        self.config = config
+        self.assets = assets
+        self.output_dir = config.output_dir
 
     def generate_audio_from_events(self, sound_events_path: str, output_audio_path: Optional[str] = None) -> str:
         """
@@ -36,7 +38,7 @@ class VideoProcessor:
                 return None
             
             # Calculer la durée nécessaire en fonction du dernier événement
-            sample_rate = 44100  # Taux d'échantillonnage standard
+            sample_rate = self.assets.SAMPLE_RATE  # Taux d'échantillonnage standard
             last_event_time = events_df['Time(s)'].max()
             
             # Trouver le dernier son et sa durée
@@ -45,14 +47,7 @@ class VideoProcessor:
             last_sound_duration = 0
             if last_sound_path and os.path.exists(last_sound_path):
                 try:
-                    last_sound_data, last_sound_rate = sf.read(last_sound_path)
-                    # Convertir en mono si nécessaire
-                    if len(last_sound_data.shape) > 1:
-                        last_sound_data = last_sound_data.mean(axis=1)
-                    # Rééchantillonner si nécessaire
-                    if last_sound_rate != sample_rate:
-                        number_of_samples = round(len(last_sound_data) * sample_rate / last_sound_rate)
-                        last_sound_data = signal.resample(last_sound_data, number_of_samples)
+                    last_sound_data = self.assets.audio_data(last_sound_path)
                     last_sound_duration = len(last_sound_data) / sample_rate
                     print(f"Durée du dernier son ({last_sound}): {last_sound_duration:.3f}s")
                 except Exception as e:
@@ -60,8 +55,8 @@ class VideoProcessor:
             
             # Utiliser la durée maximale entre :
             # - Le dernier événement + durée du dernier son + 0.5s de marge
-            # - TEMPS_LIMITE + DELAI_ARRET
-            duration = max(last_event_time + last_sound_duration + 0.5, TEMPS_LIMITE + DELAI_ARRET)
+            # - temps limite + délai d'arrêt
+            duration = max(last_event_time + last_sound_duration + 0.5, self.config.temps_limite + self.config.delai_arret)
             print(f"Durée totale calculée: {duration:.3f}s")
             
             # Créer un tableau de silence
@@ -74,17 +69,8 @@ class VideoProcessor:
                 sound_path = self.audio_manager.get_random_sound_variation('background')
                 if sound_path and os.path.exists(sound_path):
                     try:
-                        # Lire le fichier audio de la musique de fond
-                        bg_sound_data, bg_sample_rate = sf.read(sound_path)
-                        
-                        # Convertir en mono si stéréo
-                        if len(bg_sound_data.shape) > 1:
-                            bg_sound_data = bg_sound_data.mean(axis=1)
-                        
-                        # Rééchantillonner si nécessaire
-                        if bg_sample_rate != sample_rate:
-                            number_of_samples = round(len(bg_sound_data) * sample_rate / bg_sample_rate)
-                            bg_sound_data = signal.resample(bg_sound_data, number_of_samples)
+                        # Musique de fond décodée (mono, 44,1 kHz)
+                        bg_sound_data = self.assets.audio_data(sound_path)
                         
                         # Appliquer le volume de la musique de fond (généralement plus bas)
                         bg_volume = self.audio_manager.get_sound_volume('background')
@@ -110,17 +96,8 @@ class VideoProcessor:
                 sound_path = self.audio_manager.get_random_sound_variation(sound_name)
                 if sound_path and os.path.exists(sound_path):
                     try:
-                        # Lire le fichier audio
-                        sound_data, sound_sample_rate = sf.read(sound_path)
-                        
-                        # Convertir en mono si stéréo
-                        if len(sound_data.shape) > 1:
-                            sound_data = sound_data.mean(axis=1)
-                        
-                        # Rééchantillonner si nécessaire
-                        if sound_sample_rate != sample_rate:
-                            number_of_samples = round(len(sound_data) * sample_rate / sound_sample_rate)
-                            sound_data = signal.resample(sound_data, number_of_samples)
+                        # Son décodé (mono, 44,1 kHz), lu une seule fois par fichier
+                        sound_data = self.assets.audio_data(sound_path)
                         
                         # Appliquer le volume
                         volume = self.audio_manager.get_sound_volume(sound_name)
@@ -167,6 +144,49 @@ class VideoProcessor:
             traceback.print_exc()
             return None
 
+    def encode_audio(self, sound_events_path: str) -> str:
+        """
+        Génère la piste audio à partir des événements sonores.
+
+        Args:
+            sound_events_path (str): Chemin du fichier CSV des événements sonores
+
+        Returns:
+            str: Chemin du fichier audio généré
+
+        Raises:
+            RuntimeError: Si la génération échoue
+        """
+        audio_path = self.generate_audio_from_events(sound_events_path)
+        if not audio_path:
+            raise RuntimeError("Échec de la génération de l'audio")
+        print(f"Audio généré avec succès : {audio_path}")
+        return audio_path
+
+    def mux(self, audio_path: str, video_path: Optional[str]) -> str:
+        """
+        Fusionne une vidéo muette avec la piste audio.
+
+        Args:
+            audio_path (str): Chemin du fichier audio
+            video_path (Optional[str]): Chemin de la vidéo
+
+        Returns:
+            str: Chemin de la vidéo finale
+
+        Raises:
+            RuntimeError: Si la vidéo est introuvable ou si la fusion échoue
+        """
+        if not video_path or not os.path.exists(video_path):
+            raise RuntimeError(f"Vidéo non trouvée : {video_path}")
+        print(f"Vidéo trouvée : {video_path}")
+
+        final_path = self.merge_video_audio(video_path=video_path, audio_path=audio_path, fps=self.config.fps)
+        if not final_path:
+            raise RuntimeError("Échec de la fusion vidéo/audio")
+        print(f"Fusion terminée avec succès : {final_path}")
+        return final_path
+
     def merge_video_audio(self, video_path: str, audio_path: str, output_path: Optional[str] = None, fps: int = 60) -> str:
         """
         Fusionne la vidéo et l'audio en utilisant ffmpeg avec des paramètres optimisés pour TikTok.
@@ -189,7 +209,7 @@ class VideoProcessor:
             
             if output_path is None:
                 video_name = os.path.splitext(os.path.basename(video_path))[0]
-                output_path = os.path.join(os.path.dirname(video_path), f"{video_name}_tiktok-{THEME}.mp4")
+                output_path = os.path.join(os.path.dirname(video_path), f"{video_name}_tiktok-{self.config.theme}.mp4")
             
             print(f"Optimisation pour TikTok : {video_path}")
             print(f"Sortie : {output_path}")
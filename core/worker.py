@@ -0,0 +1,224 @@
+import os
+import json
+import glob
+import time
+import socket
+import traceback
+import pygame
+from typing import Any, Dict, List, Optional
+from config import create_config
+from core.assets import AssetCache
+from core.cache import RenderCache
+from core.config import SimulationConfig
+from core.jobs import RenderJob, RenderResult, render_job, get_screen
+from core.render_queue import worker_id, is_worker_alive
+from core.simulator import Simulator
+
+class RenderWorker:
+    """
+    Worker de rendu persistant.
+
+    Les coûts de démarrage (initialisation de pygame et du mixer, polices,
+    chargement des sons, dégradés, images du thème, import de
+    pandas/scipy/imageio) sont payés une seule fois au lancement. Les jobs
+    arrivent ensuite par un socket Unix ou par un dossier de spool et
+    partagent le même cache de ressources. Avec un cache de rendus, un job
+    dont les entrées n'ont pas changé n'est pas rendu une seconde fois.
+    """
+
+    def __init__(self, assets: Optional[AssetCache] = None, cache: Optional[RenderCache] = None):
+        self.assets = assets or AssetCache()
+        self.cache = cache
+        self.jobs_done = 0
+        self.jobs_failed = 0
+
+    def warm_up(self, config: Optional[SimulationConfig] = None) -> float:
+        """
+        Précharge tout ce qui peut l'être avant le premier job (polices
+        comprises, chargées par les composants du simulateur).
+
+        Args:
+            config (Optional[SimulationConfig]): Configuration dont on précharge le thème
+
+        Returns:
+            float: Durée du préchargement en secondes
+        """
+        start = time.perf_counter()
+        config = config or create_config()
+
+        pygame.init()
+        pygame.mixer.init()
+        get_screen(config.width, config.height)
+
+        # Construire un simulateur charge sons, dégradés, images et polices dans le cache
+        simulator = Simulator(config, self.assets)
+        self.assets.preload_audio(simulator.audio_manager.get_all_sound_paths())
+
+        duration = time.perf_counter() - start
+        print(f"Worker prêt en {duration:.2f}s")
+        return duration
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Exécute un job et retourne son résultat, sans jamais lever d'exception.
+
+        Args:
+            request (Dict[str, Any]): Description JSON du job
+
+        Returns:
+            Dict[str, Any]: Résultat du job (voir RenderResult)
+        """
+        job_id = str(request.get('id', 'job'))
+        try:
+            job = RenderJob.from_dict(request)
+            result = render_job(job, self.assets, cache=self.cache)
+            self.jobs_done += 1
+        except Exception as e:
+            traceback.print_exc()
+            result = RenderResult(job_id=job_id, error=f"{type(e).__name__}: {e}")
+            self.jobs_failed += 1
+        print(result.summary())
+        return result.to_dict()
+
+    def serve_socket(self, socket_path: str) -> None:
+        """
+        Traite les jobs reçus sur un socket Unix, un par connexion.
+
+        Le client envoie une ligne JSON et reçoit une ligne JSON en retour.
+        La requête {"command": "shutdown"} arrête le worker.
+
+        Args:
+            socket_path (str): Chemin du socket Unix
+        """
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen()
+        print(f"En attente de jobs sur {socket_path}")
+
+        try:
+            while True:
+                connection, _ = server.accept()
+                with connection, connection.makefile('rwb') as stream:
+                    line = stream.readline()
+                    if not line:
+                        continue
+                    try:
+                        request = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        response = {'error': f"Requête invalide : {e}"}
+                    else:
+                        if request.get('command') == 'shutdown':
+                            stream.write(b'{"status": "stopped"}\n')
+                            break
+                        response = self.handle(request)
+                    stream.write(json.dumps(response).encode() + b'\n')
+        finally:
+            server.close()
+            if os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    @staticmethod
+    def recover_spool(incoming_dir: str) -> List[str]:
+        """
+        Remet en attente les jobs réclamés par un worker qui n'existe plus
+        (plantage, machine redémarrée, ...).
+
+        Args:
+            incoming_dir (str): Dossier `incoming` du spool
+
+        Returns:
+            List[str]: Noms des fichiers de jobs remis en attente
+        """
+        recovered = []
+        for claimed_file in sorted(glob.glob(os.path.join(incoming_dir, '*.json.*.running'))):
+            # Le nom d'hôte peut contenir des points : on coupe après l'extension du job
+            job_file, _, claimant = claimed_file[:-len('.running')].rpartition('.json.')
+            job_file += '.json'
+            if ':' not in claimant:
+                claimant = f"{socket.gethostname()}:{claimant}"  # Ancien format : pid seul
+            # Notre propre pid ne peut rien avoir réclamé avant le démarrage (pid réutilisé)
+            if claimant != worker_id() and is_worker_alive(claimant):
+                continue
+            if os.path.exists(job_file):
+                print(f"Job interrompu {claimed_file} non remis en attente : {job_file} existe déjà")
+                continue
+            try:
+                os.rename(claimed_file, job_file)
+            except OSError:
+                continue  # Récupéré par un autre worker
+            recovered.append(os.path.basename(job_file))
+        return recovered
+
+    def serve_spool(self, spool_dir: str, poll_interval: float = 1.0) -> None:
+        """
+        Traite les jobs déposés dans un dossier de spool.
+
+        Chaque fichier `incoming/*.json` est réclamé par renommage atomique
+        (suffixe `.<hôte:pid>.running`), exécuté, puis son résultat est écrit
+        dans `done/` ou `failed/`. Au démarrage, les jobs réclamés par un
+        worker disparu sont remis en attente.
+
+        Args:
+            spool_dir (str): Dossier de spool
+            poll_interval (float): Délai entre deux scans du dossier, en secondes
+        """
+        incoming_dir = os.path.join(spool_dir, 'incoming')
+        done_dir = os.path.join(spool_dir, 'done')
+        failed_dir = os.path.join(spool_dir, 'failed')
+        for directory in (incoming_dir, done_dir, failed_dir):
+            os.makedirs(directory, exist_ok=True)
+        recovered = self.recover_spool(incoming_dir)
+        if recovered:
+            print(f"Jobs interrompus remis en attente : {', '.join(recovered)}")
+        print(f"En attente de jobs dans {incoming_dir}")
+
+        while True:
+            job_files = sorted(glob.glob(os.path.join(incoming_dir, '*.json')))
+            if not job_files:
+                time.sleep(poll_interval)
+                continue
+
+            for job_file in job_files:
+                claimed_file = f"{job_file}.{worker_id()}.running"
+                try:
+                    os.rename(job_file, claimed_file)
+                except OSError:
+                    continue  # Déjà réclamé par un autre worker
+
+                name = os.path.basename(job_file)
+                try:
+                    with open(claimed_file) as f:
+                        request = json.load(f)
+                    request.setdefault('id', os.path.splitext(name)[0])
+                    response = self.handle(request)
+                except json.JSONDecodeError as e:
+                    request, response = None, {'error': f"Requête invalide : {e}"}
+
+                target_dir = failed_dir if response.get('error') else done_dir
+                with open(os.path.join(target_dir, name), 'w') as f:
+                    json.dump({'request': request, 'result': response}, f, indent=2)
+                os.remove(claimed_file)
+
+
+def submit_job(socket_path: str, request: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Envoie un job à un worker et attend son résultat.
+
+    Args:
+        socket_path (str): Chemin du socket Unix du worker
+        request (Dict[str, Any]): Description JSON du job
+        timeout (Optional[float]): Délai maximal d'attente en secondes
+
+    Returns:
+        Dict[str, Any]: Résultat du job
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        with client.makefile('rwb') as stream:
+            stream.write(json.dumps(request).encode() + b'\n')
+            stream.flush()
+            return json.loads(stream.readline())
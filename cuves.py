@@ -1,38 +1,48 @@
 import pymunk
 import pygame
-import os
-from config import *
-from utils.image import create_squared_image
-from utils.color import create_gradient_surface
+import numpy as np
+from collections import deque
+from config import BLANC, GRIS_CUVE, BLEU_GAGNANT, GRIS_TEXTE, OR
+from core.assets import AssetCache
+from utils.fonts import get_font
+from core.config import SimulationConfig
+
+# Type de collision de l'intérieur des cuves (capteurs) ; les billes sont de type 0
+CUVE_SENSOR_TYPE = 5
 
 class CuveManager:
-    def __init__(self, space):
+    def __init__(self, space, config: SimulationConfig, assets: AssetCache):
         self.space = space
+        self.config = config
+        self.assets = assets
         self.cuves = []
         self.counts = [0, 0]  # Compteurs cumulatifs pour chaque cuve
-        self.temp_counts = [0, 0]  # Compteurs temporaires pour l'affichage
-        self.particles_in_cuves = []  # Liste des particules dans les cuves avec leur temps d'entrée
+        self.temp_counts = [0, 0]  # Billes actuellement dans chaque cuve
+        self.counted = set()  # Identifiants des billes déjà comptées (une seule entrée par bille)
+        self.entries = deque()  # (temps d'entrée, identifiant), dans l'ordre des entrées
+        self.pending = []  # Entrées détectées pendant les pas de physique, datées en fin de frame
         self.physics_active = True  # État de la physique
-        
+        self.attach(space)
+
         self._initialize_fonts()
         self._create_gradient_surfaces()
         self._load_response_images()
 
     def _initialize_fonts(self):
         """Initialise les polices de caractères utilisées pour le rendu."""
-        self.font = pygame.font.SysFont("Poppins", CUVE_FONT_SIZE, bold=True)
-        self.fontCounter = pygame.font.SysFont("Poppins", int(CUVE_FONT_SIZE * 0.8), bold=True)
+        self.font = get_font(self.config.cuve_font_size, bold=True)
+        self.fontCounter = get_font(int(self.config.cuve_font_size * 0.8), bold=True)
 
     def _create_gradient_surfaces(self):
         """Crée les surfaces de dégradé pour les cuves."""
         self.gradient_surfaces = []
         for i in range(2):
-            start_color = CUVE_B_COLOR_START if i == 0 else CUVE_A_COLOR_START
-            end_color = CUVE_B_COLOR_END if i == 0 else CUVE_A_COLOR_END
+            start_color = self.config.cuve_b_color_start if i == 0 else self.config.cuve_a_color_start
+            end_color = self.config.cuve_b_color_end if i == 0 else self.config.cuve_a_color_end
             
-            gradient_surface = create_gradient_surface(
-                CUVE_LARGEUR,
-                CUVE_HAUTEUR,
+            gradient_surface = self.assets.gradient(
+                self.config.cuve_largeur,
+                self.config.cuve_hauteur,
                 start_color,
                 end_color,
                 "diagonal"
@@ -42,21 +52,60 @@ class CuveManager:
 
     def _load_response_images(self):
         """Charge les images de réponses pour les cuves."""
-        imgSize = CUVE_HAUTEUR * 0.6
-        self.reponse_a_img = self._load_single_response_image(REPONSE_A_IMAGE_PATH, imgSize)
-        self.reponse_b_img = self._load_single_response_image(REPONSE_B_IMAGE_PATH, imgSize)
+        imgSize = self.config.cuve_hauteur * 0.6
+        self.reponse_a_img = self._load_single_response_image(self.config.reponse_a_image_path, imgSize)
+        self.reponse_b_img = self._load_single_response_image(self.config.reponse_b_image_path, imgSize)
 
     def _load_single_response_image(self, image_path, size):
         """Charge une image de réponse individuelle."""
         if not image_path:
             return None
         try:
-            return create_squared_image(image_path, size, is_circular=REPONSE_CIRCLE)
+            return self.assets.squared_image(image_path, size, is_circular=self.config.reponse_circle)
         except Exception as e:
             print(f"Impossible de charger l'image : {image_path}")
             print(f"Erreur : {str(e)}")
             return None
 
+    def attach(self, space):
+        """Rattache le gestionnaire à un espace physique et y branche la
+        détection des entrées dans les cuves"""
+        self.space = space
+        handler = space.add_collision_handler(0, CUVE_SENSOR_TYPE)
+        handler.begin = self._on_particle_enter
+        handler.separate = self._on_particle_exit
+
+    def reset(self, space):
+        """Vide les compteurs pour une nouvelle partie dans l'espace `space` (cuves déjà présentes)."""
+        self.attach(space)
+        self.counts = [0, 0]
+        self.temp_counts = [0, 0]
+        self.counted = set()
+        self.entries = deque()
+        self.pending = []
+        self.physics_active = True
+
+    def snapshot_state(self):
+        """État des compteurs pour un instantané"""
+        return {
+            'counts': self.counts,
+            'temp_counts': self.temp_counts,
+            'counted': self.counted,
+            'entries': self.entries,
+            'pending': self.pending,
+            'physics_active': self.physics_active,
+        }
+
+    def restore_state(self, state, space):
+        """Reprend l'état d'un instantané dans l'espace restauré `space`"""
+        self.attach(space)
+        self.counts = state['counts']
+        self.temp_counts = state['temp_counts']
+        self.counted = state['counted']
+        self.entries = state['entries']
+        self.pending = state['pending']
+        self.physics_active = state['physics_active']
+
     def set_physics_state(self, active):
         """Active ou désactive la physique."""
         self.physics_active = active
@@ -71,84 +120,100 @@ class CuveManager:
         
         # Ensuite ajouter les segments
         for segment in segments:
-            segment.friction = CUVE_FRICTION
+            segment.friction = self.config.cuve_friction
             segment.color = color
             self.space.add(segment)
-        
-        rect = (x, HEIGHT - CUVE_HAUTEUR, CUVE_LARGEUR, CUVE_HAUTEUR)
+        self.space.add(self._create_cuve_sensor(body, x, len(self.cuves)))
+
+        rect = (x, self.config.height - self.config.cuve_hauteur, self.config.cuve_largeur, self.config.cuve_hauteur)
         self.cuves.append((rect, color))
 
     def _create_cuve_segments(self, body, x):
         """Crée les segments physiques d'une cuve."""
-        base = pymunk.Segment(body, (x, HEIGHT), (x + CUVE_LARGEUR, HEIGHT), 4)
-        left = pymunk.Segment(body, (x, HEIGHT - CUVE_HAUTEUR), (x, HEIGHT), 4)
-        right = pymunk.Segment(body, (x + CUVE_LARGEUR, HEIGHT - CUVE_HAUTEUR), (x + CUVE_LARGEUR, HEIGHT), 4)
+        height, largeur, hauteur = self.config.height, self.config.cuve_largeur, self.config.cuve_hauteur
+        base = pymunk.Segment(body, (x, height), (x + largeur, height), 4)
+        left = pymunk.Segment(body, (x, height - hauteur), (x, height), 4)
+        right = pymunk.Segment(body, (x + largeur, height - hauteur), (x + largeur, height), 4)
         return [base, left, right]
 
-    def update_counts(self, particles):
-        """Met à jour les compteurs de particules dans les cuves."""
-        self._reset_temp_counts()
-        self._update_particle_positions(particles)
-        self._check_particles_in_cuves(particles)
-        self._remove_expired_particles(particles)
+    def _create_cuve_sensor(self, body, x, index):
+        """Crée le capteur qui couvre l'intérieur d'une cuve.
 
-    def _reset_temp_counts(self):
-        """Réinitialise les compteurs temporaires."""
-        self.temp_counts = [0, 0]
+        Le capteur est le rectangle de la cuve réduit du rayon des billes : une
+        bille le touche quand son centre entre dans la cuve."""
+        height, largeur, hauteur = self.config.height, self.config.cuve_largeur, self.config.cuve_hauteur
+        margin = self.config.particle_radius
+        sensor = pymunk.Poly(body, [
+            (x + margin, height - hauteur + margin),
+            (x + largeur - margin, height - hauteur + margin),
+            (x + largeur - margin, height - margin),
+            (x + margin, height - margin),
+        ])
+        sensor.sensor = True
+        sensor.collision_type = CUVE_SENSOR_TYPE
+        sensor.cuve_index = index
+        return sensor
+
+    def _on_particle_enter(self, arbiter, space, data):
+        """Une bille entre dans une cuve : elle n'est comptée qu'à sa première entrée."""
+        particle, sensor = arbiter.shapes
+        particle_id = particle.data["id"]
+        if particle_id not in self.counted:
+            self.counted.add(particle_id)
+            self.counts[sensor.cuve_index] += 1
+            self.pending.append(particle_id)
+        self.temp_counts[sensor.cuve_index] += 1
+        return True
+
+    def _on_particle_exit(self, arbiter, space, data):
+        """Une bille quitte une cuve (ou est retirée de l'espace)."""
+        self.temp_counts[arbiter.shapes[1].cuve_index] -= 1
+
+    def update_counts(self, current_time):
+        """
+        Met à jour les compteurs de particules dans les cuves.
+
+        Les entrées sont détectées par les capteurs pendant les pas de physique ;
+        il ne reste ici qu'à les dater et à relever les billes expirées.
+
+        Args:
+            current_time (float): Temps de simulation en secondes
+
+        Returns:
+            list: Identifiants des billes arrivées au bout de leur temps de vie, à retirer de la partie
+        """
+        for particle_id in self.pending:
+            self.entries.append((current_time, particle_id))
+        self.pending = []
+        return self._pop_expired_particles(current_time)
+
+    def contains_points(self, x, y):
+        """
+        Indique, pour chaque position, si elle est dans une cuve.
+
+        Args:
+            x (np.ndarray): Abscisses
+            y (np.ndarray): Ordonnées
+
+        Returns:
+            np.ndarray: Tableau de booléens, True dans une cuve
+        """
+        inside = np.zeros(len(x), dtype=bool)
+        for rect, _ in self.cuves:
+            inside |= (rect[0] <= x) & (x <= rect[0] + rect[2]) & (rect[1] <= y) & (y <= rect[1] + rect[3])
+        return inside
+
+    def _pop_expired_particles(self, current_time):
+        """Retire de la file les particules qui ont dépassé leur temps de vie.
 
-    def _update_particle_positions(self, particles):
-        """Met à jour les positions des particules avec effet miroir."""
-        for particle in particles:
-            pos = particle.body.position
-            if pos.x < 0:
-                particle.body.position = (WIDTH, pos.y)
-            elif pos.x > WIDTH:
-                particle.body.position = (0, pos.y)
-
-    def _check_particles_in_cuves(self, particles):
-        """Vérifie et compte les particules dans les cuves."""
-        for particle in particles:
-            pos = particle.body.position
-            for i, (rect, _) in enumerate(self.cuves):
-                if self._is_particle_in_rect(pos, rect):
-                    self._handle_particle_in_cuve(particle, i)
-                    break
-
-    def _is_particle_in_rect(self, pos, rect):
-        """Vérifie si une particule est dans un rectangle."""
-        return (rect[0] <= pos.x <= rect[0] + rect[2] and 
-                rect[1] <= pos.y <= rect[1] + rect[3])
-
-    def _handle_particle_in_cuve(self, particle, cuve_index):
-        """Gère une particule entrant dans une cuve."""
-        if not any(p[0] == particle for p in self.particles_in_cuves):
-            self.counts[cuve_index] += 1
-            self.particles_in_cuves.append((particle, pygame.time.get_ticks()))
-        self.temp_counts[cuve_index] += 1
-
-    def _remove_expired_particles(self, particles):
-        """Supprime les particules (formes) qui ont dépassé leur temps de vie."""
-        current_time = pygame.time.get_ticks()
-        particles_to_delete = []
-
-        for shape, entry_time in self.particles_in_cuves[:]:
-            if (current_time - entry_time) / 1000 >= DELAI_DISPARITION:
-                if shape in particles:
-                    particles_to_delete.append(shape)
-                self.particles_in_cuves.remove((shape, entry_time))
-
-        for shape in particles_to_delete:
-            try:
-                body = shape.body
-
-                # VÉRIFICATION : affiche que tu vas bien retirer
-                self.space.remove(shape, body)
-
-                if shape in particles:
-                    particles.remove(shape)
-
-            except Exception as e:
-                print(f"Erreur lors de la suppression d'une particule: {e}")
+        Les entrées sont dans l'ordre chronologique : seules les plus anciennes
+        sont examinées."""
+        expired = []
+        while self.entries and current_time - self.entries[0][0] >= self.config.delai_disparition:
+            _, particle_id = self.entries.popleft()
+            self.counted.discard(particle_id)
+            expired.append(particle_id)
+        return expired
 
     def draw(self, screen):
         """Dessine les cuves et leurs éléments sur l'écran."""
@@ -176,7 +241,7 @@ class CuveManager:
 
     def _draw_winner_gradient(self, screen, rect):
         """Dessine le dégradé pour la cuve gagnante."""
-        temp_surface = create_gradient_surface(
+        temp_surface = self.assets.gradient(
             rect[2],
             rect[3],
             BLEU_GAGNANT,
@@ -201,7 +266,7 @@ class CuveManager:
     def _draw_counter(self, screen, rect, index, text_color):
         """Dessine le compteur de particules."""
         count_text = self.fontCounter.render(str(self.counts[index]), True, text_color)
-        margin = int(WIDTH * 0.02)  # 2% de la largeur de l'écran
+        margin = int(self.config.width * 0.02)  # 2% de la largeur de l'écran
         count_x = rect[0] + margin if index == 0 else rect[0] + rect[2] - margin
         count_rect = count_text.get_rect()
         if index == 0:
@@ -214,18 +279,19 @@ class CuveManager:
 
     def _draw_response_text(self, screen, rect, index, text_color):
         """Dessine le texte de réponse."""
-        status_text = REPONSE_B if index == 0 else REPONSE_A
+        reponse_a, reponse_b = self.config.reponse_a, self.config.reponse_b
+        status_text = reponse_b if index == 0 else reponse_a
         
         # Déterminer la taille de police en fonction du texte le plus long
-        max_text_length = max(len(REPONSE_A), len(REPONSE_B))
+        max_text_length = max(len(reponse_a), len(reponse_b))
         if max_text_length > 20:
-            font_size = int(CUVE_FONT_SIZE * 0.6)
+            font_size = int(self.config.cuve_font_size * 0.6)
         elif max_text_length > 10:
-            font_size = int(CUVE_FONT_SIZE * 0.7)
+            font_size = int(self.config.cuve_font_size * 0.7)
         else:
-            font_size = CUVE_FONT_SIZE
+            font_size = self.config.cuve_font_size
             
-        temp_font = pygame.font.SysFont("Poppins", font_size, bold=True)
+        temp_font = get_font(font_size, bold=True)
         status = temp_font.render(status_text, True, text_color)
             
         status_rect = status.get_rect(center=(rect[0] + rect[2]//2, rect[1] + 5 + status.get_height()//2))
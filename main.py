@@ -1,21 +1,22 @@
 import pygame
 from core.simulator import Simulator
-from config import *
+from config import create_config
 
 def main():
     # Initialisation
     pygame.init()
     pygame.mixer.init()
+    config = create_config()
     
     # Initialisation de l'affichage
-    if VISUAL:
-        screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    if config.visual:
+        screen = pygame.display.set_mode((config.width, config.height))
         pygame.display.set_caption("Simulation de Billes")
     else:
-        screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.HIDDEN)
+        screen = pygame.display.set_mode((config.width, config.height), pygame.HIDDEN)
     
     # Initialisation et démarrage du simulateur
-    simulator = Simulator(WIDTH, HEIGHT)
+    simulator = Simulator(config)
     simulator.start()
     simulator.run(screen)
 
@@ -2,25 +2,33 @@ import pymunk
 import math
 import pygame
 import random
-from config import *
+from config import GRIS
+from core.config import SimulationConfig
 from core.audio import AudioManager
 from core.time import TimeManager
+from core.animation import AnimationScheduler, BounceEffect
+from typing import Optional
+
+# Couleur transparente de l'image fixe des obstacles (jamais celle d'un obstacle)
+LAYER_COLORKEY = (255, 0, 255)
 
 class SoundManager:
-    def __init__(self):
-        self.audio_manager = AudioManager()
-        self.time_manager = TimeManager()
+    def __init__(self, audio_manager: AudioManager, time_manager: TimeManager):
+        self.audio_manager = audio_manager
+        self.time_manager = time_manager
         self.last_play_time = {}  # Pour le cooldown
         self.cooldown = 0.1  # 100ms de cooldown
     
     def play_sound(self, sound_name):
         """Joue un son par son nom avec un système de cooldown"""
-        current_time = self.time_manager.get_current_state().physics_seconds
-        
         # Ne pas jouer de son si la physique n'est plus active
         if not self.time_manager.physics_active:
             return
-            
+        self.play_sound_at(sound_name, self.time_manager.get_current_state().physics_seconds)
+
+    def play_sound_at(self, sound_name, current_time):
+        """Joue un son au temps de physique `current_time` (déjà connu de
+        l'appelant), sauf pendant le cooldown du même son"""
         # Vérifier si le son peut être joué (cooldown)
         if sound_name in self.last_play_time:
             if current_time - self.last_play_time[sound_name] < self.cooldown:
@@ -30,28 +38,82 @@ class SoundManager:
         self.last_play_time[sound_name] = current_time
 
 class ObstacleManager:
-    def __init__(self, space):
+    def __init__(self, space, config: SimulationConfig, time_manager: TimeManager, audio_manager: AudioManager, rng: Optional[random.Random] = None):
         self.space = space
+        self.config = config
+        self.rng = rng or random.Random()
         self.shapes = []
         self.rotating_shapes = []  # Liste des formes qui tournent
         self.pivot_joints = []  # Liste des joints de pivot
+        self.pivot_motors = []  # Freins des barres pivotantes (un moteur par barre)
         self.pivot_bars = []  # Liste des barres pivotantes
+        self.pivot_specs = []  # Position, longueur et masse de chaque barre pivotante (pour les recréer)
         # Zone protégée pour la question
         self.question_zone_width = 800  # Largeur de la zone protégée
         self.question_zone_height = 100  # Hauteur de la zone protégée
-        self.sound_manager = SoundManager()
-        # Limites de vitesse pour les barres pivotantes
-        self.max_angular_velocity = 5.0  # Vitesse angulaire maximale
-        self.max_linear_velocity = 300.0  # Vitesse linéaire maximale
-        # Animation des obstacles circulaires
-        self.circular_animations = {}  # Dictionnaire pour stocker les animations
+        self.sound_manager = SoundManager(audio_manager, time_manager)
+        # Frein des barres pivotantes : décélération angulaire maximale (rad/s²)
+        self.pivot_brake = 10.0
+        # Vitesse angulaire maximale des barres pivotantes (rad/s), imposée à chaque frame
+        self.max_angular_velocity = 5.0
+        # Effets en cours (rebond des obstacles circulaires touchés)
+        self.animations = AnimationScheduler()
+        # Image des obstacles fixes au repos, composée au premier dessin
+        self.static_layer = None
+        self.moving_shapes = []  # Formes redessinées à chaque frame (barres rotatives et pivotantes)
         # Épaisseur des barres
         self.BAR_THICKNESS = 4  # Épaisseur uniforme pour toutes les barres
+        # Corps statique propre à la scène (celui de l'espace ne peut pas changer d'espace)
+        self.static_body = pymunk.Body(body_type=pymunk.Body.STATIC)
+        self.space.add(self.static_body)
+        self.attach(space)
+
+    def attach(self, space):
+        """Rattache le gestionnaire à un espace physique et y branche les
+        gestionnaires de collision (seul endroit où ils sont enregistrés)"""
+        self.space = space
+        self.setup_collision_handlers()
+
+    def reset(self, space):
+        """Reprend la scène dans un espace neuf où PhysicsSpace a remis sa
+        partie fixe : les barres pivotantes (dynamiques) sont recréées,
+        animations et délais des sons repartent de zéro"""
+        self.attach(space)
+        pivot_specs = self.pivot_specs
+        self.shapes = [shape for shape in self.shapes if shape.body not in self.pivot_bars]
+        self.pivot_specs, self.pivot_joints, self.pivot_motors, self.pivot_bars = [], [], [], []
+        for position, length, mass in pivot_specs:
+            self.create_pivot_bar(position, length, mass=mass)
+        self.sound_manager.last_play_time = {}
+        self.animations.clear()
+
+    def snapshot_state(self):
+        """État de la scène pour un instantané (les objets sont ceux de l'espace)"""
+        return {
+            'static_body': self.static_body,
+            'shapes': self.shapes,
+            'rotating_shapes': self.rotating_shapes,
+            'pivot_joints': self.pivot_joints,
+            'pivot_motors': self.pivot_motors,
+            'pivot_bars': self.pivot_bars,
+            'pivot_specs': self.pivot_specs,
+            'animations': self.animations,
+            'last_play_time': self.sound_manager.last_play_time,
+        }
+
+    def restore_state(self, state, space):
+        """Reprend l'état d'un instantané dans l'espace restauré `space`"""
+        for name in ('static_body', 'shapes', 'rotating_shapes', 'pivot_joints', 'pivot_motors',
+                     'pivot_bars', 'pivot_specs', 'animations'):
+            setattr(self, name, state[name])
+        self.static_layer = None
+        self.sound_manager.last_play_time = state['last_play_time']
+        self.attach(space)
 
     def is_in_question_zone(self, position):
         """Vérifie si une position est dans la zone horizontale de la question"""
         x, y = position
-        question_x, question_y = QUESTION_POSITION
+        question_x, question_y = self.config.question_position
         
         # Vérifie si la position est dans le rectangle horizontal
         in_x_range = abs(x - question_x) < self.question_zone_width / 2
@@ -74,13 +136,22 @@ class ObstacleManager:
         shape.collision_type = 1
         shape.sound_name = 'A'  # Son A pour les barres pivotantes
         
-        pivot = pymunk.PivotJoint(self.space.static_body, body, position)
+        pivot = pymunk.PivotJoint(self.static_body, body, position)
         pivot.collide_bodies = False
+
+        # Frein appliqué par le solveur à chaque pas : moteur de vitesse nulle
+        # dont le couple est borné, la barre tourne librement sous les chocs
+        # et ralentit d'elle-même (le plafond est assuré par limit_pivot_speed)
+        motor = pymunk.SimpleMotor(self.static_body, body, 0)
+        motor.max_force = moment * self.pivot_brake
         
-        self.space.add(body, shape, pivot)
+        self.space.add(body, shape, pivot, motor)
         self.shapes.append(shape)
+        self.static_layer = None
         self.pivot_joints.append(pivot)
+        self.pivot_motors.append(motor)
         self.pivot_bars.append(body)
+        self.pivot_specs.append((position, length, mass))
 
     def create_entonnoir(self, position, radius, segments=60):
         if self.is_in_question_zone(position):
@@ -101,13 +172,14 @@ class ObstacleManager:
         self.space.add(body, *shapes)
         self.shapes.extend(shapes)
 
-    def create_rotating_obstacle(self, position, length, rotation_speed=2.0):
-        """Crée une barre qui tourne sur elle-même de manière continue"""
+    def create_rotating_obstacle(self, position, length, rotation_speed=2.0, direction=None):
+        """Crée une barre qui tourne sur elle-même de manière continue
+        direction: 1 ou -1 pour imposer le sens de rotation, None pour le tirer au hasard"""
         if self.is_in_question_zone(position):
             return
             
         # Vérifier que les points finaux de la barre ne dépassent pas la hauteur minimale
-        min_height = HEIGHT - CUVE_HAUTEUR - 40  # 40px de marge
+        min_height = self.config.height - self.config.cuve_hauteur - 40  # 40px de marge
         x, y = position
         
         # Calculer les points finaux de la barre
@@ -133,9 +205,11 @@ class ObstacleManager:
         # Ajouter le corps et la forme à l'espace
         self.space.add(body, shape)
         self.shapes.append(shape)
+        self.static_layer = None
         
         # Définir une vitesse de rotation aléatoire (gauche ou droite)
-        direction = 1 if random.random() > 0.5 else -1
+        if direction is None:
+            direction = 1 if self.rng.random() > 0.5 else -1
         rotation_speed = rotation_speed * direction
         
         # Ajouter à la liste des formes rotatives
@@ -147,7 +221,7 @@ class ObstacleManager:
             return
             
         # Vérifier que l'obstacle ne dépasse pas la hauteur minimale
-        min_height = HEIGHT - CUVE_HAUTEUR - 40  # 40px de marge
+        min_height = self.config.height - self.config.cuve_hauteur - 40  # 40px de marge
         x, y = position
         
         # Si le point le plus bas du cercle dépasse la hauteur minimale, on ne crée pas l'obstacle
@@ -164,12 +238,7 @@ class ObstacleManager:
         body.position = position
         self.space.add(body, shape)
         self.shapes.append(shape)
-        # Initialiser l'animation pour cet obstacle
-        self.circular_animations[shape] = {
-            'scale': 1.0,
-            'target_scale': 1.0,
-            'animation_speed': 0.2
-        }
+        self.static_layer = None
 
     def create_obstacle(self, p1, p2):
         """Crée un obstacle statique normal"""
@@ -177,127 +246,148 @@ class ObstacleManager:
             return
         body = pymunk.Body(body_type=pymunk.Body.STATIC)
         shape = pymunk.Segment(body, p1, p2, self.BAR_THICKNESS)
-        shape.friction = OBSTACLE_FRICTION
-        shape.elasticity = OBSTACLE_ELASTICITY
+        shape.friction = self.config.obstacle_friction
+        shape.elasticity = self.config.obstacle_elasticity
         shape.collision_type = 4  # Type de collision pour les obstacles normaux
         self.space.add(body, shape)
         self.shapes.append(shape)
+        self.static_layer = None
 
     def create_floor(self):
+        width, height = self.config.width, self.config.height
         # Création du plancher
-        floor = pymunk.Segment(self.space.static_body, (0, HEIGHT), (WIDTH, HEIGHT), 10)
+        floor = pymunk.Segment(self.static_body, (0, height), (width, height), 10)
         floor.friction = 1
         self.space.add(floor)
         self.shapes.append(floor)
 
         # Création du plafond invisible
-        ceiling = pymunk.Segment(self.space.static_body, (0, 0), (WIDTH, 0), 1)
+        ceiling = pymunk.Segment(self.static_body, (0, 0), (width, 0), 1)
         ceiling.friction = 0.1
         ceiling.elasticity = 0.5
         self.space.add(ceiling)
         self.shapes.append(ceiling)
+        self.static_layer = None
 
     def update(self, dt):
-        """Met à jour la rotation des barres et limite leur vitesse"""
+        """Met à jour la rotation des barres et les animations"""
         # Mise à jour des barres rotatives
         for body, speed in self.rotating_shapes:
             body.angle += speed * dt
 
-        # Limitation de la vitesse des barres pivotantes
+        # Seuls les effets en cours avancent
+        self.animations.update()
+
+    def limit_pivot_speed(self):
+        """Plafonne la vitesse angulaire des barres pivotantes, après la
+        physique de la frame : le frein du solveur ne fait que ralentir, un
+        choc violent pourrait sinon les emballer"""
+        limit = self.max_angular_velocity
         for body in self.pivot_bars:
-            # Limitation de la vitesse angulaire
-            if abs(body.angular_velocity) > self.max_angular_velocity:
-                body.angular_velocity = self.max_angular_velocity * (1 if body.angular_velocity > 0 else -1)
-            
-            # Limitation de la vitesse linéaire
-            velocity = body.velocity
-            speed = (velocity.x * velocity.x + velocity.y * velocity.y) ** 0.5
-            if speed > self.max_linear_velocity:
-                factor = self.max_linear_velocity / speed
-                body.velocity = velocity.x * factor, velocity.y * factor
-
-        # Mise à jour des animations des obstacles circulaires
-        for shape, anim in self.circular_animations.items():
-            if anim['scale'] != anim['target_scale']:
-                # Animation de retour à la taille normale
-                anim['scale'] += (anim['target_scale'] - anim['scale']) * anim['animation_speed']
-                if abs(anim['scale'] - anim['target_scale']) < 0.01:
-                    anim['scale'] = anim['target_scale']
+            if abs(body.angular_velocity) > limit:
+                body.angular_velocity = math.copysign(limit, body.angular_velocity)
 
-    def draw(self, screen):
-        # Dessiner les formes
-        for shape in self.shapes:
-            if isinstance(shape, pymunk.Segment):
-                # Pour les segments rotatifs ou amovibles, on utilise la position et l'angle du corps
-                if shape.body.body_type in (pymunk.Body.KINEMATIC, pymunk.Body.DYNAMIC):
-                    pos = shape.body.position
-                    angle = shape.body.angle
-                    length = (shape.b - shape.a).length
-                    # Calculer les points finaux en tenant compte de la rotation
-                    p1 = (pos.x + math.cos(angle) * (-length/2), pos.y + math.sin(angle) * (-length/2))
-                    p2 = (pos.x + math.cos(angle) * (length/2), pos.y + math.sin(angle) * (length/2))
-                else:
-                    p1 = shape.a
-                    p2 = shape.b
-                color = getattr(shape, "color", GRIS)
-                # Utiliser l'épaisseur de la barre pour le rendu
-                pygame.draw.line(screen, color, p1, p2, self.BAR_THICKNESS)
-            elif isinstance(shape, pymunk.Circle):
+    def _draw_shape(self, surface, shape, scale=1.0):
+        """Dessine une forme (les cercles à l'échelle `scale`)"""
+        color = getattr(shape, "color", GRIS)
+        if isinstance(shape, pymunk.Segment):
+            # Pour les segments rotatifs ou amovibles, on utilise la position et l'angle du corps
+            if shape.body.body_type in (pymunk.Body.KINEMATIC, pymunk.Body.DYNAMIC):
                 pos = shape.body.position
-                radius = shape.radius
-                color = getattr(shape, "color", GRIS)
-                
-                # Appliquer l'effet d'animation si l'obstacle est dans le dictionnaire d'animations
-                if shape in self.circular_animations:
-                    anim = self.circular_animations[shape]
-                    radius = int(radius * anim['scale'])
-                
-                # Dessiner un cercle plein anti-aliased
-                pygame.draw.circle(screen, color, (int(pos.x), int(pos.y)), radius)
+                angle = shape.body.angle
+                length = (shape.b - shape.a).length
+                # Calculer les points finaux en tenant compte de la rotation
+                p1 = (pos.x + math.cos(angle) * (-length/2), pos.y + math.sin(angle) * (-length/2))
+                p2 = (pos.x + math.cos(angle) * (length/2), pos.y + math.sin(angle) * (length/2))
+            else:
+                p1 = shape.a
+                p2 = shape.b
+            # Utiliser l'épaisseur de la barre pour le rendu
+            pygame.draw.line(surface, color, p1, p2, self.BAR_THICKNESS)
+        elif isinstance(shape, pymunk.Circle):
+            pos = shape.body.position
+            pygame.draw.circle(surface, color, (int(pos.x), int(pos.y)), int(shape.radius * scale))
+
+    def _build_static_layer(self):
+        """Compose l'image des obstacles fixes au repos et la liste des formes
+        qui bougent. Les obstacles fixes sont tous créés avant les barres
+        rotatives et pivotantes : l'ordre de dessin ne change pas."""
+        layer = pygame.Surface((self.config.width, self.config.height))
+        layer.fill(LAYER_COLORKEY)
+        self.moving_shapes = []
+        for shape in self.shapes:
+            if shape.body.body_type == pymunk.Body.STATIC:
+                self._draw_shape(layer, shape)
+            else:
+                self.moving_shapes.append(shape)
+        # Couleur transparente encodée par plages : la copie saute les zones vides
+        layer.set_colorkey(LAYER_COLORKEY, pygame.RLEACCEL)
+        self.static_layer = layer
+
+    def draw(self, screen):
+        """Dessine les obstacles : l'image fixe, puis par-dessus les obstacles
+        en cours d'animation et les barres qui bougent"""
+        if self.static_layer is None:
+            self._build_static_layer()
+        screen.blit(self.static_layer, (0, 0))
+
+        # Un cercle agrandi recouvre entièrement son image au repos
+        for shape in self.animations.dirty:
+            self._draw_shape(screen, shape, self.animations.get(shape).scale)
+
+        for shape in self.moving_shapes:
+            self._draw_shape(screen, shape)
 
     def setup_collision_handlers(self):
-        """Configure les gestionnaires de collision"""
-        def handle_collision(arbiter, space, data):
-            # Ne pas traiter les collisions si la physique n'est plus active
-            if not self.sound_manager.time_manager.physics_active:
-                return True
-                
-            shape1, shape2 = arbiter.shapes
-            
-            # Gérer l'animation des obstacles circulaires
-            for shape in [shape1, shape2]:
-                if isinstance(shape, pymunk.Circle) and shape in self.circular_animations:
-                    anim = self.circular_animations[shape]
-                    anim['scale'] = 1.3  # Agrandissement initial
-                    anim['target_scale'] = 1.0  # Retour à la taille normale
-            
-            # Ne jouer le son que si au moins un des objets est un obstacle spécial (type 1, 2, 3)
-            # et qu'aucun n'est un obstacle normal (type 4)
-            if ((shape1.collision_type in [1, 2, 3] or shape2.collision_type in [1, 2, 3]) and
-                shape1.collision_type != 4 and shape2.collision_type != 4):
-                # Jouer le son approprié
-                if hasattr(shape1, 'sound_name') and shape1.sound_name:
-                    self.sound_manager.play_sound(shape1.sound_name)
-                elif hasattr(shape2, 'sound_name') and shape2.sound_name:
-                    self.sound_manager.play_sound(shape2.sound_name)
-            
-            return True
-
-        def prevent_rotation(arbiter, space, data):
-            pivot_bar = arbiter.shapes[0].body
-            # Limitation immédiate de la vitesse angulaire lors de la collision
-            if abs(pivot_bar.angular_velocity) > self.max_angular_velocity:
-                pivot_bar.angular_velocity = self.max_angular_velocity * (1 if pivot_bar.angular_velocity > 0 else -1)
-            return True
-
-        # Ajout des gestionnaires de collision avec sons pour tous les types d'obstacles
-        # Collision entre billes et obstacles normaux (type 0)
-        self.space.add_collision_handler(0, 1).separate = handle_collision  # Bille avec barre pivotante
-        self.space.add_collision_handler(0, 2).separate = handle_collision  # Bille avec obstacle rotatif
-        self.space.add_collision_handler(0, 3).separate = handle_collision  # Bille avec obstacle circulaire
-        self.space.add_collision_handler(0, 4).separate = handle_collision  # Bille avec obstacle normal
+        """Configure les gestionnaires de collision.
+
+        Pendant les pas de physique, une séparation ne fait qu'ajouter la paire
+        de formes à `collision_events` ; sons et animations sont traités une
+        fois par frame par `process_collisions`. Les paires sans effet (bille
+        contre obstacle normal) n'ont pas de gestionnaire."""
+        self.collision_events = []
+
+        def record_collision(arbiter, space, data):
+            self.collision_events.append(arbiter.shapes)
+
+        # Collisions avec son : bille ou obstacle contre un obstacle spécial (types 1, 2, 3)
+        self.space.add_collision_handler(0, 1).separate = record_collision  # Bille avec barre pivotante
+        self.space.add_collision_handler(0, 2).separate = record_collision  # Bille avec obstacle rotatif
+        self.space.add_collision_handler(0, 3).separate = record_collision  # Bille avec obstacle circulaire
 
         # Collisions entre obstacles
-        self.space.add_collision_handler(1, 2).separate = handle_collision  # Barre pivotante avec obstacle rotatif
-        self.space.add_collision_handler(1, 3).separate = handle_collision  # Barre pivotante avec obstacle circulaire
-        self.space.add_collision_handler(2, 3).separate = handle_collision  # Obstacle rotatif avec obstacle circulaire 
\ No newline at end of file
+        self.space.add_collision_handler(1, 2).separate = record_collision  # Barre pivotante avec obstacle rotatif
+        self.space.add_collision_handler(1, 3).separate = record_collision  # Barre pivotante avec obstacle circulaire
+        self.space.add_collision_handler(2, 3).separate = record_collision  # Obstacle rotatif avec obstacle circulaire
+
+    def process_collisions(self):
+        """Traite en une fois les collisions de la frame : animation des
+        obstacles circulaires touchés et sons (avec leur délai minimal)"""
+        events = self.collision_events
+        if not events:
+            return
+        self.collision_events = []
+
+        # Ne pas traiter les collisions si la physique n'est plus active
+        time_manager = self.sound_manager.time_manager
+        if not time_manager.physics_active:
+            return
+        current_time = time_manager.get_current_state().physics_seconds
+
+        # Chipmunk sépare les contacts dans l'ordre de leurs adresses mémoire, qui
+        # varie d'un processus ou d'un thread à l'autre : on fixe l'ordre de la frame
+        # (type puis position de chaque forme) pour que sons et variations soient reproductibles
+        events.sort(key=lambda shapes: tuple(
+            (shape.collision_type, shape.body.position.x, shape.body.position.y) for shape in shapes
+        ))
+
+        for shape1, shape2 in events:
+            # Rebond des obstacles circulaires touchés
+            for shape in (shape1, shape2):
+                if shape.collision_type == 3:
+                    self.animations.start(shape, BounceEffect())
+
+            # Son de la première forme qui en a un
+            sound_name = getattr(shape1, 'sound_name', None) or getattr(shape2, 'sound_name', None)
+            if sound_name:
+                self.sound_manager.play_sound_at(sound_name, current_time) 
\ No newline at end of file
@@ -1,13 +1,134 @@
 import pymunk
-import random
+import pymunk.batch
 import math
-from config import *
+import numpy as np
+from typing import Optional
+from config import create_config, OR
+from core.config import SimulationConfig
+from core.profiler import FrameProfiler
 import pygame
 
+# Célérité au-delà de laquelle une bille est retirée (sortie de la physique)
+MAX_SPEED = 5000
+
+# Nombre maximal de lueurs gardées en cache (une par couleur et intensité)
+GLOW_CACHE_SIZE = 2048
+
+
+class ParticleArrays:
+    """
+    Miroir en tableaux numpy de l'état des billes vivantes, case pour case
+    avec `ParticleManager.particles` : position (x, y), vitesse (vx, vy),
+    bille en or, et pour la détection des billes coincées le début de
+    l'immobilité (NaN si la bille bouge) et la relance déjà donnée.
+
+    `refresh` relit positions et vitesses de tous les corps de l'espace en un
+    seul appel (pymunk.batch) : les traitements par frame deviennent des
+    opérations sur les tableaux au lieu d'une boucle sur les objets pymunk.
+    """
+    FIELDS = pymunk.batch.BodyFields.BODY_ID | pymunk.batch.BodyFields.POSITION | pymunk.batch.BodyFields.VELOCITY
+
+    def __init__(self, capacity: int = 256):
+        self.size = 0
+        self.body_ids = np.zeros(capacity, dtype=np.uintp)
+        self.kinematics = np.zeros((capacity, 4))  # Colonnes x, y, vx, vy
+        self.golden = np.zeros(capacity, dtype=bool)
+        self.still_since = np.full(capacity, np.nan)
+        self.nudged = np.zeros(capacity, dtype=bool)
+        self.buffer = pymunk.batch.Buffer()
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.kinematics[:self.size, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.kinematics[:self.size, 1]
+
+    @property
+    def vx(self) -> np.ndarray:
+        return self.kinematics[:self.size, 2]
+
+    @property
+    def vy(self) -> np.ndarray:
+        return self.kinematics[:self.size, 3]
+
+    def append(self, body: pymunk.Body, golden: bool) -> None:
+        """Ajoute une bille en dernière case (capacité doublée au besoin)."""
+        if self.size == len(self.body_ids):
+            capacity = 2 * len(self.body_ids)
+            self.body_ids = np.resize(self.body_ids, capacity)
+            self.kinematics = np.resize(self.kinematics, (capacity, 4))
+            self.golden = np.resize(self.golden, capacity)
+            self.still_since = np.resize(self.still_since, capacity)
+            self.nudged = np.resize(self.nudged, capacity)
+        self.body_ids[self.size] = body.id
+        self.kinematics[self.size] = (*body.position, *body.velocity)
+        self.golden[self.size] = golden
+        self.still_since[self.size] = np.nan
+        self.nudged[self.size] = False
+        self.size += 1
+
+    def swap_remove(self, slot: int) -> None:
+        """Retire la case `slot` en y mettant la dernière (comme `ParticleManager.flush_removals`)."""
+        self.size -= 1
+        last = self.size
+        self.body_ids[slot] = self.body_ids[last]
+        self.kinematics[slot] = self.kinematics[last]
+        self.golden[slot] = self.golden[last]
+        self.still_since[slot] = self.still_since[last]
+        self.nudged[slot] = self.nudged[last]
+
+    def rebuild(self, particles) -> None:
+        """Reconstruit le miroir à partir des formes (après restauration d'un
+        instantané) ; le suivi des billes immobiles repart de zéro."""
+        self.size = 0
+        for shape in particles:
+            self.append(shape.body, shape.data["is_golden"])
+
+    def refresh(self, space: pymunk.Space) -> None:
+        """Relit positions et vitesses de toutes les billes en un seul passage."""
+        if not self.size:
+            return
+        self.buffer.clear()
+        pymunk.batch.get_space_bodies(space, self.FIELDS, self.buffer)
+        ids = np.frombuffer(self.buffer.int_buf(), dtype=np.uintp)
+        values = np.frombuffer(self.buffer.float_buf(), dtype=np.float64).reshape(-1, 4)
+        # Les corps de l'espace ne sont pas dans l'ordre des cases : correspondance par identifiant
+        order = np.argsort(ids)
+        rows = order[np.searchsorted(ids, self.body_ids[:self.size], sorter=order)]
+        self.kinematics[:self.size] = values[rows]
+
 class ParticleManager:
-    def __init__(self, space):
+    """
+    Registre des billes de la partie.
+
+    Chaque bille reçoit à l'émission un identifiant stable (`shape.data["id"]`).
+    `particles` est un tableau compact : une bille retirée y est remplacée par
+    la dernière, et `slots` donne la case de chaque identifiant. Les retraits
+    demandés pendant la frame sont appliqués ensemble par `flush_removals`.
+    `state` en est le miroir numpy, relu une fois par frame par `refresh_state`.
+
+    Les billes retirées (corps et forme) vont dans une réserve où l'émission
+    les reprend avant d'en créer de nouvelles.
+    """
+    def __init__(self, space, config: Optional[SimulationConfig] = None, profiler: Optional[FrameProfiler] = None):
         self.space = space
+        self.config = config or create_config()
+        self.profiler = profiler or FrameProfiler()
+        self.pool = []  # Formes retirées de l'espace, prêtes à resservir
+        self.pool_hits = 0  # Émissions servies par la réserve
+        self.pool_allocations = 0  # Billes créées faute de forme en réserve
+        self.stuck_nudged = 0  # Billes coincées relancées
+        self.stuck_retired = 0  # Billes coincées retirées
+        self.stuck_seconds_saved = 0.0  # Secondes de physique que les billes retirées auraient encore coûtées
+        # Moments d'inertie des deux masses de bille (normale et en or)
+        self.moments = {mass: pymunk.moment_for_circle(mass, 0, self.config.particle_radius) for mass in (1, 3)}
         self.particles = []
+        self.slots = {}  # Identifiant de bille -> case dans particles
+        self.pending_removals = {}  # Identifiant -> bille à retirer en fin de frame
+        self.state = ParticleArrays()
+        self.glow_sprites = {}  # (r, g, b, intensité) -> surface de lueur
         self.spawn_time = 0
         self.spawn_amplitude = 200  # Amplitude de l'oscillation
         self.spawn_frequency = 2  # Fréquence de l'oscillation
@@ -15,101 +136,244 @@ class ParticleManager:
         
         # Chargement de la texture si spécifiée
         self.texture = None
-        if PARTICLE_TEXTURE_PATH:
+        if self.config.particle_texture_path:
             try:
                 # Charger l'image
-                texture = pygame.image.load(PARTICLE_TEXTURE_PATH)
+                texture = pygame.image.load(self.config.particle_texture_path)
                 # Redimensionner l'image à la taille de la particule
-                texture_size = PARTICLE_RADIUS * 2
+                texture_size = self.config.particle_radius * 2
                 self.texture = pygame.transform.smoothscale(texture, (texture_size, texture_size))
             except:
-                print(f"Impossible de charger la texture: {PARTICLE_TEXTURE_PATH}")
+                print(f"Impossible de charger la texture: {self.config.particle_texture_path}")
                 self.texture = None
 
     def emit_particle(self):
-        x = WIDTH // 2 + self.spawn_amplitude * math.sin(self.spawn_time * self.spawn_frequency)
+        particle_radius = self.config.particle_radius
+        x = self.config.width // 2 + self.spawn_amplitude * math.sin(self.spawn_time * self.spawn_frequency)
         y = 50
 
         # Déterminer si c'est une balle en or
         self.particle_count += 1
-        is_golden = (self.particle_count % GOLDEN_PARTICLE_FREQUENCY) == 0
+        is_golden = (self.particle_count % self.config.golden_particle_frequency) == 0
         mass = 3 if is_golden else 1
 
-        body = pymunk.Body(mass, pymunk.moment_for_circle(mass, 0, PARTICLE_RADIUS))
+        if self.pool:
+            shape = self.pool.pop()
+            body = shape.body
+            body.mass = mass
+            body.moment = self.moments[mass]
+            body.angle = 0
+            body.velocity = 0, 0
+            body.angular_velocity = 0
+            body.force = 0, 0
+            body.torque = 0
+            shape.data["id"] = self.particle_count
+            shape.data["is_golden"] = is_golden
+            self.pool_hits += 1
+            self.profiler.count('pool.hits')
+        else:
+            body = pymunk.Body(mass, self.moments[mass])
+            shape = pymunk.Circle(body, particle_radius)
+            shape.friction = self.config.particle_friction
+            shape.elasticity = self.config.particle_elasticity
+            shape.data = {"id": self.particle_count, "is_golden": is_golden}
+            self.pool_allocations += 1
+            self.profiler.count('pool.allocations')
         body.position = x, y
-        shape = pymunk.Circle(body, PARTICLE_RADIUS)
-        shape.friction = PARTICLE_FRICTION
-        shape.elasticity = PARTICLE_ELASTICITY
-        shape.data = {"is_golden": is_golden}
 
         self.space.add(body, shape)
+        self.slots[self.particle_count] = len(self.particles)
         self.particles.append(shape)
+        self.state.append(body, is_golden)
 
         self.spawn_time += 0.1
 
+    def snapshot_state(self):
+        """État des billes pour un instantané (les formes sont celles de l'espace)"""
+        return {
+            'particles': self.particles,
+            'slots': self.slots,
+            'pending_removals': self.pending_removals,
+            'pool': self.pool,
+            'pool_counts': (self.pool_hits, self.pool_allocations),
+            'stuck': (self.stuck_nudged, self.stuck_retired, self.stuck_seconds_saved),
+            'spawn_time': self.spawn_time,
+            'particle_count': self.particle_count,
+        }
 
-    def draw(self, screen):
-        for shape in self.particles:
-            pos = shape.body.position
-            velocity = shape.body.velocity
-            speed = math.sqrt(velocity.x**2 + velocity.y**2)
-            
-            # Supprimer la balle si elle va trop vite (plus de 1000 unités)
-            if speed > 5000:
-                print(f"Balle supprimée - Célérité excessive: {speed:.2f} unités/s")
-                self.space.remove(shape)
-                self.space.remove(shape.body)
-                self.particles.remove(shape)
-                continue
-            
-            # S'assurer que la position est dans les limites de l'écran
-            x = max(0, min(WIDTH, pos[0]))
-            y = max(0, min(HEIGHT, pos[1]))
-            
-            if shape.data["is_golden"]:
-                # Couleur dorée pour les balles en or
-                r, g, b = OR
+    def restore_state(self, state, space):
+        """Reprend l'état d'un instantané dans l'espace restauré `space`"""
+        self.space = space
+        self.particles = state['particles']
+        self.slots = state['slots']
+        self.pending_removals = state['pending_removals']
+        self.pool = state['pool']
+        self.pool_hits, self.pool_allocations = state['pool_counts']
+        self.stuck_nudged, self.stuck_retired, self.stuck_seconds_saved = state['stuck']
+        self.spawn_time = state['spawn_time']
+        self.particle_count = state['particle_count']
+        self.state.rebuild(self.particles)
+
+    def contains(self, particle_id):
+        """Indique si la bille est encore dans la partie."""
+        return particle_id in self.slots
+
+    def remove(self, particle_id):
+        """Demande le retrait d'une bille, appliqué par `flush_removals`.
+        Une bille déjà retirée ou déjà demandée est ignorée."""
+        if self.contains(particle_id):
+            self.pending_removals[particle_id] = self.particles[self.slots[particle_id]]
+
+    @property
+    def pool_hit_rate(self):
+        """Part des émissions servies par la réserve (None avant la première émission)."""
+        emitted = self.pool_hits + self.pool_allocations
+        return self.pool_hits / emitted if emitted else None
+
+    def refresh_state(self):
+        """Relit l'état des billes après les pas de physique (une fois par frame)."""
+        self.state.refresh(self.space)
+
+    def wrap_positions(self):
+        """Effet miroir : une bille sortie d'un côté de l'écran revient par l'autre."""
+        width = self.config.width
+        x, y = self.state.x, self.state.y
+        for slot in np.flatnonzero((x < 0) | (x > width)).tolist():
+            x[slot] = width if x[slot] < 0 else 0
+            self.particles[slot].body.position = (x[slot], y[slot])
+
+    def remove_fast_particles(self):
+        """Demande le retrait des billes trop rapides (célérité au-delà de MAX_SPEED)."""
+        vx, vy = self.state.vx, self.state.vy
+        speeds = np.sqrt(vx * vx + vy * vy)
+        for slot in np.flatnonzero(speeds > MAX_SPEED).tolist():
+            print(f"Balle supprimée - Célérité excessive: {speeds[slot]:.2f} unités/s")
+            self.remove(self.particles[slot].data["id"])
+
+    def handle_stuck_particles(self, physics_time, in_cuve):
+        """
+        Relance les billes immobiles hors des cuves depuis `stuck_delay`
+        secondes, puis retire celles qui restent coincées après une relance.
+
+        Args:
+            physics_time (float): Temps de physique en secondes
+            in_cuve (np.ndarray): Pour chaque case, True si la bille est dans une cuve
+        """
+        delay = self.config.stuck_delay
+        state = self.state
+        if delay is None or not state.size:
+            return
+        size = state.size
+        speeds = np.sqrt(state.vx * state.vx + state.vy * state.vy)
+        still = (speeds < self.config.stuck_speed) & ~in_cuve
+        still_since = state.still_since[:size]
+        still_since[~still] = np.nan
+        still_since[still & np.isnan(still_since)] = physics_time
+
+        for slot in np.flatnonzero(physics_time - still_since >= delay).tolist():
+            shape = self.particles[slot]
+            if state.nudged[slot]:
+                self.remove(shape.data["id"])
+                self.stuck_retired += 1
+                self.stuck_seconds_saved += max(0.0, self.config.temps_limite - physics_time)
+                self.profiler.count('stuck.retired')
             else:
-                # Variation de couleur bleue basée sur la vitesse et la position
-                base_blue = 200  # Bleu de base
-                speed_factor = min(1.0, speed / 500)  # Normalisation de la vitesse
-                position_factor = (y / HEIGHT)  # Facteur basé sur la position Y
-                
-                # Calcul des composantes de couleur avec limitation à 255
-                r = min(255, max(0, int(100 + speed_factor * 50)))  # Rouge légèrement variable
-                g = min(255, max(0, int(150 + speed_factor * 50)))  # Vert légèrement variable
-                b = min(255, max(0, int(base_blue + position_factor * 55)))  # Bleu variable selon la position
-            
-            # Effet de lueur basé sur la vitesse
-            glow_intensity = min(255, max(0, int(speed * 2)))
-            
-            # Créer une surface pour l'effet de lueur
-            glow_size = PARTICLE_RADIUS * 4
+                # Poussée vers le haut, d'un côté ou de l'autre selon la bille
+                side = 1 if shape.data["id"] % 2 else -1
+                shape.body.velocity = side * self.config.stuck_nudge, -self.config.stuck_nudge
+                state.vx[slot], state.vy[slot] = shape.body.velocity
+                state.nudged[slot] = True
+                still_since[slot] = np.nan
+                self.stuck_nudged += 1
+                self.profiler.count('stuck.nudged')
+
+    def flush_removals(self):
+        """Retire de l'espace et du registre les billes demandées pendant la frame."""
+        for particle_id, shape in self.pending_removals.items():
+            slot = self.slots.pop(particle_id)
+            last = self.particles.pop()
+            self.state.swap_remove(slot)
+            if last is not shape:
+                self.particles[slot] = last
+                self.slots[last.data["id"]] = slot
+            try:
+                self.space.remove(shape, shape.body)
+                self.pool.append(shape)
+            except Exception as e:
+                print(f"Erreur lors de la suppression d'une particule: {e}")
+        self.pending_removals = {}
+
+    def _glow_sprite(self, r, g, b, glow_intensity):
+        """Surface de lueur d'une couleur et d'une intensité (mise en cache)."""
+        key = (r, g, b, glow_intensity)
+        glow_surf = self.glow_sprites.get(key)
+        if glow_surf is None:
+            if len(self.glow_sprites) >= GLOW_CACHE_SIZE:
+                self.glow_sprites.clear()
+            particle_radius = self.config.particle_radius
+            glow_size = particle_radius * 4
             glow_surf = pygame.Surface((glow_size, glow_size), pygame.SRCALPHA)
-            
+
             # Dessiner plusieurs cercles concentriques pour l'effet de lueur
             center = glow_size // 2
-            for radius in range(PARTICLE_RADIUS * 2, 0, -1):
-                alpha = min(255, max(0, int(glow_intensity * (radius / (PARTICLE_RADIUS * 2)))))
+            for radius in range(particle_radius * 2, 0, -1):
+                alpha = min(255, max(0, int(glow_intensity * (radius / (particle_radius * 2)))))
                 color = (r, g, b, alpha)
                 pygame.draw.circle(glow_surf, color, (center, center), radius)
-            
-            # Calculer la position de la lueur en s'assurant qu'elle reste dans les limites
-            glow_x = int(x - center)
-            glow_y = int(y - center)
-            
-            # Vérifier si la lueur est visible à l'écran
-            if (glow_x + glow_size > 0 and glow_x < WIDTH and 
-                glow_y + glow_size > 0 and glow_y < HEIGHT):
-                screen.blit(glow_surf, (glow_x, glow_y))
+            self.glow_sprites[key] = glow_surf
+        return glow_surf
+
+    def _colors(self):
+        """Couleur (r, g, b) et intensité de lueur de chaque bille, calculées sur les tableaux."""
+        state = self.state
+        width, height = self.config.width, self.config.height
+        speeds = np.sqrt(state.vx * state.vx + state.vy * state.vy)
+
+        # S'assurer que la position est dans les limites de l'écran
+        x = np.clip(state.x, 0, width)
+        y = np.clip(state.y, 0, height)
+
+        # Variation de couleur bleue basée sur la vitesse et la position
+        base_blue = 200  # Bleu de base
+        speed_factor = np.minimum(1.0, speeds / 500)  # Normalisation de la vitesse
+        position_factor = y / height  # Facteur basé sur la position Y
+        r = (100 + speed_factor * 50).astype(int)  # Rouge légèrement variable
+        g = (150 + speed_factor * 50).astype(int)  # Vert légèrement variable
+        b = np.minimum(255, (base_blue + position_factor * 55).astype(int))  # Bleu variable selon la position
+
+        # Couleur dorée pour les balles en or
+        golden = state.golden[:state.size]
+        r[golden], g[golden], b[golden] = OR
+
+        # Effet de lueur basé sur la vitesse
+        glow = np.minimum(255, speeds * 2).astype(int)
+        return x, y, r, g, b, glow
+
+    def draw(self, screen):
+        particle_radius = self.config.particle_radius
+        width, height = self.config.width, self.config.height
+        glow_size = particle_radius * 4
+        center = glow_size // 2
+        columns = (column.tolist() for column in self._colors())
+        for shape, x, y, r, g, b, glow_intensity in zip(self.particles, *columns):
+            # Une lueur d'intensité nulle est entièrement transparente
+            if glow_intensity > 0:
+                # Calculer la position de la lueur en s'assurant qu'elle reste dans les limites
+                glow_x = int(x - center)
+                glow_y = int(y - center)
+
+                # Vérifier si la lueur est visible à l'écran
+                if (glow_x + glow_size > 0 and glow_x < width and
+                    glow_y + glow_size > 0 and glow_y < height):
+                    screen.blit(self._glow_sprite(r, g, b, glow_intensity), (glow_x, glow_y))
             
             # Effet de brillance (point lumineux)
-            highlight_radius = int(PARTICLE_RADIUS * 0.2)  # Réduction de 0.3 à 0.2 pour un point plus fin
+            highlight_radius = int(particle_radius * 0.2)  # Réduction de 0.3 à 0.2 pour un point plus fin
             highlight_x = int(x - highlight_radius)
             highlight_y = int(y - highlight_radius)
             
-            if (highlight_x + highlight_radius * 2 > 0 and highlight_x < WIDTH and 
-                highlight_y + highlight_radius * 2 > 0 and highlight_y < HEIGHT):
+            if (highlight_x + highlight_radius * 2 > 0 and highlight_x < width and 
+                highlight_y + highlight_radius * 2 > 0 and highlight_y < height):
                 pygame.draw.circle(screen, (255, 255, 255, 200), 
                                  (highlight_x + highlight_radius, 
                                   highlight_y + highlight_radius), 
@@ -118,20 +382,20 @@ class ParticleManager:
             # Particule principale avec dégradé ou texture
             if self.texture:
                 # Calculer la position pour centrer la texture
-                texture_x = int(x - PARTICLE_RADIUS)
-                texture_y = int(y - PARTICLE_RADIUS)
+                texture_x = int(x - particle_radius)
+                texture_y = int(y - particle_radius)
                 
                 # Créer une surface pour la texture avec alpha
-                texture_surf = pygame.Surface((PARTICLE_RADIUS * 1.2, PARTICLE_RADIUS * 1.2), pygame.SRCALPHA)
+                texture_surf = pygame.Surface((particle_radius * 1.2, particle_radius * 1.2), pygame.SRCALPHA)
                 
                 # Appliquer la texture
                 texture_surf.blit(self.texture, (0, 0))
                 
                 # Appliquer la couleur de base avec alpha
-                color_surf = pygame.Surface((PARTICLE_RADIUS * 2, PARTICLE_RADIUS * 2), pygame.SRCALPHA)
+                color_surf = pygame.Surface((particle_radius * 2, particle_radius * 2), pygame.SRCALPHA)
                 color = OR if shape.data["is_golden"] else (r, g, b)
                 pygame.draw.circle(color_surf, (*color, 200),  # Augmentation de l'alpha de 128 à 200
-                                 (PARTICLE_RADIUS, PARTICLE_RADIUS), PARTICLE_RADIUS)
+                                 (particle_radius, particle_radius), particle_radius)
                 
                 # Fusionner la texture et la couleur
                 texture_surf.blit(color_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
@@ -140,12 +404,12 @@ class ParticleManager:
                 screen.blit(texture_surf, (texture_x, texture_y))
             else:
                 # Dessin normal sans texture
-                for radius in range(PARTICLE_RADIUS, 0, -1):
-                    alpha = min(255, max(0, 255 - int((radius / PARTICLE_RADIUS) * 50)))  # Réduction de la transparence
+                for radius in range(particle_radius, 0, -1):
+                    alpha = min(255, max(0, 255 - int((radius / particle_radius) * 50)))  # Réduction de la transparence
                     # Variation de couleur dans le dégradé avec limitation
-                    r_grad = min(255, max(0, int(r * (1 - radius/PARTICLE_RADIUS * 0.3))))
-                    g_grad = min(255, max(0, int(g * (1 - radius/PARTICLE_RADIUS * 0.3))))
-                    b_grad = min(255, max(0, int(b * (1 - radius/PARTICLE_RADIUS * 0.3))))
+                    r_grad = min(255, max(0, int(r * (1 - radius/particle_radius * 0.3))))
+                    g_grad = min(255, max(0, int(g * (1 - radius/particle_radius * 0.3))))
+                    b_grad = min(255, max(0, int(b * (1 - radius/particle_radius * 0.3))))
                     color = (r_grad, g_grad, b_grad, alpha)
                     pygame.draw.circle(screen, color, (int(x), int(y)), radius)
             
@@ -154,4 +418,4 @@ class ParticleManager:
                                       min(255, max(0, g + 20)), 
                                       min(255, max(0, b + 20))), 
                              (int(x), int(y)), 
-                             PARTICLE_RADIUS + 1, 1)  # Ajout de +1 pour un contour plus fin 
\ No newline at end of file
+                             particle_radius + 1, 1)  # Ajout de +1 pour un contour plus fin 
\ No newline at end of file
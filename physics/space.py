@@ -1,5 +1,14 @@
 import pymunk
-from typing import Tuple
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+@dataclass
+class SpaceTemplate:
+    """Contenu mémorisé d'un espace physique et état initial de ses corps."""
+    bodies: List[pymunk.Body]
+    shapes: List[pymunk.Shape]
+    constraints: List[pymunk.Constraint]
+    states: List[Tuple[pymunk.Vec2d, float, pymunk.Vec2d, float]]  # Position, angle, vitesse, vitesse angulaire
 
 class PhysicsSpace:
     """Gestionnaire de l'espace physique."""
@@ -11,14 +20,21 @@ class PhysicsSpace:
         Args:
             gravity (Tuple[float, float]): Vecteur de gravité (x, y)
         """
-        self.space = pymunk.Space()
-        self.space.gravity = gravity
-        self._configure_space()
+        self.gravity = gravity
+        self.space = self._create_space()
+        self.template: Optional[SpaceTemplate] = None  # Scène remise à chaque reset
     
-    def _configure_space(self):
+    def _create_space(self) -> pymunk.Space:
+        """Crée un espace vide configuré."""
+        space = pymunk.Space()
+        space.gravity = self.gravity
+        self._configure_space(space)
+        return space
+
+    def _configure_space(self, space: pymunk.Space):
         """Configure les paramètres de l'espace physique."""
-        self.space.collision_bias = 0.2
-        self.space.iterations = 20
+        space.collision_bias = 0.2
+        space.iterations = 20
     
     def step(self, dt: float):
         """
@@ -37,11 +53,85 @@ class PhysicsSpace:
             pymunk.Space: L'espace physique
         """
         return self.space
+
+    def save_template(self):
+        """
+        Mémorise la partie fixe du contenu actuel de l'espace (corps statiques
+        et cinématiques de la scène, leurs formes et contraintes) : chaque
+        reset la replace ensuite dans un espace neuf, corps remis dans leur état
+        actuel, au lieu de la reconstruire.
+
+        Les corps dynamiques n'en font pas partie : ils gardent un état interne
+        du solveur que pymunk ne permet pas de remettre à zéro, leur
+        propriétaire les recrée après chaque reset.
+
+        Raises:
+            ValueError: Si un objet est attaché au corps statique de l'espace,
+                propre à cet espace (la scène doit avoir son propre corps statique)
+        """
+        space = self.space
+        static_body = space.static_body
+        if (any(shape.body is static_body for shape in space.shapes) or
+                any(static_body in (constraint.a, constraint.b) for constraint in space.constraints)):
+            raise ValueError("La scène utilise le corps statique de l'espace, elle ne peut pas servir de modèle")
+
+        def is_fixed(body):
+            return body.body_type != pymunk.Body.DYNAMIC
+
+        bodies = [body for body in space.bodies if is_fixed(body)]
+        self.template = SpaceTemplate(
+            bodies=bodies,
+            shapes=[shape for shape in space.shapes if is_fixed(shape.body)],
+            constraints=[
+                constraint for constraint in space.constraints
+                if is_fixed(constraint.a) and is_fixed(constraint.b)
+            ],
+            states=[(body.position, body.angle, body.velocity, body.angular_velocity) for body in bodies],
+        )
     
     def reset(self):
-        """Réinitialise l'espace physique."""
-        for body in self.space.bodies:
-            self.space.remove(body)
-        for shape in self.space.shapes:
-            self.space.remove(shape)
-        self._configure_space() 
\ No newline at end of file
+        """
+        Réinitialise l'espace physique : l'espace est remplacé par un espace
+        neuf, vide ou contenant la partie fixe de la scène mémorisée par
+        `save_template`.
+        """
+        template = self.template
+        if template is not None:
+            # Les objets de la scène ne peuvent appartenir qu'à un espace à la fois
+            self.space.remove(*template.constraints, *template.shapes, *template.bodies)
+        self.space = self._create_space()
+        if template is not None:
+            for body, (position, angle, velocity, angular_velocity) in zip(template.bodies, template.states):
+                body.position = position
+                body.angle = angle
+                body.velocity = velocity
+                body.angular_velocity = angular_velocity
+            # Même ordre d'ajout qu'à la construction : mêmes identifiants de formes
+            self.space.add(*template.bodies, *template.shapes, *template.constraints)
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        """
+        État de l'espace pour un instantané : objets, contacts en cours et
+        modèle de scène.
+
+        Les gestionnaires de collision (fonctions locales, non sérialisables)
+        n'en font pas partie : leur propriétaire les rebranche à la restauration.
+
+        Returns:
+            Dict[str, Any]: État à sérialiser avec ceux des autres composants
+        """
+        state = self.space.__getstate__()
+        state['special'] = [(key, value) for key, value in state['special'] if key != '_handlers']
+        return {'space': state, 'template': self.template}
+
+    def restore_state(self, state: Dict[str, Any]):
+        """
+        Remplace l'espace par celui d'un instantané.
+
+        Args:
+            state (Dict[str, Any]): État produit par `snapshot_state` (après désérialisation)
+        """
+        space = pymunk.Space.__new__(pymunk.Space)
+        space.__setstate__(state['space'])
+        self.space = space
+        self.template = state['template']
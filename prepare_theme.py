@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+import argparse
+
+# La préparation n'ouvre jamais de vraie fenêtre
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+THEMES_DIR = os.path.join("assets", "themes")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prétraite les ressources des thèmes (images redimensionnées, sons décodés)")
+    parser.add_argument('themes', nargs='*', help="Thèmes à préparer (défaut : tous)")
+    parser.add_argument('--bundle-dir', default=os.path.join("output", "bundles"), help="Dossier des bundles")
+    parser.add_argument('--set', action='append', default=[], metavar='CHAMP=VALEUR',
+                        help="Valeur de configuration influant sur les tailles (ex: ratio=0.5, width=540)")
+    args = parser.parse_args()
+
+    import pygame
+    from config import create_config
+    from core.bundle import prepare_theme
+    from core.jobs import parse_overrides
+
+    themes = args.themes or sorted(
+        name for name in os.listdir(THEMES_DIR) if os.path.isdir(os.path.join(THEMES_DIR, name))
+    )
+    overrides = parse_overrides(args.set)
+
+    pygame.init()
+    failed = 0
+    for theme in themes:
+        start = time.perf_counter()
+        try:
+            manifest = prepare_theme(create_config().with_theme(theme, **overrides), args.bundle_dir)
+        except Exception as e:
+            print(f"Erreur lors de la préparation du thème {theme}: {e}")
+            failed += 1
+            continue
+        print(
+            f"Thème {theme} : {len(manifest['images'])} images, {len(manifest['audio'])} sons "
+            f"en {time.perf_counter() - start:.2f}s"
+        )
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+import os
+import sys
+import json
+import argparse
+
+# Les rendus ne dessinent jamais dans une vraie fenêtre
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+DEFAULT_QUEUE = os.path.join("output", "render_queue.sqlite3")
+
+
+def add(args):
+    from core.jobs import RenderJob, parse_overrides
+    from core.render_queue import RenderQueue
+
+    if args.job:
+        with open(args.job) as f:
+            requests = json.load(f)
+        if isinstance(requests, dict):
+            requests = [requests]
+    else:
+        requests = [{'config': {}}]
+
+    overrides = parse_overrides(args.set)
+    jobs = []
+    for request in requests:
+        if args.name:
+            request['id'] = args.name
+        if args.theme:
+            request.setdefault('config', {})['theme'] = args.theme
+        request.setdefault('config', {}).update(overrides)
+        jobs.append(RenderJob.from_dict(request))
+
+    queue = RenderQueue(args.queue)
+    for job in jobs:
+        job_id = queue.add(job, args.max_attempts)
+        print(f"Job {job_id} ({job.job_id}) ajouté")
+    queue.close()
+
+
+def run(args):
+    from core.render_queue import run_pool
+
+    run_pool(args.queue, args.workers, args.watch, None if args.no_cache else args.cache_dir)
+    return status(args)
+
+
+def status(args):
+    from core.cache import CACHE_HIT, CACHE_AUDIO, CACHE_MISS
+    from core.render_queue import RenderQueue, STATE_FAILED
+
+    queue = RenderQueue(args.queue)
+    counts = queue.counts()
+    print(" | ".join(f"{state} : {count}" for state, count in counts.items()))
+
+    cache_counts = queue.cache_counts()
+    if cache_counts:
+        print(
+            f"Cache : {cache_counts.get(CACHE_HIT, 0)} vidéos reprises, "
+            f"{cache_counts.get(CACHE_AUDIO, 0)} audios régénérés, "
+            f"{cache_counts.get(CACHE_MISS, 0)} rendus complets"
+        )
+
+    for stage, stats in queue.stage_stats().items():
+        mean = f"{stats['mean_seconds']:.2f}s" if stats['mean_seconds'] is not None else "-"
+        print(
+            f"  {stage:<10} {stats['runs']} exécutions, {stats['failures']} échecs, "
+            f"moyenne {mean}, total {stats['total_seconds']:.2f}s"
+        )
+
+    for job in queue.jobs(STATE_FAILED):
+        print(f"  Job {job['id']} ({job['name']}) après {job['attempts']} tentatives : {job['error']}")
+    queue.close()
+    return 1 if counts[STATE_FAILED] else 0
+
+
+def retry(args):
+    from core.render_queue import RenderQueue
+
+    queue = RenderQueue(args.queue)
+    print(f"Jobs remis en file : {queue.retry_failed()}")
+    queue.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="File de rendus locale")
+    parser.add_argument('--queue', default=DEFAULT_QUEUE, help="Fichier SQLite de la file")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    add_parser = subparsers.add_parser('add', help="Ajoute des jobs à la file")
+    add_parser.add_argument('--job', help="Fichier JSON d'un job ou d'une liste de jobs")
+    add_parser.add_argument('--name', help="Nom du job")
+    add_parser.add_argument('--theme', help="Thème à rendre")
+    add_parser.add_argument('--set', action='append', default=[], metavar='CHAMP=VALEUR',
+                            help="Valeur de configuration (ex: question=\"...\", temps_limite=30)")
+    add_parser.add_argument('--max-attempts', type=int, default=3, help="Nombre maximal de tentatives")
+    add_parser.set_defaults(func=add)
+
+    run_parser = subparsers.add_parser('run', help="Rend les jobs de la file")
+    run_parser.add_argument('--workers', type=int, default=1, help="Nombre de processus de rendu")
+    run_parser.add_argument('--watch', action='store_true', help="Attendre de nouveaux jobs une fois la file vide")
+    run_parser.add_argument('--cache-dir', default=os.path.join("output", "cache"), help="Dossier du cache des rendus")
+    run_parser.add_argument('--no-cache', action='store_true', help="Toujours tout rendre")
+    run_parser.set_defaults(func=run)
+
+    status_parser = subparsers.add_parser('status', help="Affiche l'état de la file")
+    status_parser.set_defaults(func=status)
+
+    retry_parser = subparsers.add_parser('retry', help="Remet en file les jobs en échec")
+    retry_parser.set_defaults(func=retry)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args) or 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import os
+import sys
+import random
+import argparse
+
+# La bibliothèque n'ouvre jamais de vraie fenêtre
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+
+def describe(layout) -> str:
+    return (
+        f"{layout.width}x{layout.height}, {len(layout.segments)} segments, {len(layout.circles)} cercles, "
+        f"{len(layout.rotating)} barres rotatives, {len(layout.pivots)} barres pivotantes, graine {layout.seed}"
+    )
+
+
+def save(args, config):
+    from scenes.main import generate_layout
+    from scenes.layout import save_layout, scene_path
+
+    path = scene_path(args.scene_dir, args.id)
+    if os.path.exists(path) and not args.force:
+        print(f"La scène {args.id} existe déjà ({path}), utilisez --force pour la remplacer")
+        return 1
+
+    seed = args.seed if args.seed is not None else random.randrange(2**31)
+    layout = generate_layout(config, random.Random(seed))
+    layout.seed = seed
+    save_layout(layout, path)
+    print(f"Scène {args.id} enregistrée dans {path} : {describe(layout)}")
+    return 0
+
+
+def list_library(args, config):
+    from scenes.layout import list_scenes, load_layout, scene_path
+
+    scenes = list_scenes(args.scene_dir)
+    if not scenes:
+        print(f"Aucune scène dans {args.scene_dir}")
+    for scene_id in scenes:
+        try:
+            print(f"{scene_id} : {describe(load_layout(scene_path(args.scene_dir, scene_id)))}")
+        except Exception as e:
+            print(f"{scene_id} : illisible ({e})")
+    return 0
+
+
+def preview(args, config):
+    import pygame
+    from core.assets import AssetCache
+    from core.jobs import get_screen
+    from core.simulator import Simulator
+
+    pygame.init()
+    config = config.replace(scene=args.id, scene_dir=args.scene_dir, visual=False)
+    screen = get_screen(config.width, config.height)
+    simulator = Simulator(config, AssetCache())
+    simulator.draw(screen)
+    output = args.output or os.path.join("output", "scenes", f"{args.id}.png")
+    os.makedirs(os.path.dirname(output) or '.', exist_ok=True)
+    pygame.image.save(screen, output)
+    print(f"Aperçu de la scène {args.id} : {output}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bibliothèque de scènes enregistrées (placement des obstacles)")
+    parser.add_argument('--scene-dir', help="Dossier de la bibliothèque (défaut : SCENE_DIR de config.py)")
+    parser.add_argument('--set', action='append', default=[], metavar='CHAMP=VALEUR',
+                        help="Valeur de configuration (ex: num_circles=40, ratio=0.5)")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    save_parser = subparsers.add_parser('save', help="Tire une scène au hasard et l'enregistre")
+    save_parser.add_argument('id', help="Identifiant de la scène")
+    save_parser.add_argument('--seed', type=int, help="Graine du placement (défaut : tirée au hasard)")
+    save_parser.add_argument('--force', action='store_true', help="Remplacer une scène existante")
+
+    subparsers.add_parser('list', help="Liste les scènes de la bibliothèque")
+
+    preview_parser = subparsers.add_parser('preview', help="Dessine une scène dans une image PNG")
+    preview_parser.add_argument('id', help="Identifiant de la scène")
+    preview_parser.add_argument('--output', help="Image de sortie (défaut : output/scenes/<id>.png)")
+
+    args = parser.parse_args()
+
+    from config import create_config
+    from core.jobs import parse_overrides
+
+    config = create_config(**parse_overrides(args.set))
+    args.scene_dir = args.scene_dir or config.scene_dir
+    commands = {'save': save, 'list': list_library, 'preview': preview}
+    sys.exit(commands[args.command](args, config))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+import os
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+LAYOUT_VERSION = 1
+
+# Colonnes de chaque type d'élément, dans l'ordre du fichier
+SEGMENT_COLUMNS = ('x1', 'y1', 'x2', 'y2')
+CIRCLE_COLUMNS = ('x', 'y', 'radius')
+ROTATING_COLUMNS = ('x', 'y', 'length', 'speed')
+PIVOT_COLUMNS = ('x', 'y', 'length', 'mass')
+
+
+@dataclass
+class SceneLayout:
+    """
+    Plan d'une scène : position et dimensions de chaque obstacle et des cuves.
+
+    Le plan est celui demandé au gestionnaire d'obstacles, qui applique
+    encore ses propres règles à la construction (zone de la question,
+    hauteur minimale). Un même plan donne donc toujours la même scène.
+    """
+    width: int
+    height: int
+    segments: List[Tuple[float, float, float, float]] = field(default_factory=list)
+    circles: List[Tuple[float, float, float]] = field(default_factory=list)
+    rotating: List[Tuple[float, float, float, float]] = field(default_factory=list)  # Vitesse signée (sens compris)
+    pivots: List[Tuple[float, float, float, float]] = field(default_factory=list)
+    cuves: List[Tuple[float, Tuple[int, int, int]]] = field(default_factory=list)
+    seed: Optional[int] = None  # Graine qui a produit le plan, pour information
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Retourne la description JSON du plan."""
+        return {
+            'version': LAYOUT_VERSION,
+            'width': self.width,
+            'height': self.height,
+            'seed': self.seed,
+            'columns': {
+                'segments': SEGMENT_COLUMNS,
+                'circles': CIRCLE_COLUMNS,
+                'rotating': ROTATING_COLUMNS,
+                'pivots': PIVOT_COLUMNS,
+            },
+            'segments': [list(segment) for segment in self.segments],
+            'circles': [list(circle) for circle in self.circles],
+            'rotating': [list(bar) for bar in self.rotating],
+            'pivots': [list(bar) for bar in self.pivots],
+            'cuves': [[x, list(color)] for x, color in self.cuves],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SceneLayout":
+        """
+        Construit un plan à partir de sa description JSON.
+
+        Args:
+            data (Dict[str, Any]): Description produite par `to_dict`
+
+        Returns:
+            SceneLayout: Le plan
+
+        Raises:
+            ValueError: Si la version du format n'est pas prise en charge
+        """
+        if data.get('version') != LAYOUT_VERSION:
+            raise ValueError(f"Version de scène non prise en charge : {data.get('version')}")
+        return cls(
+            width=data['width'],
+            height=data['height'],
+            segments=[tuple(segment) for segment in data.get('segments', [])],
+            circles=[tuple(circle) for circle in data.get('circles', [])],
+            rotating=[tuple(bar) for bar in data.get('rotating', [])],
+            pivots=[tuple(bar) for bar in data.get('pivots', [])],
+            cuves=[(x, tuple(color)) for x, color in data.get('cuves', [])],
+            seed=data.get('seed'),
+        )
+
+    def scaled(self, width: int, height: int) -> "SceneLayout":
+        """
+        Retourne le plan adapté à une autre résolution de même format.
+
+        Positions, longueurs et rayons sont mis à l'échelle ; les masses et
+        vitesses de rotation ne changent pas.
+
+        Args:
+            width (int): Largeur de l'écran
+            height (int): Hauteur de l'écran
+
+        Returns:
+            SceneLayout: Le plan à la bonne taille
+
+        Raises:
+            ValueError: Si le rapport largeur/hauteur est différent
+        """
+        if (width, height) == (self.width, self.height):
+            return self
+        scale = width / self.width
+        if abs(height / self.height - scale) > 1e-3:
+            raise ValueError(
+                f"Scène prévue pour {self.width}x{self.height}, incompatible avec {width}x{height}"
+            )
+        return SceneLayout(
+            width=width,
+            height=height,
+            segments=[tuple(value * scale for value in segment) for segment in self.segments],
+            circles=[(x * scale, y * scale, radius * scale) for x, y, radius in self.circles],
+            rotating=[(x * scale, y * scale, length * scale, speed) for x, y, length, speed in self.rotating],
+            pivots=[(x * scale, y * scale, length * scale, mass) for x, y, length, mass in self.pivots],
+            cuves=[(x * scale, color) for x, color in self.cuves],
+            seed=self.seed,
+        )
+
+
+def scene_path(scene_dir: str, scene_id: str) -> str:
+    """Chemin du fichier d'une scène de la bibliothèque."""
+    return os.path.join(scene_dir, f"{scene_id}.json")
+
+
+def save_layout(layout: SceneLayout, path: str) -> None:
+    """
+    Écrit un plan de scène en JSON compact.
+
+    Args:
+        layout (SceneLayout): Le plan
+        path (str): Fichier de sortie
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(layout.to_dict(), f, separators=(',', ':'))
+
+
+def load_layout(path: str) -> SceneLayout:
+    """
+    Lit un plan de scène.
+
+    Args:
+        path (str): Fichier JSON du plan
+
+    Returns:
+        SceneLayout: Le plan
+
+    Raises:
+        FileNotFoundError: Si le fichier n'existe pas
+        ValueError: Si le format n'est pas pris en charge
+    """
+    with open(path) as f:
+        return SceneLayout.from_dict(json.load(f))
+
+
+def list_scenes(scene_dir: str) -> List[str]:
+    """Identifiants des scènes de la bibliothèque, triés."""
+    if not os.path.isdir(scene_dir):
+        return []
+    return sorted(os.path.splitext(name)[0] for name in os.listdir(scene_dir) if name.endswith('.json'))
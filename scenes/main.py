@@ -1,160 +1,212 @@
 import random
 import math
-from config import *
+from config import ROUGE, VERT
+from core.config import SimulationConfig
+from core.time import TimeManager
+from core.audio import AudioManager
+from core.assets import AssetCache
+from utils.spatial import SpatialGrid
+from scenes.layout import SceneLayout
 
-def setup_scene(space):
-    """Configure la scène avec les obstacles et les cuves"""
-    from obstacles import ObstacleManager
-    from cuves import CuveManager
+def generate_layout(config: SimulationConfig, rng: random.Random) -> SceneLayout:
+    """
+    Tire au hasard le plan d'une scène (obstacles et cuves).
 
-    obstacle_manager = ObstacleManager(space)
-    cuve_manager = CuveManager(space)
+    Args:
+        config (SimulationConfig): Configuration (dimensions, nombre d'obstacles)
+        rng (random.Random): Source de hasard ; même graine, même plan
 
-    # Initialiser les gestionnaires de collision
-    obstacle_manager.setup_collision_handlers()
+    Returns:
+        SceneLayout: Le plan de la scène
+    """
+    width, height = config.width, config.height
+    cuve_hauteur = config.cuve_hauteur
+    layout = SceneLayout(width=width, height=height)
 
-    # Liste pour stocker les positions des obstacles
-    obstacle_positions = []
-    circle_positions = []
+    # Positions déjà occupées, indexées par grille pour des tests de distance en temps constant
     min_distance = 20  # Distance minimale entre les obstacles
     min_circle_distance = 80
+    obstacle_positions = SpatialGrid(min_distance)
+    circle_positions = SpatialGrid(min_circle_distance)
 
-    def generate_random_position(is_circle=False, side=None):
-        """Génère une position aléatoire valide pour un obstacle
-        side: 'left' ou 'right' pour spécifier la partie de l'écran"""
-        max_attempts = 50
-        for _ in range(max_attempts):
-            # Créer une grille virtuelle pour une meilleure répartition
-            grid_size = 6
-            cell_width = WIDTH // grid_size
-            
-            # Calculer la zone de jeu disponible en tenant compte des marges
-            top_margin = CUVE_HAUTEUR  # Marge en haut
-            bottom_margin = CUVE_HAUTEUR + 40  # Marge en bas (cuve + espace)
-            available_height = HEIGHT - top_margin - bottom_margin
-            cell_height = available_height // grid_size
-            
-            # Sélectionner une cellule aléatoire
-            if side == 'left':
-                cell_x = random.randint(0, grid_size // 2 - 1)
-            elif side == 'right':
-                cell_x = random.randint(grid_size // 2, grid_size - 1)
-            else:
-                cell_x = random.randint(0, grid_size - 1)
-                
-            cell_y = random.randint(0, grid_size - 1)
-            
-            # Générer une position aléatoire dans la cellule
-            x = cell_x * cell_width + random.randint(20, cell_width - 20)
-            y = top_margin + cell_y * cell_height + random.randint(20, cell_height - 20)
-            
-            if is_valid_position(x, y, is_circle):
+    # Grille virtuelle pour une meilleure répartition
+    grid_size = 6
+    cell_width = width // grid_size
+    
+    # Zone de jeu disponible en tenant compte des marges
+    top_margin = cuve_hauteur  # Marge en haut
+    bottom_margin = cuve_hauteur + 40  # Marge en bas (cuve + espace)
+    available_height = height - top_margin - bottom_margin
+    cell_height = available_height // grid_size
+    min_height = height - cuve_hauteur - 40
+
+    # Emplacements libres de chaque moitié de l'écran : les points d'un maillage
+    # de pas min_distance / 2 dans les cases de la grille virtuelle (à 20 px de
+    # leurs bords). Un emplacement devenu trop proche d'un obstacle le reste :
+    # il est retiré dès qu'on le tire, et un côté n'est plein que lorsqu'il
+    # n'a plus aucun emplacement libre
+    step = min_distance // 2
+    free_positions = {}
+    for side, columns in (('left', range(grid_size // 2)), ('right', range(grid_size // 2, grid_size))):
+        free_positions[side] = [
+            (cell_x * cell_width + dx, top_margin + cell_y * cell_height + dy)
+            for cell_x in columns
+            for cell_y in range(grid_size)
+            for dx in range(20, cell_width - 20 + 1, step)
+            for dy in range(20, cell_height - 20 + 1, step)
+        ]
+    skipped = {'obstacles': 0, 'cercles': 0}
+
+    def take_free_position(side):
+        """Tire un emplacement libre d'un côté de l'écran ('left' ou 'right'),
+        ou None si ce côté est plein"""
+        candidates = free_positions[side]
+        while candidates:
+            index = rng.randrange(len(candidates))
+            x, y = candidates[index]
+            # Retrait en temps constant : le dernier emplacement prend sa place
+            candidates[index] = candidates[-1]
+            candidates.pop()
+            if is_valid_position(x, y):
                 return x, y
         return None
 
-    def is_valid_position(x, y, is_circle=False):
+    def is_valid_position(x, y):
         """Vérifie si la position est suffisamment éloignée des autres obstacles"""
-        # Vérifier que l'obstacle n'est pas trop bas
-        min_height = HEIGHT - CUVE_HAUTEUR - 40
-        if y > min_height:
-            return False
-            
-        # Vérifier que l'obstacle n'est pas trop haut
-        if y < CUVE_HAUTEUR:
+        # Vérifier que l'obstacle n'est ni trop bas ni trop haut
+        if y > min_height or y < cuve_hauteur:
             return False
             
         # Vérifier la distance avec les autres obstacles
-        for pos in obstacle_positions:
-            dx = x - pos[0]
-            dy = y - pos[1]
-            if math.sqrt(dx*dx + dy*dy) < min_distance:
-                return False
-        
-        # Vérifier la distance avec les cercles
-        for pos in circle_positions:
-            dx = x - pos[0]
-            dy = y - pos[1]
-            if math.sqrt(dx*dx + dy*dy) < min_circle_distance:
-                return False
-        
-        # Si c'est un cercle, vérifier aussi avec les autres cercles
-        if is_circle:
-            for pos in circle_positions:
-                dx = x - pos[0]
-                dy = y - pos[1]
-                if math.sqrt(dx*dx + dy*dy) < min_distance:
-                    return False
+        if obstacle_positions.has_point_within(x, y, min_distance):
+            return False
         
-        return True
+        # Vérifier la distance avec les cercles (plus grande que min_distance :
+        # couvre aussi l'écart minimal entre deux cercles)
+        return not circle_positions.has_point_within(x, y, min_circle_distance)
+
+    def generate_positions(count, is_circle=False):
+        """Génère les positions d'un type d'obstacle : la première moitié à
+        gauche, la seconde à droite. Retourne des couples (index, position)."""
+        for i in range(count):
+            side = 'left' if i < count // 2 else 'right'
+            pos = take_free_position(side)
+            if pos is None:
+                skipped['cercles' if is_circle else 'obstacles'] += 1
+                continue
+            yield i, pos
 
     # Entonnoir central (gardé pour l'entrée)
-    entonnoir_x = WIDTH // 2
-    entonnoir_y = HEIGHT // 6
+    entonnoir_x = width // 2
+    entonnoir_y = height // 6
     entonnoir_radius = 120
     # obstacle_manager.create_entonnoir((entonnoir_x, entonnoir_y), entonnoir_radius)
-    obstacle_positions.append((entonnoir_x, entonnoir_y))
+    obstacle_positions.add(entonnoir_x, entonnoir_y)
 
     # Génération aléatoire des obstacles
-    num_obstacles = NUM_OBSTACLES  # Nombre total d'obstacles
-    num_circles = NUM_CIRCLES     # Nombre de cercles
-    num_rotating = NUM_ROTATING    # Nombre d'obstacles rotatifs
-    num_pivot = NUM_PIVOT       # Nombre de barres pivotantes
+    num_obstacles = config.num_obstacles  # Nombre total d'obstacles
+    num_circles = config.num_circles     # Nombre de cercles
+    num_rotating = config.num_rotating    # Nombre d'obstacles rotatifs
+    num_pivot = config.num_pivot       # Nombre de barres pivotantes
 
     # Créer les obstacles normaux
-    for i in range(num_obstacles):
-        side = 'left' if i < num_obstacles // 2 else 'right'
-        pos = generate_random_position(side=side)
-        if pos:
-            x, y = pos
-            length = random.randint(80, 150)
-            
-            # Un obstacle sur trois est plat
-            if i % 3 == 0:
-                angle = 0  # Angle plat
-            else:
-                # Angle entre -45 et 45 degrés
-                angle = random.uniform(-math.pi/4, math.pi/4)
-            
-            x2 = x + length * math.cos(angle)
-            y2 = y + length * math.sin(angle)
-            obstacle_manager.create_obstacle((x, y), (x2, y2))
-            obstacle_positions.extend([(x, y), (x2, y2)])
+    for i, (x, y) in generate_positions(num_obstacles):
+        length = rng.randint(80, 150)
+        
+        # Un obstacle sur trois est plat
+        if i % 3 == 0:
+            angle = 0  # Angle plat
+        else:
+            # Angle entre -45 et 45 degrés
+            angle = rng.uniform(-math.pi/4, math.pi/4)
+        
+        x2 = x + length * math.cos(angle)
+        y2 = y + length * math.sin(angle)
+        layout.segments.append((x, y, x2, y2))
+        obstacle_positions.add(x, y)
+        obstacle_positions.add(x2, y2)
 
     # Créer les cercles
-    for i in range(num_circles):
-        side = 'left' if i < num_circles // 2 else 'right'
-        pos = generate_random_position(is_circle=True, side=side)
-        if pos:
-            x, y = pos
-            radius = random.randint(20, 30)
-            obstacle_manager.create_circular_obstacle((x, y), radius)
-            circle_positions.append((x, y))
-
-    # Créer les obstacles rotatifs
-    for i in range(num_rotating):
-        side = 'left' if i < num_rotating // 2 else 'right'
-        pos = generate_random_position(side=side)
-        if pos:
-            x, y = pos
-            length = random.randint(60, 100)
-            speed = random.uniform(-3.0, 3.0)
-            obstacle_manager.create_rotating_obstacle((x, y), length, speed)
+    for i, (x, y) in generate_positions(num_circles, is_circle=True):
+        radius = rng.randint(20, 30)
+        layout.circles.append((x, y, radius))
+        circle_positions.add(x, y)
+
+    # Créer les obstacles rotatifs (sens de rotation tiré au hasard)
+    for i, (x, y) in generate_positions(num_rotating):
+        length = rng.randint(60, 100)
+        speed = rng.uniform(-3.0, 3.0)
+        direction = 1 if rng.random() > 0.5 else -1
+        layout.rotating.append((x, y, length, speed * direction))
 
     # Créer les barres pivotantes
-    for i in range(num_pivot):
-        side = 'left' if i < num_pivot // 2 else 'right'
-        pos = generate_random_position(side=side)
-        if pos:
-            x, y = pos
-            length = random.randint(80, 120)
-            mass = random.uniform(1.0, 2.0)
-            obstacle_manager.create_pivot_bar((x, y), length, mass=mass)
-            obstacle_positions.append((x, y))
+    for i, (x, y) in generate_positions(num_pivot):
+        length = rng.randint(80, 120)
+        mass = rng.uniform(1.0, 2.0)
+        layout.pivots.append((x, y, length, mass))
+        obstacle_positions.add(x, y)
+
+    if skipped['obstacles'] or skipped['cercles']:
+        print(
+            f"Scène trop dense : {skipped['obstacles']} obstacles et {skipped['cercles']} cercles "
+            f"sans place libre, ignorés"
+        )
+
+    # Cuves
+    layout.cuves.append((width // 2, ROUGE))  # Première cuve à droite
+    layout.cuves.append((0, VERT))  # Deuxième cuve à gauche
+
+    return layout
+
+def build_scene(
+    space,
+    config: SimulationConfig,
+    layout: SceneLayout,
+    time_manager: TimeManager,
+    audio_manager: AudioManager,
+    assets: AssetCache,
+    rng: random.Random
+):
+    """
+    Construit les obstacles et les cuves d'un plan dans l'espace physique.
 
+    Args:
+        space (pymunk.Space): Espace physique
+        config (SimulationConfig): Configuration de la simulation
+        layout (SceneLayout): Plan de la scène (mis à l'échelle de l'écran si besoin)
+        time_manager (TimeManager): Horloge de la simulation
+        audio_manager (AudioManager): Gestionnaire audio (sons des collisions)
+        assets (AssetCache): Cache des ressources
+        rng (random.Random): Source de hasard du gestionnaire d'obstacles
+
+    Returns:
+        Tuple[ObstacleManager, CuveManager]: Les gestionnaires de la scène
+
+    Raises:
+        ValueError: Si le plan n'a pas le format de l'écran
+    """
+    from obstacles import ObstacleManager
+    from cuves import CuveManager
+
+    layout = layout.scaled(config.width, config.height)
+    obstacle_manager = ObstacleManager(space, config, time_manager, audio_manager, rng)
+    cuve_manager = CuveManager(space, config, assets)
+
+    for x1, y1, x2, y2 in layout.segments:
+        obstacle_manager.create_obstacle((x1, y1), (x2, y2))
+    for x, y, radius in layout.circles:
+        obstacle_manager.create_circular_obstacle((x, y), radius)
+    for x, y, length, speed in layout.rotating:
+        obstacle_manager.create_rotating_obstacle((x, y), length, speed, direction=1)
     obstacle_manager.create_floor()
 
     # Création des cuves
-    cuve_manager.create_cuve(WIDTH // 2, ROUGE)  # Première cuve à droite
-    cuve_manager.create_cuve(0, VERT)  # Deuxième cuve à gauche
+    for x, color in layout.cuves:
+        cuve_manager.create_cuve(x, color)
+
+    # Barres pivotantes en dernier : seuls objets dynamiques de la scène, ce
+    # sont aussi les seuls recréés à chaque partie (même ordre de construction)
+    for x, y, length, mass in layout.pivots:
+        obstacle_manager.create_pivot_bar((x, y), length, mass=mass)
 
-    return obstacle_manager, cuve_manager 
\ No newline at end of file
+    return obstacle_manager, cuve_manager
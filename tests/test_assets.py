@@ -0,0 +1,50 @@
+"""
+`AssetCache` oublie une image ou un son dont le fichier a changé depuis
+son chargement, au lieu de resservir l'ancienne version.
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+import soundfile as sf
+from core.assets import AssetCache
+from core.jobs import get_screen
+
+
+def touch_later(path):
+    """Avance la date de modification, même si le fichier est réécrit dans la même milliseconde."""
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_audio_is_decoded_again_when_the_file_changes(tmp_path):
+    path = str(tmp_path / "son.wav")
+    sf.write(path, np.full(100, 0.25, dtype=np.float32), AssetCache.SAMPLE_RATE)
+    assets = AssetCache(bundle_dir=None)
+    assert assets.audio_data(path)[0] == 0.25
+    assert assets.audio_data(path) is assets.audio_data(path)
+
+    sf.write(path, np.full(100, 0.5, dtype=np.float32), AssetCache.SAMPLE_RATE)
+    touch_later(path)
+    assert assets.audio_data(path)[0] == 0.5
+
+
+def test_image_is_rebuilt_when_the_file_changes(tmp_path):
+    pygame.init()
+    get_screen(16, 16)  # Les images sont converties au format de l'écran
+    path = str(tmp_path / "image.png")
+    image = pygame.Surface((8, 8))
+    image.fill((255, 0, 0))
+    pygame.image.save(image, path)
+    assets = AssetCache(bundle_dir=None)
+    assert assets.squared_image(path, 4).get_at((2, 2))[:3] == (255, 0, 0)
+
+    image.fill((0, 0, 255))
+    pygame.image.save(image, path)
+    touch_later(path)
+    assert assets.squared_image(path, 4).get_at((2, 2))[:3] == (0, 0, 255)
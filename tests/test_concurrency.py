@@ -0,0 +1,88 @@
+"""
+Plusieurs simulations dans un même processus : chacune a son horloge et son
+journal d'événements sonores, et des simulations avancées en parallèle
+dans des threads donnent exactement ce qu'elles donnent seules.
+"""
+import os
+import sys
+import threading
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from config import create_config
+from core.assets import AssetCache
+from core.simulator import Simulator
+
+SEEDS = (11, 12, 13)
+FRAMES = 1200
+
+
+def make_simulator(seed, output_dir):
+    config = create_config(visual=False, debug=False, profile=False, winner=None,
+                           seed=seed, output_dir=str(output_dir))
+    simulator = Simulator(config, AssetCache(bundle_dir=None))
+    simulator.start()
+    return simulator
+
+
+def step(simulator, barrier=None):
+    if barrier is not None:
+        barrier.wait()
+    for _ in range(FRAMES):
+        simulator.update(1 / 60)
+    simulator.record_manager.stop_recording()
+
+
+def outcome(simulator):
+    """Journal sonore, horloge et cuves d'une simulation terminée."""
+    return (
+        list(simulator.audio_manager.sound_events),
+        simulator.time_manager.get_current_state(),
+        list(simulator.cuve_manager.counts),
+    )
+
+
+def test_threaded_simulators_match_sequential_runs(tmp_path):
+    pygame.init()
+
+    expected = {}
+    for seed in SEEDS:
+        simulator = make_simulator(seed, tmp_path / f"sequential-{seed}")
+        step(simulator)
+        expected[seed] = outcome(simulator)
+
+    simulators = {seed: make_simulator(seed, tmp_path / f"threaded-{seed}") for seed in SEEDS}
+    barrier = threading.Barrier(len(SEEDS))
+    errors = []
+
+    def run(simulator):
+        try:
+            step(simulator, barrier)
+        except Exception as e:  # Remontée dans le thread principal
+            errors.append(e)
+
+    threads = [threading.Thread(target=run, args=(simulator,)) for simulator in simulators.values()]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors
+
+    for seed, simulator in simulators.items():
+        sound_events, clock, counts = outcome(simulator)
+        expected_events, expected_clock, expected_counts = expected[seed]
+        assert sound_events, "la partie doit produire des sons pour que le test ait un sens"
+        assert sound_events == expected_events
+        assert clock == expected_clock
+        assert clock.total_frames == FRAMES
+        assert counts == expected_counts
+
+    # Aucun état partagé entre les simulations
+    managers = [(s.audio_manager, s.time_manager, s.audio_manager.sound_events) for s in simulators.values()]
+    for kind in range(3):
+        assert len({id(entry[kind]) for entry in managers}) == len(SEEDS)
+    sound_names = [tuple(event.sound_name for event in outcome(s)[0]) for s in simulators.values()]
+    assert len(set(sound_names)) == len(SEEDS)
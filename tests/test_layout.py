@@ -0,0 +1,33 @@
+"""
+`generate_layout` place tous les obstacles demandés tant qu'il reste de la
+place, et signale ceux qu'une scène trop petite ne peut pas accueillir.
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import create_config
+from scenes.main import generate_layout
+
+
+def test_dense_layout_places_every_obstacle(capsys):
+    config = create_config(num_obstacles=400, num_circles=80, num_rotating=10, num_pivot=25)
+    layout = generate_layout(config, random.Random(3))
+
+    assert len(layout.segments) == 400
+    assert len(layout.circles) == 80
+    assert len(layout.rotating) == 10
+    assert len(layout.pivots) == 25
+    assert "Scène trop dense" not in capsys.readouterr().out
+    assert generate_layout(config, random.Random(3)) == layout
+
+
+def test_full_layout_reports_what_does_not_fit(capsys):
+    config = create_config(num_circles=1000, num_rotating=0, num_pivot=0)
+    layout = generate_layout(config, random.Random(3))
+
+    assert 0 < len(layout.circles) < 1000
+    skipped = 1000 - len(layout.circles)
+    assert f"0 obstacles et {skipped} cercles" in capsys.readouterr().out
@@ -0,0 +1,24 @@
+"""
+Les barres pivotantes ne s'emballent pas : sur le banc `pivots.frame`,
+aucune ne dépasse la vitesse angulaire maximale de `ObstacleManager`.
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from benchmarks.suite import BenchmarkContext, bench_pivots
+
+
+def test_pivot_bars_stay_under_the_speed_limit(tmp_path):
+    pygame.init()
+    context = BenchmarkContext(str(tmp_path), scale=0.5)
+    [result] = bench_pivots(context)
+
+    assert result.name == "pivots.frame"
+    assert result.params['pivots'] > 0
+    limit = 5.0  # ObstacleManager.max_angular_velocity
+    assert 0 < result.params['max_angular_velocity'] <= limit
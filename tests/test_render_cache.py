@@ -0,0 +1,52 @@
+"""
+Vidéo reprise du cache, audio régénéré : sans simulateur, le mixage donne
+exactement la piste d'un rendu complet, avec les sons du thème à jour.
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pygame
+import soundfile as sf
+import core.jobs
+from benchmarks.standin import create_standin_theme
+from config import create_config
+from core.assets import AssetCache
+from core.cache import RenderCache, CACHE_MISS, CACHE_AUDIO
+from core.jobs import RenderJob, render_job
+
+
+def read_audio(output_dir):
+    with open(os.path.join(output_dir, 'audio.wav'), 'rb') as f:
+        return f.read()
+
+
+def test_audio_only_render_matches_a_full_render(tmp_path, monkeypatch):
+    pygame.init()
+    overrides = create_standin_theme(str(tmp_path / "theme"), create_config())
+    overrides.update(visual=False, temps_limite=1, delai_arret=1, seed=5)
+    cache = RenderCache(str(tmp_path / "cache"))
+    assets = AssetCache(bundle_dir=None)
+
+    def render(name, render_cache):
+        job = RenderJob(name, dict(overrides, output_dir=str(tmp_path / name)))
+        return render_job(job, assets, cache=render_cache)
+
+    assert render('first', cache).cache == CACHE_MISS
+
+    # Nouvelle musique : la vidéo est reprise, seul l'audio est refait
+    music = overrides['background_music_path']
+    sf.write(music, 0.3 * np.sin(np.arange(AssetCache.SAMPLE_RATE) * 0.02), AssetCache.SAMPLE_RATE)
+    built = []
+    simulator_class = core.jobs.Simulator
+    monkeypatch.setattr(core.jobs, 'Simulator', lambda *args: built.append(args) or simulator_class(*args))
+    assert render('cached', cache).cache == CACHE_AUDIO
+    assert not built
+
+    assert render('full', None).cache == CACHE_MISS
+    assert read_audio(tmp_path / 'cached') == read_audio(tmp_path / 'full')
+    assert read_audio(tmp_path / 'cached') != read_audio(tmp_path / 'first')
@@ -0,0 +1,84 @@
+"""
+`Simulator.reset` remet la simulation à zéro sans toucher à l'enregistrement ;
+`Simulator.restart` redémarre en plus la vidéo et le journal sonore.
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+from config import create_config
+from core.assets import AssetCache
+from core.jobs import get_screen
+from core.simulator import Simulator
+
+FRAMES = 120
+
+
+def make_simulator(output_dir):
+    # Scène fixe : une partie reprise après reset est exactement la même
+    config = create_config(visual=False, debug=False, profile=False, winner=None, seed=5,
+                           scene='exemple', scene_dir=os.path.join(ROOT, 'assets', 'scenes'),
+                           output_dir=str(output_dir))
+    return Simulator(config, AssetCache(bundle_dir=None))
+
+
+def play(simulator, screen, frames=FRAMES):
+    for _ in range(frames):
+        simulator.update(1 / 60)
+        simulator.draw(screen)
+
+
+def state(simulator):
+    """Billes, barres pivotantes, cuves et horloge de la partie en cours."""
+    return (
+        [(tuple(p.body.position), tuple(p.body.velocity)) for p in simulator.particle_manager.particles],
+        [(tuple(body.position), body.angle) for body in simulator.obstacle_manager.pivot_bars],
+        list(simulator.cuve_manager.counts),
+        simulator.time_manager.get_current_state(),
+    )
+
+
+def test_reset_replays_the_game_and_keeps_recording(tmp_path):
+    pygame.init()
+    simulator = make_simulator(tmp_path)
+    screen = get_screen(simulator.config.width, simulator.config.height)
+    simulator.start()
+    video_path = simulator.record_manager.get_video_path()
+
+    play(simulator, screen)
+    first = state(simulator)
+    simulator.reset()
+
+    # L'enregistrement continue : rien n'est tronqué ni réécrit
+    assert simulator.record_manager.is_recording()
+    assert simulator.record_manager.get_video_path() == video_path
+    assert simulator.time_manager.get_current_state().total_frames == 0
+
+    play(simulator, screen)
+    assert state(simulator) == first
+    assert simulator.record_manager.get_frame_count() == 2 * FRAMES
+    simulator.record_manager.stop_recording()
+
+
+def test_restart_starts_a_new_recording(tmp_path):
+    pygame.init()
+    simulator = make_simulator(tmp_path)
+    screen = get_screen(simulator.config.width, simulator.config.height)
+    simulator.start()
+    play(simulator, screen)
+    assert simulator.audio_manager.sound_events
+
+    simulator.restart()
+    assert simulator.record_manager.is_recording()
+    assert simulator.record_manager.get_frame_count() == 0
+    # Seuls les sons du démarrage (fond et question) sont rejoués
+    assert all(event.time_seconds == 0 for event in simulator.audio_manager.sound_events)
+
+    play(simulator, screen, 10)
+    assert simulator.record_manager.get_frame_count() == 10
+    simulator.finish_recording()
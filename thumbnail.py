@@ -5,6 +5,7 @@ from config import (
     QUESTION, REPONSE_A, REPONSE_B, REPONSE_A_IMAGE_PATH, REPONSE_B_IMAGE_PATH,
     CUVE_A_COLOR_START, CUVE_B_COLOR_START, OUTPUT_DIR, THEME
 )
+from utils.fonts import font_path
 
 # Constantes
 WIDTH, HEIGHT = 1080, 1920
@@ -114,8 +115,8 @@ def main():
     draw = ImageDraw.Draw(base)
 
     # Charger la police
-    FONT_PATH = "assets/fonts/Poppins/Poppins-Regular.ttf"
-    FONT_BOLD_PATH = "assets/fonts/Poppins/Poppins-Bold.ttf"
+    FONT_PATH = font_path()
+    FONT_BOLD_PATH = font_path(bold=True)
     try:
         font_question = ImageFont.truetype(FONT_PATH, size=80)
         # Calculer la taille de police pour les réponses (basée sur le plus long)
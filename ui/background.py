@@ -1,63 +1,79 @@
 import pygame
 import os
-from typing import Optional, List
-from utils.color import create_gradient_surface
-from utils.image import create_cover_image
-from config import *
+from typing import Dict, Optional, List, Tuple
+from config import FOND
+from core.assets import AssetCache
+from core.config import SimulationConfig
 
 class Background:
     """Gestionnaire du fond du jeu."""
     
-    def __init__(self, width: int, height: int):
+    def __init__(self, config: SimulationConfig, assets: AssetCache):
         """
         Initialise le fond du jeu.
         
         Args:
-            width (int): Largeur de l'écran
-            height (int): Hauteur de l'écran
+            config (SimulationConfig): Configuration de la simulation
+            assets (AssetCache): Cache des ressources partagées
         """
-        self.width = width
-        self.height = height
+        self.config = config
+        self.assets = assets
+        self.width = config.width
+        self.height = config.height
         self.background = None
         self.gradient_surfaces = self._create_gradient_surfaces()
         self._load_background()
+        self.base_layer = self._create_base_layer()
+        
+        # Copies des dégradés au format de pixels de l'écran (voir _match_screen) ;
+        # gradient_surfaces reste la référence donnée par le simulateur
+        self.gradient_layers: List[pygame.Surface] = self.gradient_surfaces
+        self.screen: Optional[pygame.Surface] = None  # Écran dont le format a servi aux conversions
+        
+        # Étapes du fondu de victoire déjà composées, par (dégradé, opacité)
+        self.fade_frames: Dict[Tuple[int, int], pygame.Surface] = {}
     
     def _create_gradient_surfaces(self) -> List[pygame.Surface]:
         """
         Crée les surfaces de dégradé pour les fonds.
         
+        Chaque surface appartient à ce fond (copie opaque du dégradé partagé) :
+        son opacité est réglée directement au moment du dessin.
+        
         Returns:
             List[pygame.Surface]: Liste des surfaces de dégradé
         """
         gradient_surfaces = []
         for i in range(2):
-            start_color = CUVE_B_COLOR_START if i == 0 else CUVE_A_COLOR_START
-            end_color = CUVE_B_COLOR_END if i == 0 else CUVE_A_COLOR_END
-            gradient_surfaces.append(
-                create_gradient_surface(self.width, self.height, start_color, end_color)
-            )
+            start_color = self.config.cuve_b_color_start if i == 0 else self.config.cuve_a_color_start
+            end_color = self.config.cuve_b_color_end if i == 0 else self.config.cuve_a_color_end
+            gradient_surface = pygame.Surface((self.width, self.height))
+            gradient_surface.blit(self.assets.gradient(self.width, self.height, start_color, end_color), (0, 0))
+            gradient_surfaces.append(gradient_surface)
         return gradient_surfaces
     
     def _load_background(self):
         """Charge l'image de fond si configurée."""
-        if BACKGROUND_IMAGE_PATH:
+        image_path = self.config.background_image_path
+        opacity = self.config.background_opacity
+        if image_path:
             try:
-                bg_path = os.path.abspath(BACKGROUND_IMAGE_PATH)
-                if BACKGROUND_FULL_SCREEN:
-                    self.background = create_cover_image(
+                bg_path = os.path.abspath(image_path)
+                if self.config.background_full_screen:
+                    self.background = self.assets.cover_image(
                         bg_path,
                         self.width,
                         self.height,
-                        BACKGROUND_OPACITY
+                        opacity
                     )
                 else:
                     # Mode carré au-dessus de la question
                     square_size = self.width // 3
-                    self.background = create_cover_image(
+                    self.background = self.assets.cover_image(
                         bg_path,
                         square_size,
                         square_size,
-                        BACKGROUND_OPACITY,
+                        opacity,
                         is_circular=True
                     )
                     
@@ -73,25 +89,81 @@ class Background:
                     self.background = background_surface
                     
             except Exception as e:
-                print(f"Impossible de charger l'image de fond : {BACKGROUND_IMAGE_PATH}")
+                print(f"Impossible de charger l'image de fond : {image_path}")
                 print(f"Erreur : {str(e)}")
     
+    def _create_base_layer(self) -> pygame.Surface:
+        """
+        Compose une fois pour toutes la couleur de fond et l'image de fond.
+        
+        Returns:
+            pygame.Surface: Surface opaque de la taille de l'écran
+        """
+        base_layer = pygame.Surface((self.width, self.height))
+        base_layer.fill(FOND)
+        if self.background:
+            base_layer.blit(self.background, (0, 0))
+        return base_layer
+    
+    def _match_screen(self, screen: pygame.Surface):
+        """
+        Convertit une fois les couches au format de pixels de l'écran, pour
+        que leurs copies n'aient plus de conversion à faire à chaque frame.
+        
+        Les couches sont créées avec le simulateur, parfois avant l'écran :
+        la conversion attend donc le premier dessin sur un écran donné.
+        
+        Args:
+            screen (pygame.Surface): Surface de l'écran
+        """
+        if screen is self.screen:
+            return
+        self.screen = screen
+        self.base_layer = self.base_layer.convert(screen)
+        self.gradient_layers = [gradient.convert(screen) for gradient in self.gradient_surfaces]
+        self.fade_frames.clear()
+    
+    def _get_fade_frame(self, gradient: pygame.Surface, alpha: int) -> pygame.Surface:
+        """
+        Retourne le fond complet (base + dégradé à l'opacité donnée), composé au premier usage.
+        
+        Args:
+            gradient (pygame.Surface): Dégradé de victoire (une des surfaces de gradient_surfaces)
+            alpha (int): Opacité du dégradé
+            
+        Returns:
+            pygame.Surface: Surface opaque de la taille de l'écran
+        """
+        key = (self.gradient_surfaces.index(gradient), alpha)
+        if key not in self.fade_frames:
+            frame = self.base_layer.copy()
+            layer = self.gradient_layers[key[0]]
+            layer.set_alpha(alpha)
+            frame.blit(layer, (0, 0))
+            self.fade_frames[key] = frame
+        return self.fade_frames[key]
+    
     def draw(self, screen: pygame.Surface, current_gradient: Optional[pygame.Surface] = None, gradient_alpha: int = 0):
         """
         Dessine le fond sur l'écran.
         
         Args:
             screen (pygame.Surface): Surface de l'écran
-            current_gradient (Optional[pygame.Surface]): Dégradé actuel
+            current_gradient (Optional[pygame.Surface]): Dégradé actuel (une des surfaces de gradient_surfaces)
             gradient_alpha (int): Opacité du dégradé
         """
-        screen.fill(FOND)
-        if self.background:
-            screen.blit(self.background, (0, 0))
+        self._match_screen(screen)
         
         # Affichage du gradient de victoire
         if current_gradient and gradient_alpha > 0:
-            temp_surface = pygame.Surface((self.width, self.height))
-            temp_surface.blit(current_gradient, (0, 0))
-            temp_surface.set_alpha(gradient_alpha)
-            screen.blit(temp_surface, (0, 0)) 
\ No newline at end of file
+            alpha = int(gradient_alpha)
+            if self.config.background_prebake_fade:
+                screen.blit(self._get_fade_frame(current_gradient, alpha), (0, 0))
+                return
+            screen.blit(self.base_layer, (0, 0))
+            layer = self.gradient_layers[self.gradient_surfaces.index(current_gradient)]
+            layer.set_alpha(alpha)
+            screen.blit(layer, (0, 0))
+            return
+        
+        screen.blit(self.base_layer, (0, 0)) 
\ No newline at end of file
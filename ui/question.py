@@ -1,75 +1,117 @@
 import pygame
-from typing import List
+from typing import Dict
 from utils.text import render_multiline_text
-from config import *
+from utils.fonts import get_font
+from utils.image import premultiply
+from core.config import SimulationConfig
 
 class Question:
     """Gestionnaire de l'affichage de la question."""
-    
-    def __init__(self, width: int, height: int):
+
+    ZOOM_DURATION = 3.0  # Durée du zoom d'apparition en secondes
+    ZOOM_START = 0.8     # Échelle au début du zoom
+    ZOOM_STEP = 0.005    # Pas de quantification de l'échelle (une image par pas)
+
+    def __init__(self, config: SimulationConfig):
         """
         Initialise l'affichage de la question.
-        
+
         Args:
-            width (int): Largeur de l'écran
-            height (int): Hauteur de l'écran
+            config (SimulationConfig): Configuration de la simulation
         """
-        self.width = width
-        self.height = height
+        self.config = config
+        self.width = config.width
+        self.height = config.height
         self.question_zoom_time = 0
-        self.font = pygame.font.SysFont("Poppins", QUESTION_FONT_SIZE)
-    
+        self.font = get_font(config.question_font_size)
+
+        # Largeur maximale du texte (80% de la largeur de l'écran)
+        self.max_width = int(self.width * 0.8)
+
+        # Images de la question déjà composées, par échelle de zoom
+        self.zoom_frames: Dict[float, pygame.Surface] = {}
+        self.final_frame = self._build_frame(1.0)
+
     def update(self, dt: float):
         """
         Met à jour l'animation de la question.
-        
+
         Args:
             dt (float): Pas de temps
         """
-        if self.question_zoom_time < 3.0:
+        if self.question_zoom_time < self.ZOOM_DURATION:
             self.question_zoom_time += dt
-    
-    def draw(self, screen: pygame.Surface):
+        elif self.zoom_frames:
+            # Animation terminée : seule l'image finale sert encore
+            self.zoom_frames.clear()
+
+    def _build_frame(self, scale: float) -> pygame.Surface:
         """
-        Dessine la question sur l'écran.
-        
+        Compose le fond et le texte de la question à une échelle donnée.
+
+        La surface est en alpha prémultiplié : elle se dessine avec
+        `pygame.BLEND_PREMULTIPLIED`, ce qui donne le même résultat que
+        dessiner le fond puis chaque ligne directement sur l'écran.
+
         Args:
-            screen (pygame.Surface): Surface de l'écran
+            scale (float): Échelle du texte (le fond garde sa taille)
+
+        Returns:
+            pygame.Surface: L'image de la question
         """
-        # Calcul de l'échelle de zoom pour la question (0.8 à 1.0 sur 3 secondes)
-        if self.question_zoom_time < 3.0:
-            question_zoom_scale = 0.8 + (0.2 * (self.question_zoom_time / 3.0))
-        else:
-            question_zoom_scale = 1.0
-        
-        # Calculer la largeur maximale (80% de la largeur de l'écran)
-        max_width = int(self.width * 0.8)
-        
         # Rendre le texte sur plusieurs lignes
-        question_surfaces = render_multiline_text(QUESTION, self.font, QUESTION_COLOR, max_width)
-        
+        question_surfaces = render_multiline_text(
+            self.config.question, self.font, self.config.question_color, self.max_width
+        )
+
         # Calculer la hauteur totale du texte
         total_height = sum(surface.get_height() for surface in question_surfaces)
-        
+
         # Créer la surface de fond
-        bg_surf = pygame.Surface((max_width + 40, total_height + 40), pygame.SRCALPHA)
-        bg_surf.fill(QUESTION_BG_COLOR)
-        bg_rect = bg_surf.get_rect(center=QUESTION_POSITION)
-        
-        # Dessiner le fond
-        screen.blit(bg_surf, bg_rect)
-        
+        frame = pygame.Surface((self.max_width + 40, total_height + 40), pygame.SRCALPHA)
+        frame.fill(self.config.question_bg_color)
+        frame = frame.premul_alpha()
+
         # Dessiner chaque ligne de texte
-        y_offset = bg_rect.top + 20
+        y_offset = 20
         for surface in question_surfaces:
             # Appliquer le zoom à la surface
-            scaled_surface = pygame.transform.smoothscale(
-                surface,
-                (int(surface.get_width() * question_zoom_scale),
-                 int(surface.get_height() * question_zoom_scale))
-            )
-            
+            if scale != 1.0:
+                surface = pygame.transform.smoothscale(
+                    surface,
+                    (int(surface.get_width() * scale), int(surface.get_height() * scale))
+                )
+
             # Centrer horizontalement
-            x = bg_rect.centerx - scaled_surface.get_width() // 2
-            screen.blit(scaled_surface, (x, y_offset))
-            y_offset += scaled_surface.get_height() 
\ No newline at end of file
+            x = frame.get_width() // 2 - surface.get_width() // 2
+            frame.blit(premultiply(surface), (x, y_offset), special_flags=pygame.BLEND_PREMULTIPLIED)
+            y_offset += surface.get_height()
+
+        return frame
+
+    def _get_frame(self) -> pygame.Surface:
+        """Retourne l'image correspondant à l'état actuel du zoom."""
+        if self.question_zoom_time >= self.ZOOM_DURATION:
+            return self.final_frame
+
+        # Calcul de l'échelle de zoom pour la question (0.8 à 1.0 sur 3 secondes)
+        progress = self.question_zoom_time / self.ZOOM_DURATION
+        scale = self.ZOOM_START + (1.0 - self.ZOOM_START) * progress
+        scale = round(round(scale / self.ZOOM_STEP) * self.ZOOM_STEP, 4)
+        if scale >= 1.0:
+            return self.final_frame
+
+        if scale not in self.zoom_frames:
+            self.zoom_frames[scale] = self._build_frame(scale)
+        return self.zoom_frames[scale]
+
+    def draw(self, screen: pygame.Surface):
+        """
+        Dessine la question sur l'écran.
+
+        Args:
+            screen (pygame.Surface): Surface de l'écran
+        """
+        frame = self._get_frame()
+        rect = frame.get_rect(center=self.config.question_position)
+        screen.blit(frame, rect, special_flags=pygame.BLEND_PREMULTIPLIED)
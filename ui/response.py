@@ -1,27 +1,38 @@
 import pygame
-import os
-from typing import Optional
-from utils.image import create_squared_image
-from config import *
+from typing import Dict, Optional, Tuple
+from utils.image import premultiply
+from config import BLANC
+from utils.fonts import get_font
+from core.assets import AssetCache
+from core.config import SimulationConfig
 import math
 
 class Response:
     """Gestionnaire de l'affichage des réponses."""
+
+    ZOOM_LEVELS = 24  # Nombre d'échelles pré-calculées pour le zoom pulsé
     
-    def __init__(self, width: int, height: int):
+    def __init__(self, config: SimulationConfig, assets: AssetCache):
         """
         Initialise l'affichage des réponses.
         
         Args:
-            width (int): Largeur de l'écran
-            height (int): Hauteur de l'écran
+            config (SimulationConfig): Configuration de la simulation
+            assets (AssetCache): Cache des ressources partagées
         """
-        self.width = width
-        self.height = height
+        self.config = config
+        self.assets = assets
+        self.width = config.width
+        self.height = config.height
         self.zoom_time = 0
         self.reponse = None
-        self.font = pygame.font.SysFont("Poppins", REPONSE_FONT_SIZE, bold=True)
+        self.font = get_font(config.reponse_font_size, bold=True)
         self._load_response_images()
+
+        # Image de la réponse (texte + illustration), construite par set_response
+        self.overlay: Optional[pygame.Surface] = None
+        self.overlay_anchor: Tuple[int, int] = (0, 0)  # Centre du texte dans l'image
+        self.zoom_frames: Dict[int, Tuple[pygame.Surface, Tuple[int, int]]] = {}
     
     def _load_response_images(self):
         """Charge les images des réponses."""
@@ -29,39 +40,24 @@ class Response:
         self.reponse_a_img = None
         self.reponse_b_img = None
         
-        if REPONSE_A_IMAGE_PATH:
+        image_a_path = self.config.reponse_a_image_path
+        image_b_path = self.config.reponse_b_image_path
+        
+        if image_a_path:
             try:
-                self.reponse_a_img = create_squared_image(REPONSE_A_IMAGE_PATH, imgSize, is_circular=REPONSE_CIRCLE)
+                self.reponse_a_img = self.assets.squared_image(image_a_path, imgSize, is_circular=self.config.reponse_circle)
             except Exception as e:
-                print(f"Impossible de charger l'image de la réponse A : {REPONSE_A_IMAGE_PATH}")
+                print(f"Impossible de charger l'image de la réponse A : {image_a_path}")
                 print(f"Erreur : {str(e)}")
                 
-        if REPONSE_B_IMAGE_PATH:
+        if image_b_path:
             try:
-                self.reponse_b_img = create_squared_image(REPONSE_B_IMAGE_PATH, imgSize, is_circular=REPONSE_CIRCLE)
+                self.reponse_b_img = self.assets.squared_image(image_b_path, imgSize, is_circular=self.config.reponse_circle)
             except Exception as e:
-                print(f"Impossible de charger l'image de la réponse B : {REPONSE_B_IMAGE_PATH}")
+                print(f"Impossible de charger l'image de la réponse B : {image_b_path}")
                 print(f"Erreur : {str(e)}")
 
     
-    def load_response_image(image_path: str, size: int) -> Optional[pygame.Surface]:
-        """
-        Charge et prépare une image de réponse.
-        
-        Args:
-            image_path (str): Chemin vers l'image
-            size (int): Taille souhaitée de l'image
-            
-        Returns:
-            Optional[pygame.Surface]: Surface pygame avec l'image chargée, ou None si erreur
-        """
-        try:
-            return create_squared_image(image_path, size, is_circular=VISUAL)
-        except Exception as e:
-            print(f"Erreur lors du chargement de l'image de réponse {image_path}: {str(e)}")
-            return None
-
-    
     def update(self, dt: float):
         """
         Met à jour l'animation de la réponse.
@@ -69,7 +65,7 @@ class Response:
         Args:
             dt (float): Pas de temps
         """
-        self.zoom_time += dt * REPONSE_ZOOM_SPEED
+        self.zoom_time += dt * self.config.reponse_zoom_speed
     
     def set_response(self, reponse: str):
         """
@@ -79,6 +75,69 @@ class Response:
             reponse (str): La réponse à afficher
         """
         self.reponse = reponse
+        self.zoom_frames.clear()
+        self.overlay = self._build_overlay(reponse) if reponse else None
+
+    def _build_overlay(self, reponse: str) -> pygame.Surface:
+        """
+        Compose le texte de la réponse et son image dans une seule surface.
+
+        La surface est en alpha prémultiplié (voir `utils.image.premultiply`).
+
+        Args:
+            reponse (str): La réponse à afficher
+
+        Returns:
+            pygame.Surface: L'image de la réponse
+        """
+        reponse_text = self.font.render(reponse, True, BLANC)
+
+        # Image sous la réponse si elle existe
+        img = None
+        if reponse == self.config.reponse_a:
+            img = self.reponse_a_img
+        elif reponse == self.config.reponse_b:
+            img = self.reponse_b_img
+
+        text_width, text_height = reponse_text.get_size()
+        width = max(text_width, img.get_width() if img else 0)
+        height = text_height + (20 + img.get_height() if img else 0)
+
+        overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        overlay.blit(premultiply(reponse_text), (width // 2 - text_width // 2, 0), special_flags=pygame.BLEND_PREMULTIPLIED)
+        if img:
+            overlay.blit(premultiply(img), (width // 2 - img.get_width() // 2, text_height + 20), special_flags=pygame.BLEND_PREMULTIPLIED)
+
+        self.overlay_anchor = (width // 2, text_height // 2)
+        return overlay
+
+    def _get_zoom_frame(self, zoom_scale: float) -> Tuple[pygame.Surface, Tuple[int, int]]:
+        """
+        Retourne l'image de la réponse à l'échelle la plus proche parmi
+        ZOOM_LEVELS échelles, calculée au premier usage.
+
+        Args:
+            zoom_scale (float): Échelle souhaitée
+
+        Returns:
+            Tuple[pygame.Surface, Tuple[int, int]]: L'image et la position du centre du texte
+        """
+        zoom_min, zoom_max = self.config.reponse_zoom_min, self.config.reponse_zoom_max
+        if zoom_max == zoom_min:
+            level, scale = 0, zoom_min
+        else:
+            level = round((zoom_scale - zoom_min) / (zoom_max - zoom_min) * (self.ZOOM_LEVELS - 1))
+            scale = zoom_min + (zoom_max - zoom_min) * level / (self.ZOOM_LEVELS - 1)
+
+        if level not in self.zoom_frames:
+            if scale == 1.0:
+                self.zoom_frames[level] = (self.overlay, self.overlay_anchor)
+            else:
+                width, height = self.overlay.get_size()
+                frame = pygame.transform.smoothscale(self.overlay, (int(width * scale), int(height * scale)))
+                anchor = (int(self.overlay_anchor[0] * scale), int(self.overlay_anchor[1] * scale))
+                self.zoom_frames[level] = (frame, anchor)
+        return self.zoom_frames[level]
     
     def draw(self, screen: pygame.Surface):
         """
@@ -87,26 +146,17 @@ class Response:
         Args:
             screen (pygame.Surface): Surface de l'écran
         """
-        if self.reponse:
+        if self.overlay is None:
+            return
+
+        frame, anchor = self.overlay, self.overlay_anchor
+        if self.config.reponse_zoom:
             # Calcul de l'échelle de zoom
-            zoom_scale = REPONSE_ZOOM_MIN + (REPONSE_ZOOM_MAX - REPONSE_ZOOM_MIN) * (
-                1 - math.cos(self.zoom_time * REPONSE_ZOOM_SPEED)
+            zoom_min, zoom_max = self.config.reponse_zoom_min, self.config.reponse_zoom_max
+            zoom_scale = zoom_min + (zoom_max - zoom_min) * (
+                1 - math.cos(self.zoom_time * self.config.reponse_zoom_speed)
             ) / 2
+            frame, anchor = self._get_zoom_frame(zoom_scale)
 
-            # Création du texte de réponse
-            reponse_text = self.font.render(self.reponse, True, BLANC)
-            reponse_rect = reponse_text.get_rect(center=REPONSE_POSITION)
-
-            # Dessiner le texte avec l'effet de zoom
-            screen.blit(reponse_text, reponse_rect)
-
-            # Afficher l'image sous la réponse si elle existe
-            img = None
-            if self.reponse == REPONSE_A and self.reponse_a_img:
-                img = self.reponse_a_img
-            elif self.reponse == REPONSE_B and self.reponse_b_img:
-                img = self.reponse_b_img
-                
-            if img:
-                img_rect = img.get_rect(midtop=(REPONSE_POSITION[0], reponse_rect.bottom + 20))
-                screen.blit(img, img_rect) 
\ No newline at end of file
+        x, y = self.config.reponse_position
+        screen.blit(frame, (x - anchor[0], y - anchor[1]), special_flags=pygame.BLEND_PREMULTIPLIED) 
\ No newline at end of file
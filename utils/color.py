@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 from typing import Tuple, List
 
 def create_gradient_surface(
@@ -10,39 +11,41 @@ def create_gradient_surface(
 ) -> pygame.Surface:
     """
     Crée une surface avec un dégradé de couleurs.
-    
+
     Args:
         width (int): Largeur de la surface
         height (int): Hauteur de la surface
         start_color (Tuple[int, int, int]): Couleur de départ (R, G, B)
         end_color (Tuple[int, int, int]): Couleur de fin (R, G, B)
         direction (str): Direction du dégradé ("diagonal", "horizontal", "vertical")
-        
+
     Returns:
         pygame.Surface: Surface avec le dégradé
     """
+    width, height = int(width), int(height)
     gradient_surface = pygame.Surface((width, height))
-    
-    for y in range(height):
-        for x in range(width):
-            if direction == "diagonal":
-                # Dégradé diagonal (coin supérieur gauche vers coin inférieur droit)
-                distance = (x + y) / (width + height)
-            elif direction == "horizontal":
-                # Dégradé horizontal (gauche vers droite)
-                distance = x / width
-            elif direction == "vertical":
-                # Dégradé vertical (haut vers bas)
-                distance = y / height
-            else:
-                raise ValueError("Direction invalide. Utilisez 'diagonal', 'horizontal' ou 'vertical'")
-            
-            # Calculer la couleur interpolée
-            color = tuple(
-                int(start_color[j] + (end_color[j] - start_color[j]) * distance)
-                for j in range(3)
-            )
-            
-            gradient_surface.set_at((x, y), color)
-    
-    return gradient_surface 
\ No newline at end of file
+
+    # Grille des coordonnées, indexée comme surfarray : [x, y]
+    x = np.arange(width, dtype=np.float64)[:, None]
+    y = np.arange(height, dtype=np.float64)[None, :]
+
+    if direction == "diagonal":
+        # Dégradé diagonal (coin supérieur gauche vers coin inférieur droit)
+        distance = (x + y) / (width + height)
+    elif direction == "horizontal":
+        # Dégradé horizontal (gauche vers droite)
+        distance = np.broadcast_to(x / width, (width, height))
+    elif direction == "vertical":
+        # Dégradé vertical (haut vers bas)
+        distance = np.broadcast_to(y / height, (width, height))
+    else:
+        raise ValueError("Direction invalide. Utilisez 'diagonal', 'horizontal' ou 'vertical'")
+
+    # Calculer la couleur interpolée pour tous les pixels d'un coup
+    pixels = np.empty((width, height, 3), dtype=np.uint8)
+    for j in range(3):
+        pixels[:, :, j] = (start_color[j] + (end_color[j] - start_color[j]) * distance).astype(np.int64)
+
+    pygame.surfarray.blit_array(gradient_surface, pixels)
+
+    return gradient_surface
@@ -0,0 +1,52 @@
+import os
+import pygame
+from typing import Dict, Tuple
+
+# Polices livrées avec le projet : assets/fonts/{famille}/{famille}-{style}.ttf
+FONTS_DIR = os.path.join("assets", "fonts")
+DEFAULT_FAMILY = "Poppins"
+
+_fonts: Dict[Tuple[str, int, bool], pygame.font.Font] = {}
+
+
+def font_path(family: str = DEFAULT_FAMILY, bold: bool = False) -> str:
+    """
+    Retourne le chemin du fichier TTF d'une police du projet.
+
+    Args:
+        family (str): Famille de la police (dossier dans assets/fonts)
+        bold (bool): Graisse grasse au lieu de normale
+
+    Returns:
+        str: Chemin du fichier TTF
+    """
+    style = "Bold" if bold else "Regular"
+    return os.path.join(FONTS_DIR, family, f"{family}-{style}.ttf")
+
+
+def get_font(size: int, bold: bool = False, family: str = DEFAULT_FAMILY) -> pygame.font.Font:
+    """
+    Retourne une police du projet, chargée depuis son fichier au premier appel.
+
+    Contrairement à `pygame.font.SysFont`, aucune recherche dans les polices du
+    système : le rendu est identique sur toutes les machines.
+
+    Args:
+        size (int): Taille de la police
+        bold (bool): Graisse grasse au lieu de normale
+        family (str): Famille de la police
+
+    Returns:
+        pygame.font.Font: La police (partagée, ne pas modifier son style)
+    """
+    key = (family, int(size), bold)
+    if key not in _fonts:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        path = font_path(family, bold)
+        try:
+            _fonts[key] = pygame.font.Font(path, int(size))
+        except (OSError, FileNotFoundError) as e:
+            print(f"Erreur lors du chargement de la police {path}: {e}")
+            _fonts[key] = pygame.font.Font(None, int(size))
+    return _fonts[key]
@@ -170,4 +170,19 @@ def create_squared_image(
         
     except Exception as e:
         print(f"Erreur lors de la création de l'image de cuve {image_path}: {str(e)}")
-        return None 
\ No newline at end of file
+        return None
+
+def premultiply(surface: pygame.Surface) -> pygame.Surface:
+    """
+    Retourne une copie de la surface en alpha prémultiplié, à dessiner avec
+    `pygame.BLEND_PREMULTIPLIED`.
+
+    Args:
+        surface (pygame.Surface): Surface avec transparence
+
+    Returns:
+        pygame.Surface: Copie prémultipliée
+    """
+    # Copie 32 bits compacte : premul_alpha ignore le pas de ligne de certaines
+    # surfaces (texte rendu). Contrairement à convert_alpha, aucun écran n'est requis.
+    return surface.convert(32, pygame.SRCALPHA).premul_alpha()
@@ -0,0 +1,56 @@
+import math
+from typing import Dict, List, Tuple
+
+Point = Tuple[float, float]
+
+
+class SpatialGrid:
+    """
+    Index de points par grille uniforme.
+
+    Chaque point est rangé dans la case de côté `cell_size` qui le contient :
+    chercher un voisin à moins de `cell_size` ne parcourt que les 9 cases
+    autour de la position, quel que soit le nombre total de points.
+    """
+
+    def __init__(self, cell_size: float):
+        """
+        Args:
+            cell_size (float): Côté d'une case, au moins égal à la plus grande distance recherchée
+        """
+        self.cell_size = cell_size
+        self.cells: Dict[Tuple[int, int], List[Point]] = {}
+        self.count = 0
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return int(math.floor(x / self.cell_size)), int(math.floor(y / self.cell_size))
+
+    def add(self, x: float, y: float) -> None:
+        """Ajoute un point à l'index."""
+        self.cells.setdefault(self._cell(x, y), []).append((x, y))
+        self.count += 1
+
+    def has_point_within(self, x: float, y: float, distance: float) -> bool:
+        """
+        Indique si un point de l'index est à moins de `distance` de (x, y).
+
+        Args:
+            x (float): Abscisse de la position
+            y (float): Ordonnée de la position
+            distance (float): Distance minimale, au plus `cell_size`
+
+        Returns:
+            bool: True si un point est strictement plus proche que `distance`
+        """
+        cell_x, cell_y = self._cell(x, y)
+        for neighbour_x in (cell_x - 1, cell_x, cell_x + 1):
+            for neighbour_y in (cell_y - 1, cell_y, cell_y + 1):
+                for point_x, point_y in self.cells.get((neighbour_x, neighbour_y), ()):
+                    dx = x - point_x
+                    dy = y - point_y
+                    if math.sqrt(dx*dx + dy*dy) < distance:
+                        return True
+        return False
+
+    def __len__(self) -> int:
+        return self.count
@@ -1,45 +1,64 @@
 import pygame
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
-def render_multiline_text(
-    text: str,
-    font: pygame.font.Font,
-    color: tuple,
-    max_width: int
-) -> List[pygame.Surface]:
+@lru_cache(maxsize=256)
+def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> Tuple[str, ...]:
     """
-    Rend un texte sur plusieurs lignes en respectant une largeur maximale.
-    
+    Découpe un texte en lignes qui tiennent dans une largeur maximale.
+
+    Les lignes sont mesurées avec `font.size`, sans rendu, et le résultat
+    est mis en cache.
+
     Args:
-        text (str): Le texte à afficher
+        text (str): Le texte à découper
         font (pygame.font.Font): La police à utiliser
-        color (tuple): La couleur du texte (R, G, B)
-        max_width (int): La largeur maximale du texte
-        
+        max_width (int): La largeur maximale d'une ligne
+
     Returns:
-        List[pygame.Surface]: Liste des surfaces de texte
+        Tuple[str, ...]: Les lignes
     """
     words = text.split(' ')
     lines = []
     current_line = []
-    
+
     for word in words:
         test_line = ' '.join(current_line + [word])
-        test_surface = font.render(test_line, True, color)
-        if test_surface.get_width() <= max_width:
+        if font.size(test_line)[0] <= max_width:
             current_line.append(word)
         else:
             if current_line:
                 lines.append(' '.join(current_line))
             current_line = [word]
-    
+
     if current_line:
         lines.append(' '.join(current_line))
-    
-    # Créer les surfaces pour chaque ligne
-    surfaces = []
-    for line in lines:
-        surface = font.render(line, True, color)
-        surfaces.append(surface)
-    
-    return surfaces 
\ No newline at end of file
+
+    return tuple(lines)
+
+@lru_cache(maxsize=256)
+def _render_lines(text: str, font: pygame.font.Font, color: tuple, max_width: int) -> Tuple[pygame.Surface, ...]:
+    return tuple(font.render(line, True, color) for line in wrap_text(text, font, max_width))
+
+def render_multiline_text(
+    text: str,
+    font: pygame.font.Font,
+    color: tuple,
+    max_width: int
+) -> List[pygame.Surface]:
+    """
+    Rend un texte sur plusieurs lignes en respectant une largeur maximale.
+
+    Le rendu est mis en cache par (texte, police, couleur, largeur) : les
+    surfaces retournées sont partagées et ne doivent pas être modifiées.
+
+    Args:
+        text (str): Le texte à afficher
+        font (pygame.font.Font): La police à utiliser
+        color (tuple): La couleur du texte (R, G, B)
+        max_width (int): La largeur maximale du texte
+
+    Returns:
+        List[pygame.Surface]: Liste des surfaces de texte
+    """
+    return list(_render_lines(text, font, tuple(color), max_width))
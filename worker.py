@@ -0,0 +1,81 @@
+import os
+import sys
+import json
+import argparse
+
+# Le worker ne dessine jamais dans une vraie fenêtre
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+DEFAULT_SOCKET = "/tmp/nostradaballs.sock"
+
+
+def serve(args):
+    from core.cache import RenderCache
+    from core.worker import RenderWorker
+
+    worker = RenderWorker(cache=None if args.no_cache else RenderCache(args.cache_dir))
+    worker.warm_up()
+    if args.spool:
+        worker.serve_spool(args.spool, args.poll_interval)
+    else:
+        worker.serve_socket(args.socket)
+
+
+def submit(args):
+    from core.jobs import parse_overrides
+    from core.worker import submit_job
+
+    if args.job:
+        with open(args.job) as f:
+            request = json.load(f)
+    else:
+        request = {'config': {}}
+    if args.id:
+        request['id'] = args.id
+    if args.theme:
+        request.setdefault('config', {})['theme'] = args.theme
+    request.setdefault('config', {}).update(parse_overrides(args.set))
+
+    result = submit_job(args.socket, request)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    return 1 if result.get('error') else 0
+
+
+def stop(args):
+    from core.worker import submit_job
+
+    print(json.dumps(submit_job(args.socket, {'command': 'shutdown'})))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Worker de rendu persistant")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve_parser = subparsers.add_parser('serve', help="Démarre le worker")
+    serve_parser.add_argument('--socket', default=DEFAULT_SOCKET, help="Socket Unix d'écoute")
+    serve_parser.add_argument('--spool', help="Dossier de spool à surveiller au lieu du socket")
+    serve_parser.add_argument('--poll-interval', type=float, default=1.0)
+    serve_parser.add_argument('--cache-dir', default=os.path.join("output", "cache"), help="Dossier du cache des rendus")
+    serve_parser.add_argument('--no-cache', action='store_true', help="Toujours tout rendre")
+    serve_parser.set_defaults(func=serve)
+
+    submit_parser = subparsers.add_parser('submit', help="Envoie un job au worker")
+    submit_parser.add_argument('--socket', default=DEFAULT_SOCKET)
+    submit_parser.add_argument('--job', help="Fichier JSON du job")
+    submit_parser.add_argument('--id', help="Identifiant du job")
+    submit_parser.add_argument('--theme', help="Thème à rendre")
+    submit_parser.add_argument('--set', action='append', default=[], metavar='CHAMP=VALEUR',
+                               help="Valeur de configuration (ex: question=\"...\", temps_limite=30)")
+    submit_parser.set_defaults(func=submit)
+
+    stop_parser = subparsers.add_parser('stop', help="Arrête le worker")
+    stop_parser.add_argument('--socket', default=DEFAULT_SOCKET)
+    stop_parser.set_defaults(func=stop)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args) or 0)
+
+
+if __name__ == "__main__":
+    main()